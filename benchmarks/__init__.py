@@ -0,0 +1 @@
+"""Vremenar API benchmarks."""
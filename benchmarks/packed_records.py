@@ -0,0 +1,64 @@
+"""Benchmark packed weather records against hashes.
+
+Reads the weather map records of the test fixtures, which are stored both as
+hashes and packed. Requires a Redis database with the test fixtures, for example
+
+    VREMENAR_DATABASE=test uv run tests/fixtures/setup_fixtures.py
+    VREMENAR_DATABASE=test uv run benchmarks/packed_records.py
+"""
+
+from __future__ import annotations
+
+from asyncio import run
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from vremenar.sources.arso.utils import get_weather_records_for_timestamp
+from vremenar.sources.dwd.utils import get_mosmix_records
+from vremenar.utils import to_timestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+ITERATIONS = 1000
+
+
+async def measure(
+    name: str,
+    function: Callable[[bool], Awaitable[Any]],
+    iterations: int = ITERATIONS,
+) -> None:
+    """Measure average duration of reading hashes and packed records."""
+    durations: dict[bool, float] = {}
+    for packed in (False, True):
+        await function(packed)
+        start = perf_counter()
+        for _ in range(iterations):
+            await function(packed)
+        durations[packed] = (perf_counter() - start) / iterations * 1000
+
+    print(  # ruff: ignore[print]
+        f"{name:<24} hashes {durations[False]:8.3f} ms"
+        f"   packed {durations[True]:8.3f} ms"
+        f"   speedup {durations[False] / durations[True]:5.2f}x",
+    )
+
+
+async def main() -> None:
+    """Run benchmarks."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    await measure(
+        "dwd mosmix map",
+        lambda packed: get_mosmix_records(timestamp, packed=packed),
+    )
+    await measure(
+        "arso weather map",
+        lambda packed: get_weather_records_for_timestamp("current", packed=packed),
+    )
+
+
+if __name__ == "__main__":
+    run(main())
@@ -0,0 +1,101 @@
+"""Benchmark model projections against validating model dumps.
+
+Projects synthetic DWD-sized station lists and alert areas the way API
+responses do, without Redis, for example
+
+    uv run benchmarks/projections.py
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from vremenar.models.alerts import AlertArea, AlertAreaWithPolygon
+from vremenar.models.common import Coordinate
+from vremenar.models.stations import StationBase, StationInfo, StationInfoExtended
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+ITERATIONS = 20
+STATIONS = 5000
+AREAS = 400
+POLYGON_POINTS = 500
+
+
+def measure(
+    name: str,
+    models: Sequence[Any],
+    validated: Callable[[Any], object],
+    projected: Callable[[Any], object],
+) -> None:
+    """Measure average duration of validated and projected models."""
+    durations: list[float] = []
+    for function in (validated, projected):
+        start = perf_counter()
+        for _ in range(ITERATIONS):
+            for model in models:
+                function(model)
+        durations.append((perf_counter() - start) / ITERATIONS * 1000)
+
+    print(  # ruff: ignore[print]
+        f"{name:<24} validate {durations[0]:8.3f} ms"
+        f"   project {durations[1]:8.3f} ms"
+        f"   speedup {durations[0] / durations[1]:5.2f}x",
+    )
+
+
+def main() -> None:
+    """Run benchmarks."""
+    stations = [
+        StationInfoExtended(
+            id=f"{station:05d}",
+            name=f"Station {station}",
+            coordinate=Coordinate(
+                latitude=47 + station % 100 / 10,
+                longitude=6 + station % 90 / 10,
+                altitude=station % 1000,
+            ),
+            zoom_level=7.5,
+            forecast_only=bool(station % 2),
+            metadata={"status": "1"},
+        )
+        for station in range(STATIONS)
+    ]
+    areas = [
+        AlertAreaWithPolygon(
+            id=f"DE{area:03d}",
+            name=f"Area {area}",
+            polygons=[
+                [
+                    [6 + point / 100, 47 + point / 100]
+                    for point in range(POLYGON_POINTS)
+                ],
+            ],
+        )
+        for area in range(AREAS)
+    ]
+
+    measure(
+        "station info",
+        stations,
+        lambda s: StationInfo.model_validate(s.model_dump(exclude={"metadata"})),
+        lambda s: s.info(),
+    )
+    measure(
+        "station base",
+        stations,
+        lambda s: StationBase.model_validate(s.model_dump(include={"id"})),
+        lambda s: s.base(),
+    )
+    measure(
+        "alert area base",
+        areas,
+        lambda a: AlertArea.model_validate(a.model_dump(exclude={"polyons"})),
+        lambda a: a.base(),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark Redis Lua scripts against the pipelined fallback.
+
+Requires a Redis database with the test fixtures, for example
+
+    VREMENAR_DATABASE=test uv run tests/fixtures/setup_fixtures.py
+    VREMENAR_DATABASE=test uv run benchmarks/redis_scripts.py
+"""
+
+from __future__ import annotations
+
+from asyncio import run
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from vremenar.definitions import CountryID, LanguageID
+from vremenar.sources.arso.utils import get_weather_records_for_timestamp
+from vremenar.sources.dwd.utils import (
+    get_mosmix_records,
+    get_mosmix_records_for_station,
+)
+from vremenar.sources.meteoalarm.alerts import list_alerts_for_areas
+from vremenar.utils import to_timestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+ITERATIONS = 1000
+
+
+async def measure(
+    name: str,
+    function: Callable[[bool], Awaitable[Any]],
+    iterations: int = ITERATIONS,
+) -> None:
+    """Measure average duration with and without scripts."""
+    durations: dict[bool, float] = {}
+    for scripts in (False, True):
+        await function(scripts)
+        start = perf_counter()
+        for _ in range(iterations):
+            await function(scripts)
+        durations[scripts] = (perf_counter() - start) / iterations * 1000
+
+    print(  # ruff: ignore[print]
+        f"{name:<24} fallback {durations[False]:8.3f} ms"
+        f"   script {durations[True]:8.3f} ms"
+        f"   speedup {durations[False] / durations[True]:5.2f}x",
+    )
+
+
+async def main() -> None:
+    """Run benchmarks."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    await measure(
+        "dwd mosmix map",
+        lambda scripts: get_mosmix_records(timestamp, scripts=scripts),
+    )
+    await measure(
+        "arso weather map",
+        lambda scripts: get_weather_records_for_timestamp(timestamp, scripts=scripts),
+    )
+    await measure(
+        "dwd station forecast",
+        lambda scripts: get_mosmix_records_for_station(
+            "10147",
+            timestamp,
+            scripts=scripts,
+        ),
+    )
+    await measure(
+        "alerts for areas",
+        lambda scripts: list_alerts_for_areas(
+            CountryID.Germany,
+            LanguageID.English,
+            {"DE048", "DE413"},
+            scripts=scripts,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    run(main())
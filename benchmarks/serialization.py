@@ -0,0 +1,70 @@
+"""Benchmark binary response formats against JSON.
+
+Compares serialized size and encode time of large responses in the available
+formats, with the `binary` extra installed. Requires a Redis database with
+the test fixtures, for example
+
+    VREMENAR_DATABASE=test uv run tests/fixtures/setup_fixtures.py
+    VREMENAR_DATABASE=test uv run --extra binary benchmarks/serialization.py
+"""
+
+from __future__ import annotations
+
+from asyncio import run
+from time import perf_counter
+from typing import Any
+
+from vremenar.api.responses import JSON, Payload, formats, serialize
+from vremenar.definitions import CountryID
+from vremenar.models.alerts import AlertAreaWithPolygon
+from vremenar.models.weather import WeatherInfo
+from vremenar.sources import get_weather_map, list_alert_areas
+
+ITERATIONS = 200
+
+
+def measure(name: str, data: object, data_type: type[Any]) -> None:
+    """Measure size and average encode time of all formats."""
+    payload = Payload.serialize(data, data_type)
+    json_size = len(payload.content)
+
+    for media_type in (JSON, *formats):
+        start = perf_counter()
+        for _ in range(ITERATIONS):
+            content = serialize(data, data_type, media_type)
+        duration = (perf_counter() - start) / ITERATIONS * 1000
+
+        # binary formats of cached payloads are encoded from decoded JSON
+        start = perf_counter()
+        for _ in range(ITERATIONS):
+            Payload(payload.content).body(media_type)
+        cached = (perf_counter() - start) / ITERATIONS * 1000
+
+        print(  # ruff: ignore[print]
+            f"{name:<24} {media_type.removeprefix('application/'):<8}"
+            f" {len(content) / 1024:8.1f} KiB ({len(content) / json_size:4.0%})"
+            f"   encode {duration:8.3f} ms   cached {cached:8.3f} ms",
+        )
+
+
+async def main() -> None:
+    """Run benchmarks."""
+    if not formats:
+        print("No binary formats available, install the binary extra")  # ruff: ignore[print]
+
+    measure(
+        "alert areas",
+        await list_alert_areas(CountryID.Germany),
+        list[AlertAreaWithPolygon],
+    )
+    for country in (CountryID.Slovenia, CountryID.Germany):
+        weather_map = await get_weather_map(country, "current")
+        measure(
+            f"{country} weather map",
+            [condition.base() for condition in weather_map],
+            list[WeatherInfo],
+        )
+
+
+if __name__ == "__main__":
+    run(main())
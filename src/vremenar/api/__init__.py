@@ -2,6 +2,7 @@
 
 from .alerts import router as alerts
 from .copyright import router as copyright  # ruff: ignore[builtin-import-shadowing]
+from .health import router as health
 from .maps import router as maps
 from .stations import router as stations
 from .version import router as version
@@ -9,6 +10,7 @@ from .version import router as version
 __all__ = [
     "alerts",
     "copyright",
+    "health",
     "maps",
     "stations",
     "version",
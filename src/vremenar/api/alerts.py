@@ -2,27 +2,55 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query, Response
+from fastapi.responses import StreamingResponse
 
+from vremenar.cache import cached
+from vremenar.database.invalidation import invalidation
 from vremenar.definitions import CountryID, LanguageID
 from vremenar.models.alerts import AlertAreaWithPolygon, AlertInfo
-from vremenar.sources import list_alert_areas, list_alerts, list_alerts_for_critera
+from vremenar.sources import list_alert_areas, list_alerts, render_alerts_for_critera
+from vremenar.sources.meteoalarm.alerts import (
+    ALERTS_AREAS_TTL,
+    list_areas_for_critera,
+)
+from vremenar.sources.meteoalarm.stream import alerts_stream
 
 from .config import defaults
+from .responses import ContentHeaders, Payload, binary_responses
 
 router = APIRouter()
 
 
+@cached("alerts_areas_payloads", ttl=ALERTS_AREAS_TTL)
+async def areas_list_payload(country: CountryID) -> Payload:
+    """Build serialized and compressed weather alert areas list."""
+    payload = Payload.serialize(
+        await list_alert_areas(country),
+        list[AlertAreaWithPolygon],
+    )
+    return await payload.precompress()
+
+
+invalidation.register_cache("alerts", areas_list_payload)
+
+
 @router.get(
     "/alerts/areas",
     tags=["alerts"],
     name="List weather alert areas",
     response_description="List of weather alert areas for a country",
+    response_model=list[AlertAreaWithPolygon],
+    responses=binary_responses,
     **defaults,
 )
-async def areas_list(country: CountryID) -> list[AlertAreaWithPolygon]:
+async def areas_list(
+    country: CountryID,
+    headers: Annotated[ContentHeaders, Header()],
+) -> Response:
     """List weather alert areas for a country."""
-    return await list_alert_areas(country)
+    payload = await areas_list_payload(country)
+    return payload.response(headers)
 
 
 @router.get(
@@ -30,16 +58,20 @@ async def areas_list(country: CountryID) -> list[AlertAreaWithPolygon]:
     tags=["alerts"],
     name="List weather alerts",
     response_description="List of weather alerts",
+    response_model=list[AlertInfo],
+    responses=binary_responses,
     **defaults,
 )
 async def alerts_list(
     country: CountryID,
+    headers: Annotated[ContentHeaders, Header()],
     language: LanguageID = LanguageID.English,
     station: Annotated[list[str] | None, Query()] = None,
     area: Annotated[list[str] | None, Query()] = None,
-) -> list[AlertInfo]:
+) -> Response:
     """List weather alerts for the criteria."""
-    return await list_alerts_for_critera(country, language, station, area)
+    content = await render_alerts_for_critera(country, language, station, area)
+    return Payload(content).response(headers)
 
 
 @router.get(
@@ -55,3 +87,35 @@ async def alerts_full_list(
 ) -> list[AlertInfo]:
     """List weather alerts for a country."""
     return await list_alerts(country, language)
+
+
+@router.get(
+    "/alerts/stream",
+    tags=["alerts"],
+    name="Stream weather alert changes",
+    response_description="Server-sent events of weather alert changes",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": (
+                "Active alerts are sent as `added` events on connect, followed "
+                "by `added`, `updated` and `expired` events as alerts change"
+            ),
+        },
+    },
+)
+async def alerts_stream_events(
+    country: CountryID,
+    language: LanguageID = LanguageID.English,
+    station: Annotated[list[str] | None, Query()] = None,
+    area: Annotated[list[str] | None, Query()] = None,
+) -> StreamingResponse:
+    """Stream weather alert changes for the criteria."""
+    areas = await list_areas_for_critera(country, station, area)
+    subscriber = await alerts_stream.subscribe(country, language, areas)
+    return StreamingResponse(
+        alerts_stream.events_for(subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,12 +1,17 @@
 """Copyright API."""
 
-from fastapi import APIRouter
+from functools import cache
+from typing import Annotated
+
+from fastapi import APIRouter, Header, Response
 from pydantic import BaseModel, ConfigDict
 
 from vremenar.definitions import CountryID
 from vremenar.sources.arso import ARSO_NAME, ARSO_URL
 from vremenar.sources.dwd import DWD_NAME, DWD_URL
 
+from .responses import ContentHeaders, Payload, binary_responses
+
 router = APIRouter()
 
 
@@ -29,19 +34,32 @@ class CopyrightInfo(BaseModel):
     )
 
 
+@cache
+def copyright_payload() -> Payload:
+    """Build serialized data copyright."""
+    return Payload.serialize(
+        {
+            CountryID.Slovenia: [
+                CopyrightInfo(provider=ARSO_NAME, url=ARSO_URL),
+            ],
+            CountryID.Germany: [
+                CopyrightInfo(provider=DWD_NAME, url=DWD_URL),
+            ],
+            CountryID.Global: [],
+        },
+        dict[str, list[CopyrightInfo]],
+    )
+
+
 @router.get(
     "/copyright",
     tags=["copyright"],
     response_description="Get data copyright",
+    response_model=dict[str, list[CopyrightInfo]],
+    responses=binary_responses,
 )
-async def copyright() -> dict[str, list[CopyrightInfo]]:  # ruff: ignore[builtin-variable-shadowing]
+async def copyright(  # ruff: ignore[builtin-variable-shadowing]
+    headers: Annotated[ContentHeaders, Header()],
+) -> Response:
     """Get data copyright."""
-    return {
-        CountryID.Slovenia: [
-            CopyrightInfo(provider=ARSO_NAME, url=ARSO_URL),
-        ],
-        CountryID.Germany: [
-            CopyrightInfo(provider=DWD_NAME, url=DWD_URL),
-        ],
-        CountryID.Global: [],
-    }
+    return copyright_payload().response(headers)
@@ -0,0 +1,422 @@
+"""Health API."""
+
+from asyncio import timeout
+from os import getenv
+from time import perf_counter
+
+from fastapi import APIRouter, Response, status
+from pydantic import BaseModel, ConfigDict
+from redis.exceptions import RedisError
+
+from vremenar.cache import caches
+from vremenar.database.invalidation import invalidation
+from vremenar.database.near_cache import near_cache
+from vremenar.database.redis import pool, redis
+from vremenar.database.replicas import router as replicas
+from vremenar.shedding import limiters
+from vremenar.sources.meteoalarm.stream import alerts_stream
+from vremenar.warmup import WarmupState, retry_warmup
+from vremenar.warmup import status as warmup_status
+
+router = APIRouter()
+
+REDIS_PING_TIMEOUT: float = float(getenv("VREMENAR_HEALTH_REDIS_TIMEOUT", "1"))
+STALE_THRESHOLD: float = float(getenv("VREMENAR_HEALTH_STALE_THRESHOLD", "7200"))
+
+
+class LivenessInfo(BaseModel):
+    """Liveness info."""
+
+    alive: bool = True
+
+    model_config = ConfigDict(
+        title="Liveness info",
+        json_schema_extra={"examples": [{"alive": True}]},
+    )
+
+
+class PoolInfo(BaseModel):
+    """Redis connection pool info."""
+
+    max_connections: int
+    in_use: int
+    idle: int
+    waits: int
+    wait_average: float
+    wait_max: float
+    exhausted: int
+
+    model_config = ConfigDict(
+        title="Redis connection pool info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "max_connections": 50,
+                    "in_use": 2,
+                    "idle": 6,
+                    "waits": 1520,
+                    "wait_average": 0.012,
+                    "wait_max": 3.4,
+                    "exhausted": 0,
+                },
+            ],
+        },
+    )
+
+
+class ReplicaInfo(BaseModel):
+    """Redis read replica info."""
+
+    name: str
+    available: bool
+    lag: float | None = None
+    reads: int
+    failures: int
+
+    model_config = ConfigDict(
+        title="Redis read replica info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "name": "replica:6379",
+                    "available": True,
+                    "lag": 1,
+                    "reads": 1520,
+                    "failures": 0,
+                },
+            ],
+        },
+    )
+
+
+class NearCacheInfo(BaseModel):
+    """Redis near cache info."""
+
+    size: int
+    entries: int
+    connected: bool
+    hits: int
+    misses: int
+    invalidations: int
+
+    model_config = ConfigDict(
+        title="Redis near cache info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "size": 10000,
+                    "entries": 2410,
+                    "connected": True,
+                    "hits": 152000,
+                    "misses": 2900,
+                    "invalidations": 48,
+                },
+            ],
+        },
+    )
+
+
+class AlertsStreamInfo(BaseModel):
+    """Alerts stream info."""
+
+    connected: bool
+    subscribers: int
+    events: int
+    dropped: int
+    errors: int
+
+    model_config = ConfigDict(
+        title="Alerts stream info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "connected": True,
+                    "subscribers": 1200,
+                    "events": 5400,
+                    "dropped": 3,
+                    "errors": 0,
+                },
+            ],
+        },
+    )
+
+
+class InvalidationInfo(BaseModel):
+    """Cache invalidation bus info."""
+
+    connected: bool
+    events: int
+    resyncs: int
+    errors: int
+
+    model_config = ConfigDict(
+        title="Cache invalidation info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "connected": True,
+                    "events": 340,
+                    "resyncs": 1,
+                    "errors": 0,
+                },
+            ],
+        },
+    )
+
+
+class LimiterInfo(BaseModel):
+    """Route group concurrency limit info."""
+
+    group: str
+    limit: int
+    active: int
+    waiting: int
+    queued: int
+    shed: int
+    delay: float
+
+    model_config = ConfigDict(
+        title="Concurrency limit info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "group": "maps",
+                    "limit": 16,
+                    "active": 12,
+                    "waiting": 0,
+                    "queued": 420,
+                    "shed": 5,
+                    "delay": 3.2,
+                },
+            ],
+        },
+    )
+
+
+class RedisInfo(BaseModel):
+    """Redis health info."""
+
+    available: bool
+    latency: float | None = None
+    pool: PoolInfo
+    replicas: list[ReplicaInfo] = []
+    near_cache: NearCacheInfo
+    invalidation: InvalidationInfo
+
+    model_config = ConfigDict(
+        title="Redis health info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "available": True,
+                    "latency": 0.25,
+                    "pool": {
+                        "max_connections": 50,
+                        "in_use": 2,
+                        "idle": 6,
+                        "waits": 1520,
+                        "wait_average": 0.012,
+                        "wait_max": 3.4,
+                        "exhausted": 0,
+                    },
+                    "near_cache": {
+                        "size": 10000,
+                        "entries": 2410,
+                        "connected": True,
+                        "hits": 152000,
+                        "misses": 2900,
+                        "invalidations": 48,
+                    },
+                    "invalidation": {
+                        "connected": True,
+                        "events": 340,
+                        "resyncs": 1,
+                        "errors": 0,
+                    },
+                },
+            ],
+        },
+    )
+
+
+class CacheInfo(BaseModel):
+    """In-process cache health info."""
+
+    name: str
+    generation: int
+    entries: int
+    evictions: int = 0
+    memory: int | None = None
+    age: float | None = None
+    stale: bool
+    stale_serves: int = 0
+    refreshes: int = 0
+    refresh_average: float | None = None
+    refresh_max: float | None = None
+
+    model_config = ConfigDict(
+        title="Cache health info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "name": "stations",
+                    "generation": 2,
+                    "entries": 2,
+                    "evictions": 0,
+                    "age": 125.4,
+                    "stale": False,
+                    "stale_serves": 0,
+                    "refreshes": 3,
+                    "refresh_average": 42.5,
+                    "refresh_max": 85.3,
+                },
+            ],
+        },
+    )
+
+
+class ReadinessInfo(BaseModel):
+    """Readiness info."""
+
+    ready: bool
+    warmup: WarmupState
+    timings: dict[str, float]
+    redis: RedisInfo
+    caches: list[CacheInfo]
+    alerts_stream: AlertsStreamInfo
+    limits: list[LimiterInfo] = []
+
+    model_config = ConfigDict(
+        title="Readiness info",
+        json_schema_extra={
+            "examples": [
+                {
+                    "ready": True,
+                    "warmup": WarmupState.Done,
+                    "timings": {"stations:si": 1.5, "stations:de": 85.3},
+                    "redis": {
+                        "available": True,
+                        "latency": 0.25,
+                        "pool": {
+                            "max_connections": 50,
+                            "in_use": 2,
+                            "idle": 6,
+                            "waits": 1520,
+                            "wait_average": 0.012,
+                            "wait_max": 3.4,
+                            "exhausted": 0,
+                        },
+                        "near_cache": {
+                            "size": 10000,
+                            "entries": 2410,
+                            "connected": True,
+                            "hits": 152000,
+                            "misses": 2900,
+                            "invalidations": 48,
+                        },
+                        "invalidation": {
+                            "connected": True,
+                            "events": 340,
+                            "resyncs": 1,
+                            "errors": 0,
+                        },
+                    },
+                    "caches": [
+                        {
+                            "name": "stations",
+                            "generation": 2,
+                            "entries": 2,
+                            "age": 125.4,
+                            "stale": False,
+                        },
+                    ],
+                    "alerts_stream": {
+                        "connected": True,
+                        "subscribers": 1200,
+                        "events": 5400,
+                        "dropped": 3,
+                        "errors": 0,
+                    },
+                },
+            ],
+        },
+    )
+
+
+async def redis_latency() -> float | None:
+    """Ping Redis and get the latency in milliseconds."""
+    start = perf_counter()
+    try:
+        async with timeout(REDIS_PING_TIMEOUT):
+            await redis.ping()
+    except (RedisError, TimeoutError):
+        return None
+
+    return round((perf_counter() - start) * 1000, 3)
+
+
+async def redis_health() -> RedisInfo:
+    """Check Redis availability and latency."""
+    latency = await redis_latency()
+    return RedisInfo(
+        available=latency is not None,
+        latency=latency,
+        pool=PoolInfo.model_validate(pool.stats()),
+        replicas=[ReplicaInfo.model_validate(r) for r in replicas.stats()],
+        near_cache=NearCacheInfo.model_validate(near_cache.stats()),
+        invalidation=InvalidationInfo.model_validate(invalidation.stats()),
+    )
+
+
+def caches_health() -> list[CacheInfo]:
+    """Get in-process caches health."""
+    result: list[CacheInfo] = []
+    for cache in caches.values():
+        stats = cache.stats()
+        stale = (stats["age"] or 0) > STALE_THRESHOLD
+        result.append(CacheInfo.model_validate(stats | {"stale": stale}))
+    return result
+
+
+@router.get(
+    "/health/live",
+    tags=["health"],
+    response_description="Get worker liveness",
+)
+async def live() -> LivenessInfo:
+    """Get worker liveness."""
+    return LivenessInfo()
+
+
+@router.get(
+    "/health/ready",
+    tags=["health"],
+    response_description="Get worker readiness",
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessInfo}},
+)
+async def ready(response: Response) -> ReadinessInfo:
+    """Get worker readiness."""
+    redis_info = await redis_health()
+    caches_info = caches_health()
+
+    is_ready = (
+        warmup_status.ready
+        and redis_info.available
+        and not any(cache.stale for cache in caches_info)
+    )
+    if not is_ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    if not warmup_status.ready:
+        retry_warmup()
+
+    return ReadinessInfo(
+        ready=is_ready,
+        warmup=warmup_status.state,
+        timings=warmup_status.timings,
+        redis=redis_info,
+        caches=caches_info,
+        alerts_stream=AlertsStreamInfo.model_validate(alerts_stream.stats()),
+        limits=[
+            LimiterInfo.model_validate(limiter.stats()) for limiter in limiters.values()
+        ],
+    )
@@ -1,8 +1,12 @@
 """Weather map layers API."""
 
-from fastapi import APIRouter
+from functools import cache
+from typing import Annotated
+
+from fastapi import APIRouter, Header, Response
 
 from vremenar.definitions import CountryID
+from vremenar.exceptions import UnsupportedCountryException, UnsupportedMapTypeException
 from vremenar.models.maps import MapLayersList, MapLegend, MapType, SupportedMapType
 from vremenar.sources import (
     get_all_map_legends,
@@ -12,19 +16,61 @@ from vremenar.sources import (
 )
 
 from .config import defaults
+from .responses import ContentHeaders, Payload, binary_responses
 
 router = APIRouter()
 
 
+@cache
+def supported_map_types_payloads() -> dict[CountryID, Payload]:
+    """Build serialized supported map types for all countries."""
+    return {
+        country: Payload.serialize(
+            get_all_supported_map_types(country),
+            list[SupportedMapType],
+        )
+        for country in CountryID
+    }
+
+
+@cache
+def map_legends_payloads() -> dict[tuple[CountryID, MapType | None], Payload]:
+    """Build serialized map legends for all countries and map types.
+
+    The legends for all map types of a country are stored with `None` map type.
+    """
+    payloads: dict[tuple[CountryID, MapType | None], Payload] = {}
+    for country in CountryID:
+        try:
+            legends = get_all_map_legends(country)
+        except UnsupportedCountryException:
+            continue
+        payloads[country, None] = Payload.serialize(legends, list[MapLegend])
+
+        for map_type in MapType:
+            try:
+                legend = get_map_legend(country, map_type)
+            except UnsupportedMapTypeException:
+                continue
+            payloads[country, map_type] = Payload.serialize(legend, MapLegend)
+
+    return payloads
+
+
 @router.get(
     "/maps/types",
     tags=["maps"],
     response_description="Get the supported map types",
+    response_model=list[SupportedMapType],
+    responses=binary_responses,
     **defaults,
 )
-async def supported_map_types(country: CountryID) -> list[SupportedMapType]:
+async def supported_map_types(
+    country: CountryID,
+    headers: Annotated[ContentHeaders, Header()],
+) -> Response:
     """Get all supported map types for a specific country."""
-    return get_all_supported_map_types(country)
+    return supported_map_types_payloads()[country].response(headers)
 
 
 @router.get(
@@ -43,19 +89,42 @@ async def map_layers(country: CountryID, map_type: MapType) -> MapLayersList:
     "/maps/legend",
     tags=["maps"],
     response_description="Get the legend for all map types",
+    response_model=list[MapLegend],
+    responses=binary_responses,
     **defaults,
 )
-async def all_map_legends(country: CountryID) -> list[MapLegend]:
+async def all_map_legends(
+    country: CountryID,
+    headers: Annotated[ContentHeaders, Header()],
+) -> Response:
     """Get all map legends for a specific country."""
-    return get_all_map_legends(country)
+    payload = map_legends_payloads().get((country, None))
+    if payload is None:
+        raise UnsupportedCountryException
+
+    return payload.response(headers)
 
 
 @router.get(
     "/maps/legend/{map_type}",
     tags=["maps"],
     response_description="Get the legend for a map type",
+    response_model=MapLegend,
+    responses=binary_responses,
     **defaults,
 )
-async def map_legend(country: CountryID, map_type: MapType) -> MapLegend:
+async def map_legend(
+    country: CountryID,
+    map_type: MapType,
+    headers: Annotated[ContentHeaders, Header()],
+) -> Response:
     """Get map legends per type for a specific country."""
-    return get_map_legend(country, map_type)
+    payloads = map_legends_payloads()
+    if (country, None) not in payloads:
+        raise UnsupportedCountryException
+
+    payload = payloads.get((country, map_type))
+    if payload is None:
+        raise UnsupportedMapTypeException
+
+    return payload.response(headers)
@@ -0,0 +1,210 @@
+"""Precomputed API responses."""
+
+from __future__ import annotations
+
+from asyncio import to_thread
+from hashlib import blake2b
+from json import loads
+from typing import TYPE_CHECKING, Any
+
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+from vremenar.compression import (
+    COMPRESSION_MINIMUM_SIZE,
+    compress,
+    encoders,
+    negotiate_encoding,
+    parse_qualities,
+)
+from vremenar.utils import optional_module
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+JSON = "application/json"
+
+# binary formats in the order of preference with their serializer,
+# available with the `binary` extra
+formats: dict[str, Callable[[Any], bytes]] = {}
+if (msgpack := optional_module("msgpack")) is not None:
+    formats["application/msgpack"] = msgpack.packb
+if (cbor2 := optional_module("cbor2")) is not None:
+    formats["application/cbor"] = cbor2.dumps
+
+# OpenAPI documentation of the binary formats
+binary_responses: dict[int | str, dict[str, Any]] = {
+    status.HTTP_200_OK: {
+        "content": {
+            "application/msgpack": {},
+            "application/cbor": {},
+        },
+    },
+}
+
+
+class ContentHeaders(BaseModel):
+    """Request headers for conditional requests and content negotiation."""
+
+    if_none_match: str | None = None
+    accept_encoding: str | None = None
+    accept: str | None = None
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Check if an ETag matches the If-None-Match header."""
+    if not if_none_match:
+        return False
+
+    for candidate in if_none_match.split(","):
+        tag = candidate.strip().removeprefix("W/")
+        if tag in {etag, "*"}:
+            return True
+    return False
+
+
+def negotiate_format(accept: str | None) -> str:
+    """Get the preferred available media type accepted by the client.
+
+    Binary formats are only used when preferred over JSON.
+    """
+    if not accept or not formats:
+        return JSON
+
+    qualities = parse_qualities(accept)
+    json_quality = max(
+        qualities.get(JSON, 0),
+        qualities.get("application/*", 0),
+        qualities.get("*/*", 0),
+    )
+    candidates = [
+        (qualities.get(media_type, 0), -position, media_type)
+        for position, media_type in enumerate(formats)
+    ]
+    quality, _, media_type = max(candidates)
+    return media_type if quality > json_quality else JSON
+
+
+adapters: dict[object, TypeAdapter[Any]] = {}
+
+
+def type_adapter(data_type: type[Any]) -> TypeAdapter[Any]:
+    """Get type adapter of a response type."""
+    adapter = adapters.get(data_type)
+    if adapter is None:
+        adapter = adapters[data_type] = TypeAdapter(data_type)
+    return adapter
+
+
+def serialize(data: object, data_type: type[Any], media_type: str = JSON) -> bytes:
+    """Serialize data the same way as API responses."""
+    adapter = type_adapter(data_type)
+    if media_type == JSON:
+        return adapter.dump_json(data, exclude_unset=True, exclude_none=True)
+
+    return formats[media_type](
+        adapter.dump_python(data, mode="json", exclude_unset=True, exclude_none=True),
+    )
+
+
+def model_response(
+    data: object,
+    data_type: type[Any],
+    headers: ContentHeaders,
+) -> Response:
+    """Get response for data serialized in the format accepted by the client."""
+    media_type = negotiate_format(headers.accept)
+    return Response(
+        content=serialize(data, data_type, media_type),
+        media_type=media_type,
+        headers={"Vary": "Accept"},
+    )
+
+
+class Payload:
+    """Immutable serialized JSON response payload with a strong ETag.
+
+    Binary formats are serialized from the decoded JSON when first requested.
+    Compressed variants are stored once compressed, so repeated responses
+    in any format and encoding only copy the content.
+    """
+
+    __slots__ = ("bodies", "content", "data", "digest", "etag", "variants")
+
+    def __init__(self, content: bytes) -> None:
+        """Initialise payload."""
+        self.content: bytes = content
+        self.digest: str = blake2b(content, digest_size=16).hexdigest()
+        self.etag: str = f'"{self.digest}"'
+        self.data: Any = None
+        self.bodies: dict[str, bytes] = {JSON: content}
+        self.variants: dict[tuple[str, str], bytes] = {}
+
+    @classmethod
+    def serialize(cls, data: object, data_type: type[Any]) -> Payload:
+        """Serialize data the same way as API responses."""
+        return cls(serialize(data, data_type))
+
+    def body(self, media_type: str) -> bytes:
+        """Get content serialized in a media type."""
+        body = self.bodies.get(media_type)
+        if body is None:
+            if self.data is None:
+                self.data = loads(self.content)
+            body = formats[media_type](self.data)
+            self.bodies[media_type] = body
+        return body
+
+    def variant(self, media_type: str, encoding: str) -> bytes:
+        """Get content in a media type compressed with an encoding."""
+        content = self.variants.get((media_type, encoding))
+        if content is None:
+            content = compress(self.body(media_type), encoding, stored=True)
+            self.variants[media_type, encoding] = content
+        return content
+
+    async def precompress(self) -> Payload:
+        """Compress all JSON variants in a thread before the payload is cached."""
+        if len(self.content) >= COMPRESSION_MINIMUM_SIZE:
+            for encoding in encoders:
+                if (JSON, encoding) not in self.variants:
+                    self.variants[JSON, encoding] = await to_thread(
+                        compress,
+                        self.content,
+                        encoding,
+                        stored=True,
+                    )
+        return self
+
+    def response(self, headers: ContentHeaders | None = None) -> Response:
+        """Get response for the payload in the format accepted by the client."""
+        headers = headers or ContentHeaders()
+        media_type = negotiate_format(headers.accept)
+        body = self.body(media_type)
+        encoding = None
+        if len(body) >= COMPRESSION_MINIMUM_SIZE:
+            encoding = negotiate_encoding(headers.accept_encoding)
+
+        tags = [self.digest]
+        if media_type != JSON:
+            tags.append(media_type.removeprefix("application/"))
+        if encoding is not None:
+            tags.append(encoding)
+        etag = f'"{"-".join(tags)}"'
+
+        response_headers = {"ETag": etag, "Vary": "Accept, Accept-Encoding"}
+        if etag_matches(etag, headers.if_none_match):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers=response_headers,
+            )
+
+        if encoding is not None:
+            body = self.variant(media_type, encoding)
+            response_headers["Content-Encoding"] = encoding
+
+        return Response(
+            content=body,
+            media_type=media_type,
+            headers=response_headers,
+        )
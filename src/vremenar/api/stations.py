@@ -2,44 +2,74 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
 
+from vremenar.cache import cached
+from vremenar.database.invalidation import invalidation
+from vremenar.database.stations import STATIONS_TTL
 from vremenar.definitions import CountryID
 from vremenar.models.stations import (
     StationInfo,
     StationInfoExtended,
     StationSearchModel,
 )
-from vremenar.models.weather import WeatherDetails, WeatherInfo, WeatherInfoExtended
+from vremenar.models.weather import (
+    PointForecast,
+    StationForecast,
+    WeatherDetails,
+    WeatherInfo,
+    WeatherInfoExtended,
+)
 from vremenar.sources import (
     current_station_condition,
     find_station,
     get_weather_map,
     list_stations,
+    point_forecast,
+    station_forecast,
     station_weather_details,
 )
+from vremenar.viewport import Viewport
 
 from .config import defaults
+from .responses import ContentHeaders, Payload, binary_responses, model_response
 
 router = APIRouter()
 
+POINT_MAX_MAP_IDS = 40  # more than the number of condition map layers
+
+
+@cached("stations_payloads", ttl=STATIONS_TTL)
+async def stations_list_payload(country: CountryID, extended: bool) -> Payload:
+    """Build serialized and compressed weather stations list."""
+    stations = await list_stations(country)
+    if extended:
+        payload = Payload.serialize(stations, list[StationInfoExtended])
+    else:
+        payload = Payload.serialize([s.info() for s in stations], list[StationInfo])
+    return await payload.precompress()
+
+
+invalidation.register_cache("stations", stations_list_payload)
+
 
 @router.get(
     "/stations/list",
     tags=["stations"],
     name="List stations",
     response_description="List of weather stations",
+    response_model=list[StationInfo] | list[StationInfoExtended],
+    responses=binary_responses,
     **defaults,
 )
 async def stations_list(
     country: CountryID,
+    headers: Annotated[ContentHeaders, Header()],
     extended: bool = False,
-) -> list[StationInfo] | list[StationInfoExtended]:
+) -> Response:
     """List weather stations."""
-    if extended:
-        return await list_stations(country)
-
-    return [s.info() for s in await list_stations(country)]
+    payload = await stations_list_payload(country, extended)
+    return payload.response(headers)
 
 
 @router.post(
@@ -91,19 +121,79 @@ async def details(country: CountryID, station_id: str) -> WeatherDetails:
     return await station_weather_details(country, station_id)
 
 
+@router.get(
+    "/stations/forecast/{station_id}",
+    tags=["stations"],
+    name="Station forecast",
+    response_description="Forecast timeline for the chosen station",
+    **defaults,
+)
+async def forecast(country: CountryID, station_id: str) -> StationForecast:
+    """Get station forecast timeline."""
+    return await station_forecast(country, station_id)
+
+
+@router.get(
+    "/stations/point",
+    tags=["stations"],
+    name="Point forecast",
+    response_description="Weather conditions interpolated for the location",
+    **defaults,
+)
+async def point(
+    country: CountryID,
+    latitude: float,
+    longitude: float,
+    altitude: float | None = None,
+    map_id: Annotated[list[str] | None, Query(max_length=POINT_MAX_MAP_IDS)] = None,
+) -> PointForecast:
+    """Get weather conditions interpolated from the nearest stations.
+
+    Conditions are returned for the requested map IDs or for all weather
+    condition map layers. Map IDs have to be of current condition map layers.
+    """
+    return await point_forecast(country, latitude, longitude, altitude, map_id)
+
+
+def viewport_query(
+    bbox: Annotated[
+        str | None,
+        Query(description="Viewport as lat_min,lon_min,lat_max,lon_max"),
+    ] = None,
+    zoom: Annotated[
+        float | None,
+        Query(description="Only include stations shown at this zoom level"),
+    ] = None,
+    cluster: Annotated[
+        bool,
+        Query(description="Show one station per screen area at the zoom level"),
+    ] = False,
+) -> Viewport | None:
+    """Get map viewport from query parameters."""
+    return Viewport.from_query(bbox, zoom, cluster)
+
+
 @router.get(
     "/stations/map/{map_id}",
     tags=["stations"],
     name="Weather conditions map",
     response_description="List of weather information",
+    response_model=list[WeatherInfo],
+    responses=binary_responses,
     **defaults,
 )
 async def conditions_map(
     country: CountryID,
     map_id: str,
+    headers: Annotated[ContentHeaders, Header()],
     extended: Annotated[bool, Query(include_in_schema=False)] = False,  # ruff: ignore[unused-function-argument]
-) -> list[WeatherInfo]:
+    viewport: Annotated[Viewport | None, Depends(viewport_query)] = None,
+) -> Response:
     """Get weather conditions map for a specific ID."""
-    weather_map = await get_weather_map(country, map_id)
+    weather_map = await get_weather_map(country, map_id, viewport)
 
-    return [condition.base() for condition in weather_map]
+    return model_response(
+        [condition.base() for condition in weather_map],
+        list[WeatherInfo],
+        headers,
+    )
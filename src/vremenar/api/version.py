@@ -1,16 +1,20 @@
 """Version API."""
 
-from json import loads
+from json import JSONDecodeError, loads
+from math import inf
 from pathlib import Path
+from time import monotonic
 
 from anyio import Path as AsyncPath
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel, ConfigDict
 
 from vremenar import __version__
+from vremenar.utils import logger
 
 router = APIRouter()
 VERSION_INFO: AsyncPath = AsyncPath(Path.cwd() / "version.json")
+VERSION_CHECK_INTERVAL = 5  # seconds
 
 
 class VersionInfo(BaseModel):
@@ -34,21 +38,63 @@ class VersionInfo(BaseModel):
     )
 
 
+class VersionCache:
+    """Serialized version info, reloaded when the version file changes."""
+
+    def __init__(
+        self,
+        path: AsyncPath,
+        interval: float = VERSION_CHECK_INTERVAL,
+    ) -> None:
+        """Initialise version cache."""
+        self.path = path
+        self.interval = interval
+        self.mtime: float | None = None
+        self.checked: float = -inf
+        self.content: bytes = VersionInfo().model_dump_json().encode()
+
+    async def get(self) -> bytes:
+        """Get serialized version info."""
+        now = monotonic()
+        if now - self.checked < self.interval:
+            return self.content
+        self.checked = now
+
+        try:
+            mtime: float | None = (await self.path.stat()).st_mtime
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime != self.mtime:
+            # a partially written file is read again on the next check
+            try:
+                self.content = await self.load(mtime is not None)
+            except (JSONDecodeError, OSError):
+                logger.warning("Reading %s failed", self.path, exc_info=True)
+            else:
+                self.mtime = mtime
+
+        return self.content
+
+    async def load(self, exists: bool) -> bytes:
+        """Load and serialize version info."""
+        data: dict[str, str] = {}
+        if exists:
+            data = loads(await self.path.read_text())
+
+        info = VersionInfo(stable=data.get("stable", ""), beta=data.get("beta", ""))
+        return info.model_dump_json().encode()
+
+
+version_cache = VersionCache(VERSION_INFO)
+
+
 @router.get(
     "/version",
     tags=["version"],
     response_description="Get Vremenar versions",
+    response_model=VersionInfo,
 )
-async def version() -> VersionInfo:
+async def version() -> Response:
     """Get app and server versions."""
-    data: dict[str, str] = {}
-
-    if await VERSION_INFO.is_file():  # pragma: no cover
-        async with await VERSION_INFO.open() as f:
-            file_data = await f.read()
-            data = loads(file_data)
-
-    stable = data.get("stable", "")
-    beta = data.get("beta", "")
-
-    return VersionInfo(stable=stable, beta=beta)
+    return Response(content=await version_cache.get(), media_type="application/json")
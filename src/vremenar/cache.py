@@ -0,0 +1,305 @@
+"""In-process caches."""
+
+from __future__ import annotations
+
+import sys
+from asyncio import Task, create_task, current_task, shield
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any, Generic, ParamSpec, TypedDict, TypeVar
+
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+
+from vremenar.deadline import background_context, bounded
+from vremenar.exceptions import DeadlineExceededException
+from vremenar.utils import logger
+
+if sys.version_info >= (3, 12):  # ruff: ignore[outdated-version-block]
+    from typing import override
+else:  # pragma: no cover
+    from typing_extensions import override  # ruff: ignore[deprecated-import]
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class CacheStats(TypedDict):
+    """Cache statistics."""
+
+    name: str
+    generation: int
+    entries: int
+    evictions: int
+    memory: int | None
+    age: float | None
+    stale: bool
+    stale_serves: int
+    refreshes: int
+    refresh_average: float | None
+    refresh_max: float | None
+
+
+def _matches(key: Hashable, prefix: tuple[object, ...]) -> bool:
+    """Check if leading arguments of a cache key match."""
+    return isinstance(key, tuple) and key[: len(prefix)] == prefix
+
+
+class CacheEntry(Generic[R]):  # ruff: ignore[non-pep695-generic-class]
+    """Cache entry."""
+
+    __slots__ = ("stale", "updated", "value")
+
+    def __init__(self, value: R) -> None:
+        """Initialise cache entry."""
+        self.value: R = value
+        self.updated: float = monotonic()
+        self.stale: bool = False
+
+    @property
+    def age(self) -> float:
+        """Entry age in seconds."""
+        return monotonic() - self.updated
+
+
+class AsyncCache(Generic[P, R]):  # ruff: ignore[non-pep695-generic-class]
+    """Cache of async function results with generation tracking.
+
+    Concurrent calls for the same key share a single load. Entries older than
+    the TTL are reloaded on access. If a reload fails because the database is
+    unavailable or the request deadline is exceeded, the previous value is
+    served and marked as stale. With a size set, least recently used entries
+    are evicted. Loads running while their entry is invalidated are not
+    stored, as they may have read outdated data.
+    """
+
+    def __init__(
+        self,
+        function: Callable[P, Awaitable[R]],
+        name: str,
+        ttl: float | None = None,
+        size: int | None = None,
+        sizeof: Callable[[R], int] | None = None,
+    ) -> None:
+        """Initialise cache."""
+        self.function = function
+        self.name = name
+        self.ttl = ttl
+        self.size = size
+        self.sizeof = sizeof
+        self.generation: int = 0
+        self.evictions: int = 0
+        self.stale_serves: int = 0
+        self.refreshes: int = 0
+        self.refresh_time: float = 0
+        self.refresh_max: float = 0
+        self._entries: dict[Hashable, CacheEntry[R]] = {}
+        self._pending: dict[Hashable, Task[R]] = {}
+
+    @staticmethod
+    def _key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+        """Get cache key from call arguments."""
+        if not kwargs:
+            return args
+        return (*args, *sorted(kwargs.items()))
+
+    def _expired(self, entry: CacheEntry[R]) -> bool:
+        """Check if entry needs to be reloaded."""
+        return self.ttl is not None and entry.age > self.ttl
+
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Get cached value or load it."""
+        key = self._key(args, kwargs)
+        entry = self._entries.get(key)
+        if entry is not None and not self._expired(entry):
+            if self.size is not None:
+                self._entries[key] = self._entries.pop(key)
+            return entry.value
+
+        pending = self._pending.get(key)
+        if pending is None:
+            # shared loads are not bound to the deadline of the first caller
+            pending = create_task(
+                self._load(key, *args, **kwargs),
+                context=background_context(),
+            )
+            # all callers may stop waiting before the load fails
+            pending.add_done_callback(self._loaded)
+            self._pending[key] = pending
+
+        try:
+            async with bounded():
+                return await shield(pending)
+        except DeadlineExceededException:
+            if entry is None:
+                raise
+            entry.stale = True
+            self.stale_serves += 1
+            logger.warning("Serving stale %s cache entry", self.name)
+            return entry.value
+
+    def _loaded(self, task: Task[R]) -> None:
+        """Log failed shared load, except for client errors."""
+        if task.cancelled():
+            return
+        exception = task.exception()
+        if exception is None or (
+            isinstance(exception, HTTPException) and exception.status_code < 500
+        ):
+            return
+        logger.warning("Loading %s cache failed", self.name, exc_info=exception)
+
+    async def _load(self, key: Hashable, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Load value and store it in the cache."""
+        task = current_task()
+        start = perf_counter()
+        try:
+            value = await self.function(*args, **kwargs)
+        except (RedisError, DeadlineExceededException):
+            entry = self._entries.get(key)
+            if entry is None:
+                raise
+            entry.stale = True
+            self.stale_serves += 1
+            logger.warning("Serving stale %s cache entry", self.name, exc_info=True)
+            return entry.value
+        finally:
+            # invalidation replaces or removes the pending load
+            current = self._pending.get(key) is task
+            if current:
+                del self._pending[key]
+            duration = perf_counter() - start
+            self.refreshes += 1
+            self.refresh_time += duration
+            self.refresh_max = max(self.refresh_max, duration)
+
+        if not current:
+            return value
+
+        self._entries.pop(key, None)
+        self._entries[key] = CacheEntry(value)
+        self.generation += 1
+        if self.size is not None:
+            while len(self._entries) > self.size:
+                del self._entries[next(iter(self._entries))]
+                self.evictions += 1
+        return value
+
+    def invalidate(self, *args: P.args, **kwargs: P.kwargs) -> None:
+        """Invalidate a single cache entry."""
+        key = self._key(args, kwargs)
+        self._pending.pop(key, None)
+        if self._entries.pop(key, None) is not None:
+            self.generation += 1
+
+    def invalidate_prefix(self, *args: object) -> None:
+        """Invalidate cache entries whose leading arguments match."""
+        for key in [key for key in self._pending if _matches(key, args)]:
+            del self._pending[key]
+        keys = [key for key in self._entries if _matches(key, args)]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            self.generation += 1
+
+    def clear(self) -> None:
+        """Invalidate all cache entries."""
+        self._pending.clear()
+        self._entries.clear()
+        self.generation += 1
+
+    def stats(self) -> CacheStats:
+        """Get cache statistics."""
+        entries = list(self._entries.values())
+        # expired entries are reloaded on access unless the reload fails
+        served = [e for e in entries if e.stale or not self._expired(e)]
+        return CacheStats(
+            name=self.name,
+            generation=self.generation,
+            entries=len(entries),
+            evictions=self.evictions,
+            memory=sum(self.sizeof(e.value) for e in entries) if self.sizeof else None,
+            age=round(max(e.age for e in served), 3) if served else None,
+            stale=any(e.stale for e in entries),
+            stale_serves=self.stale_serves,
+            refreshes=self.refreshes,
+            refresh_average=round(self.refresh_time / self.refreshes * 1000, 3)
+            if self.refreshes
+            else None,
+            refresh_max=round(self.refresh_max * 1000, 3) if self.refreshes else None,
+        )
+
+
+class SWRCache(AsyncCache[P, R]):
+    """Cache serving outdated values while refreshing them in the background.
+
+    Entries older than the soft TTL are returned immediately and refreshed by
+    a single background task per key. Entries older than the hard TTL are
+    reloaded before returning. If a background refresh fails, the previous
+    value is served until the hard TTL.
+    """
+
+    def __init__(
+        self,
+        function: Callable[P, Awaitable[R]],
+        name: str,
+        soft_ttl: float,
+        hard_ttl: float,
+    ) -> None:
+        """Initialise cache."""
+        super().__init__(function, name, ttl=hard_ttl)
+        self.soft_ttl = soft_ttl
+
+    @override
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Get cached value, refreshing it in the background if outdated."""
+        key = self._key(args, kwargs)
+        entry = self._entries.get(key)
+        if entry is None or self._expired(entry) or entry.age <= self.soft_ttl:
+            return await super().__call__(*args, **kwargs)
+
+        self.stale_serves += 1
+        if key not in self._pending:
+            task = create_task(
+                self._load(key, *args, **kwargs),
+                context=background_context(),
+            )
+            task.add_done_callback(self._loaded)
+            self._pending[key] = task
+        return entry.value
+
+
+caches: dict[str, AsyncCache[Any, Any]] = {}
+
+
+def cached(
+    name: str,
+    ttl: float | None = None,
+    size: int | None = None,
+    sizeof: Callable[[Any], int] | None = None,
+) -> Callable[[Callable[P, Awaitable[R]]], AsyncCache[P, R]]:
+    """Cache async function results in a registered cache."""
+
+    def decorator(function: Callable[P, Awaitable[R]]) -> AsyncCache[P, R]:
+        cache = AsyncCache(function, name, ttl, size, sizeof)
+        caches[name] = cache
+        return cache
+
+    return decorator
+
+
+def swr_cached(
+    name: str,
+    soft_ttl: float,
+    hard_ttl: float,
+) -> Callable[[Callable[P, Awaitable[R]]], SWRCache[P, R]]:
+    """Cache async function results in a registered stale-while-revalidate cache."""
+
+    def decorator(function: Callable[P, Awaitable[R]]) -> SWRCache[P, R]:
+        cache = SWRCache(function, name, soft_ttl, hard_ttl)
+        caches[name] = cache
+        return cache
+
+    return decorator
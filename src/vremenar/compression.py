@@ -0,0 +1,155 @@
+"""Response compression.
+
+Responses are compressed with the best encoding accepted by the client out
+of zstd, brotli and gzip. The zstd and brotli encodings are available with
+the `compression` extra or with Python 3.14 for zstd. Precomputed payloads
+store their compressed variants, other responses above the size threshold
+are compressed on the fly with faster settings.
+"""
+
+from __future__ import annotations
+
+from asyncio import to_thread
+from gzip import compress as gzip_compress
+from os import getenv
+from typing import TYPE_CHECKING, NamedTuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from vremenar.utils import optional_module
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+COMPRESSION: bool = getenv("VREMENAR_COMPRESSION", "1") == "1"
+COMPRESSION_MINIMUM_SIZE: int = int(getenv("VREMENAR_COMPRESSION_MINIMUM_SIZE", "1024"))
+COMPRESSION_THREAD_SIZE = 262144  # bytes
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/msgpack",
+    "application/cbor",
+    "text/plain",
+    "text/html",
+)
+
+
+class Encoder(NamedTuple):
+    """Compressor of an encoding with its stored and on the fly levels."""
+
+    compress: Callable[..., bytes]
+    level_argument: str
+    stored_level: int
+    level: int
+
+
+# encodings in the order of preference, stored levels are chosen so that
+# large payloads still compress in tens of milliseconds
+encoders: dict[str, Encoder] = {}
+if (zstd := optional_module("compression.zstd", "zstandard")) is not None:
+    encoders["zstd"] = Encoder(zstd.compress, "level", 12, 3)
+if (brotli := optional_module("brotli")) is not None:
+    encoders["br"] = Encoder(brotli.compress, "quality", 7, 4)
+encoders["gzip"] = Encoder(gzip_compress, "compresslevel", 6, 5)
+
+
+def parse_qualities(header: str) -> dict[str, float]:
+    """Parse values of an `Accept` style header with their quality."""
+    qualities: dict[str, float] = {}
+    for item in header.split(","):
+        value, *parameters = item.split(";")
+        quality = 1.0
+        for parameter in parameters:
+            name, _, argument = parameter.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(argument)
+                except ValueError:
+                    quality = 0
+        qualities[value.strip().lower()] = quality
+    return qualities
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Get the preferred available encoding accepted by the client."""
+    if not COMPRESSION or not accept_encoding:
+        return None
+
+    qualities = parse_qualities(accept_encoding)
+    default = qualities.get("*", 0)
+    candidates = [
+        (qualities.get(encoding, default), -position, encoding)
+        for position, encoding in enumerate(encoders)
+    ]
+    quality, _, encoding = max(candidates)
+    return encoding if quality > 0 else None
+
+
+def compress(content: bytes, encoding: str, *, stored: bool = False) -> bytes:
+    """Compress content, with the best compression if it is stored."""
+    encoder = encoders[encoding]
+    level = encoder.stored_level if stored else encoder.level
+    return encoder.compress(content, **{encoder.level_argument: level})
+
+
+def compressible(headers: Headers) -> bool:
+    """Check if a response should be compressed."""
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Compress complete HTTP responses above the size threshold."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialise middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle request, compressing its response if accepted."""
+        encoding = None
+        if scope["type"] == "http":
+            encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if start is None:
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start)
+            body: bytes = message.get("body", b"")
+            # streamed responses are sent as they are
+            if (
+                not message.get("more_body", False)
+                and len(body) >= COMPRESSION_MINIMUM_SIZE
+                and compressible(headers)
+            ):
+                if len(body) >= COMPRESSION_THREAD_SIZE:
+                    body = await to_thread(compress, body, encoding)
+                else:
+                    body = compress(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                if "etag" in headers and not headers["etag"].startswith("W/"):
+                    headers["ETag"] = "W/" + headers["etag"]
+                message = {**message, "body": body}
+
+            await send(start)
+            start = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -1,5 +1,7 @@
 """Vremenar API database utilities."""
 
+from .invalidation import invalidation
+from .near_cache import near_cache
 from .redis import database_info
 
-__all__ = ["database_info"]
+__all__ = ["database_info", "invalidation", "near_cache"]
@@ -0,0 +1,195 @@
+"""Cache invalidation across workers.
+
+After writing new data the ingester increments the generation of the event
+kind in the `vremenar:generations` hash and publishes a typed event on the
+`vremenar:invalidate` channel, for example `stations:si`, `mosmix:<time>`,
+`alerts:de` or `arso:map:<type>`. The event kind is everything before the
+last colon and the argument everything after it.
+
+Each worker listens on the channel and evicts exactly the affected entries
+of the registered caches. After a reconnect the generations are compared
+with the ones seen so far and all caches of kinds with missed events are
+evicted.
+"""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Task, create_task, sleep
+from contextlib import suppress
+from inspect import isawaitable
+from os import getenv
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from redis.exceptions import RedisError
+
+from vremenar.utils import logger
+
+from .redis import redis
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from redis.asyncio import Redis
+
+    from vremenar.cache import AsyncCache
+
+    InvalidationHandler = Callable[[str | None], Awaitable[None] | None]
+
+INVALIDATION: bool = getenv("VREMENAR_INVALIDATION", "1") == "1"
+INVALIDATION_CHANNEL = "vremenar:invalidate"
+INVALIDATION_GENERATIONS = "vremenar:generations"
+INVALIDATION_PING_INTERVAL = 30  # seconds
+INVALIDATION_RECONNECT_DELAY = 5  # seconds
+
+
+class InvalidationStats(TypedDict):
+    """Invalidation bus statistics."""
+
+    connected: bool
+    events: int
+    resyncs: int
+    errors: int
+
+
+class InvalidationBus:
+    """Subscriber of invalidation events of a worker."""
+
+    def __init__(self, client: Redis[str]) -> None:
+        """Initialise invalidation bus."""
+        self.client = client
+        self.connected: bool = False
+        self.events: int = 0
+        self.resyncs: int = 0
+        self.errors: int = 0
+        self.generations: dict[str, int] | None = None
+        self.handlers: dict[str, list[InvalidationHandler]] = {}
+        self._task: Task[None] | None = None
+
+    def register(self, kind: str, handler: InvalidationHandler) -> None:
+        """Register handler of an event kind.
+
+        The handler is called with the event argument or with `None` if
+        events may have been missed and everything of the kind is outdated.
+        """
+        self.handlers.setdefault(kind, []).append(handler)
+
+    def register_cache(self, kind: str, cache: AsyncCache[Any, Any]) -> None:
+        """Evict cache entries whose first argument is the event argument."""
+
+        def handler(argument: str | None) -> None:
+            if argument is None:
+                cache.clear()
+            else:
+                cache.invalidate_prefix(argument)
+
+        self.register(kind, handler)
+
+    async def dispatch(self, kind: str, argument: str | None) -> None:
+        """Call handlers of an event kind."""
+        for handler in self.handlers.get(kind, ()):
+            try:
+                result = handler(argument)
+                if isawaitable(result):
+                    await result
+            except Exception:  # ruff: ignore[blind-except]
+                self.errors += 1
+                logger.exception("Invalidation of %s:%s failed", kind, argument)
+
+    async def handle(self, event: str) -> None:
+        """Handle an invalidation event."""
+        kind, _, argument = event.rpartition(":")
+        if not kind:
+            kind, argument = argument, ""
+        self.events += 1
+        if self.generations is not None:
+            self.generations[kind] = self.generations.get(kind, 0) + 1
+        logger.debug("Invalidating %s:%s", kind, argument)
+        await self.dispatch(kind, argument or None)
+
+    async def resync(self) -> None:
+        """Evict caches of event kinds whose generation changed."""
+        generations = {
+            kind: int(value)
+            for kind, value in (
+                await self.client.hgetall(INVALIDATION_GENERATIONS)
+            ).items()
+        }
+        previous, self.generations = self.generations, generations
+        # caches loaded before the first connection are current
+        if previous is None:
+            return
+
+        for kind in generations.keys() | previous.keys():
+            if generations.get(kind, 0) != previous.get(kind, 0):
+                self.resyncs += 1
+                logger.info("Missed invalidation events of %s", kind)
+                await self.dispatch(kind, None)
+
+    async def listen(self) -> None:
+        """Process invalidation events until the connection fails."""
+        pubsub = self.client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            await self.resync()
+            self.connected = True
+
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=INVALIDATION_PING_INTERVAL,
+                )
+                if message is None:
+                    await pubsub.ping()
+                    continue
+                if message["type"] == "message":
+                    await self.handle(message["data"])
+        finally:
+            self.connected = False
+            await pubsub.aclose()  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+
+    async def run(self) -> None:
+        """Keep listening for invalidation events, reconnecting on errors."""
+        while True:
+            try:
+                await self.listen()
+            except (RedisError, OSError):
+                logger.warning("Invalidation connection lost", exc_info=True)
+            except Exception:  # ruff: ignore[blind-except]
+                self.errors += 1
+                logger.exception("Invalidation listener failed")
+            await sleep(INVALIDATION_RECONNECT_DELAY)
+
+    def start(self) -> None:
+        """Start listening for invalidation events if enabled."""
+        if INVALIDATION and self._task is None:
+            self._task = create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop listening for invalidation events."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(CancelledError):
+            await self._task
+        self._task = None
+
+    async def publish(self, event: str) -> None:
+        """Publish an invalidation event as done by the ingester."""
+        kind = event.rpartition(":")[0] or event
+        async with self.client.pipeline(transaction=True) as pipeline:
+            pipeline.hincrby(INVALIDATION_GENERATIONS, kind, 1)
+            pipeline.publish(INVALIDATION_CHANNEL, event)
+            await pipeline.execute()
+
+    def stats(self) -> InvalidationStats:
+        """Get invalidation bus statistics."""
+        return InvalidationStats(
+            connected=self.connected,
+            events=self.events,
+            resyncs=self.resyncs,
+            errors=self.errors,
+        )
+
+
+invalidation = InvalidationBus(redis)
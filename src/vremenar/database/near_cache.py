@@ -0,0 +1,256 @@
+"""Redis server-assisted client-side cache."""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Task, create_task, sleep
+from collections import OrderedDict
+from contextlib import suppress
+from os import getenv
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+
+from vremenar.utils import chunker, logger
+
+from .redis import fields_dict, pool, redis
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.asyncio.connection import Connection
+
+NEAR_CACHE_SIZE: int = int(getenv("VREMENAR_REDIS_NEAR_CACHE_SIZE", "0"))
+NEAR_CACHE_PREFIXES: tuple[str, ...] = (
+    "station:",
+    "alerts_area:",
+    "dwd:current:",
+    "arso:weather:current:",
+)
+NEAR_CACHE_PING_INTERVAL = 30  # seconds
+NEAR_CACHE_RECONNECT_DELAY = 5  # seconds
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+
+class NearCacheStats(TypedDict):
+    """Near cache statistics."""
+
+    size: int
+    entries: int
+    connected: bool
+    hits: int
+    misses: int
+    invalidations: int
+
+
+async def read_hashes(
+    redis: Redis[str],
+    keys: list[str],
+    fields: tuple[str, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """Read hashes or only their fields in batches."""
+    result: list[dict[str, Any]] = []
+    if not keys:
+        return result
+
+    async with redis.client() as connection:
+        for batch in chunker(keys, 100):
+            async with connection.pipeline(transaction=False) as pipeline:
+                for key in batch:
+                    if fields:
+                        pipeline.hmget(key, fields)
+                    else:
+                        pipeline.hgetall(key)
+                response = await pipeline.execute()
+            if fields:
+                result.extend(fields_dict(fields, values) for values in response)
+            else:
+                result.extend(response)
+
+    return result
+
+
+class NearCache:
+    """Bounded LRU cache of Redis hashes invalidated by the server.
+
+    A dedicated connection enables broadcasting client tracking for the
+    cached key prefixes and subscribes to the invalidation messages. Cached
+    hashes are only served while that connection is alive. Misses are read
+    from the tracking server so that a lagging replica can not repopulate
+    the cache with outdated values.
+    """
+
+    def __init__(
+        self,
+        client: Redis[str],
+        size: int,
+        prefixes: tuple[str, ...] = NEAR_CACHE_PREFIXES,
+    ) -> None:
+        """Initialise near cache."""
+        self.client = client
+        self.size = size
+        self.prefixes = prefixes
+        self.connected: bool = False
+        self.sequence: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.invalidations: int = 0
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._task: Task[None] | None = None
+
+    def tracked(self, key: str) -> bool:
+        """Check if key can be served from the cache."""
+        return self.connected and key.startswith(self.prefixes)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Get cached hash."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: dict[str, Any], sequence: int) -> None:
+        """Store hash read when the invalidation sequence was at `sequence`."""
+        # an invalidation arrived while reading, the value may be outdated
+        if sequence != self.sequence:
+            return
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, keys: list[str] | None) -> None:
+        """Invalidate keys or the whole cache if no keys are given."""
+        self.sequence += 1
+        self.invalidations += 1
+        if keys is None:
+            self._entries.clear()
+            return
+
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def hgetall(
+        self,
+        redis: Redis[str],
+        keys: list[str],
+        fields: tuple[str, ...] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get hashes, reading only the uncached ones from redis.
+
+        Uncached hashes are only read partially if `fields` are given. Cached
+        hashes are always read and returned whole.
+        """
+        result: list[dict[str, Any]] = [{} for _ in keys]
+        tracked: list[int] = []
+        untracked: list[int] = []
+        for index, key in enumerate(keys):
+            if not self.tracked(key):
+                untracked.append(index)
+            elif (value := self.get(key)) is not None:
+                result[index] = value
+                self.hits += 1
+            else:
+                tracked.append(index)
+                self.misses += 1
+
+        sequence = self.sequence
+        values = await read_hashes(self.client, [keys[i] for i in tracked])
+        for index, value in zip(tracked, values, strict=True):
+            result[index] = value
+            if value:
+                self.put(keys[index], value, sequence)
+
+        values = await read_hashes(redis, [keys[i] for i in untracked], fields)
+        for index, value in zip(untracked, values, strict=True):
+            result[index] = value
+
+        return result
+
+    async def subscribe(self, connection: Connection) -> None:
+        """Enable tracking and subscribe to invalidation messages."""
+        await connection.connect()
+        await connection.send_command("CLIENT", "ID")
+        client_id = await connection.read_response()
+        prefixes = [arg for prefix in self.prefixes for arg in ("PREFIX", prefix)]
+        await connection.send_command(
+            "CLIENT",
+            "TRACKING",
+            "ON",
+            "REDIRECT",
+            client_id,
+            "BCAST",
+            *prefixes,
+        )
+        await connection.read_response()
+        await connection.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+        await connection.read_response()
+
+    async def listen(self) -> None:
+        """Process invalidation messages until the connection fails."""
+        kwargs: dict[str, Any] = {**pool.connection_kwargs, "health_check_interval": 0}
+        connection: Connection = pool.connection_class(**kwargs)
+        try:
+            await self.subscribe(connection)
+            # messages may have been missed while disconnected
+            self.invalidate(None)
+            self.connected = True
+            logger.debug("Near cache tracking %s", ", ".join(self.prefixes))
+
+            ping_pending = False
+            while True:
+                message: Any = await connection.read_response(
+                    timeout=NEAR_CACHE_PING_INTERVAL,
+                )
+                if message is None:
+                    if ping_pending:
+                        err = "No response to ping"
+                        raise RedisConnectionError(err)
+                    await connection.send_command("PING")
+                    ping_pending = True
+                    continue
+
+                ping_pending = False
+                if message[0] == "message" and message[1] == INVALIDATE_CHANNEL:
+                    self.invalidate(message[2])
+        finally:
+            self.connected = False
+            await connection.disconnect()
+
+    async def run(self) -> None:
+        """Keep listening for invalidation messages, reconnecting on errors."""
+        while True:
+            try:
+                await self.listen()
+            except (RedisError, OSError):
+                logger.warning("Near cache invalidation connection lost", exc_info=True)
+            await sleep(NEAR_CACHE_RECONNECT_DELAY)
+
+    def start(self) -> None:
+        """Start listening for invalidation messages if enabled."""
+        if self.size > 0 and self._task is None:
+            self._task = create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop listening for invalidation messages."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(CancelledError):
+            await self._task
+        self._task = None
+
+    def stats(self) -> NearCacheStats:
+        """Get near cache statistics."""
+        return NearCacheStats(
+            size=self.size,
+            entries=len(self._entries),
+            connected=self.connected,
+            hits=self.hits,
+            misses=self.misses,
+            invalidations=self.invalidations,
+        )
+
+
+near_cache = NearCache(redis, NEAR_CACHE_SIZE)
@@ -0,0 +1,161 @@
+"""Packed columnar weather records.
+
+All records of a timestamp are stored in a single binary value. A header
+with the number of records and the field names and types is followed by
+one column per field, aligned to 8 bytes:
+
+- numbers are stored as little-endian doubles, missing values as NaN,
+- text is stored as record offsets as little-endian unsigned 32-bit integers
+  followed by the UTF-8 encoded values, missing values are empty.
+
+Columns are read directly from the Redis reply without copying it.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from enum import StrEnum
+from math import isnan
+from os import getenv
+from struct import Struct
+from typing import TYPE_CHECKING, Any, Literal
+
+from redis.client import NEVER_DECODE
+
+from .replicas import replica_read
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from redis.asyncio import Redis
+
+PACKED_RECORDS: bool = getenv("VREMENAR_REDIS_PACKED", "0") == "1"
+
+MAGIC = b"VRP1"
+HEADER = Struct("<4sHI")
+FIELD = Struct("<cH")
+ALIGNMENT = 8
+
+
+class ColumnType(StrEnum):
+    """Packed column type."""
+
+    Number = "d"
+    Text = "s"
+
+
+def _align(offset: int) -> int:
+    """Align offset to the column alignment."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _pad(buffer: bytearray) -> None:
+    """Pad buffer to the column alignment."""
+    buffer.extend(bytes(_align(len(buffer)) - len(buffer)))
+
+
+def _column(data: memoryview, typecode: Literal["d", "I"]) -> Sequence[Any]:
+    """Get a little-endian column of fixed-size values."""
+    if sys.byteorder == "little":
+        return data.cast(typecode)
+    column = array(typecode, data)  # pragma: no cover
+    column.byteswap()  # pragma: no cover
+    return column  # pragma: no cover
+
+
+def pack_records(
+    records: Sequence[Mapping[Any, Any]],
+    schema: dict[str, ColumnType],
+) -> bytes:
+    """Pack records into columns of the given schema."""
+    buffer = bytearray(HEADER.pack(MAGIC, len(schema), len(records)))
+    for name, column_type in schema.items():
+        encoded = name.encode()
+        buffer.extend(FIELD.pack(column_type.encode(), len(encoded)))
+        buffer.extend(encoded)
+    _pad(buffer)
+
+    for name, column_type in schema.items():
+        values = [record.get(name) for record in records]
+        if column_type == ColumnType.Number:
+            numbers = array(
+                "d",
+                [float(v) if v is not None else float("nan") for v in values],
+            )
+            if sys.byteorder != "little":  # pragma: no cover
+                numbers.byteswap()
+            buffer.extend(numbers.tobytes())
+            continue
+
+        texts = [str(v).encode() if v is not None else b"" for v in values]
+        offsets = array("I", [0])
+        for text in texts:
+            offsets.append(offsets[-1] + len(text))
+        if sys.byteorder != "little":  # pragma: no cover
+            offsets.byteswap()
+        buffer.extend(offsets.tobytes())
+        buffer.extend(b"".join(texts))
+        _pad(buffer)
+
+    return bytes(buffer)
+
+
+def unpack_records(data: bytes) -> list[dict[str, Any]]:
+    """Unpack records, skipping missing values."""
+    view = memoryview(data)
+    magic, field_count, count = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        err = "Invalid packed records"
+        raise ValueError(err)
+
+    offset = HEADER.size
+    fields: list[tuple[str, ColumnType]] = []
+    for _ in range(field_count):
+        column_type, length = FIELD.unpack_from(view, offset)
+        offset += FIELD.size
+        fields.append(
+            (
+                str(view[offset : offset + length], "utf-8"),
+                ColumnType(column_type.decode()),
+            ),
+        )
+        offset += length
+    offset = _align(offset)
+
+    records: list[dict[str, Any]] = [{} for _ in range(count)]
+    for name, column_type in fields:
+        if column_type == ColumnType.Number:
+            numbers = _column(view[offset : offset + count * 8], "d")
+            for record, number in zip(records, numbers, strict=True):
+                if not isnan(number):
+                    record[name] = number
+            offset += count * 8
+            continue
+
+        offsets = _column(view[offset : offset + (count + 1) * 4], "I")
+        offset += (count + 1) * 4
+        text = view[offset : offset + offsets[count]]
+        for index, record in enumerate(records):
+            start, end = offsets[index], offsets[index + 1]
+            if end > start:
+                record[name] = str(text[start:end], "utf-8")
+        offset = _align(offset + offsets[count])
+
+    return records
+
+
+@replica_read
+async def get_packed_records(
+    redis: Redis[str],
+    key: str,
+) -> list[dict[str, Any]] | None:
+    """Get packed records from redis if they exist."""
+    data: bytes | None = await redis.execute_command(  # type: ignore[no-untyped-call]
+        "GET",
+        key,
+        **{NEVER_DECODE: True},
+    )
+    if data is None:
+        return None
+    return unpack_records(data)
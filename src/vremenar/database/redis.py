@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
+import sys
 from os import getenv
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, TypedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from redis.asyncio import Redis, from_url
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
 
 from vremenar.utils import logger
 
+if sys.version_info >= (3, 12):  # ruff: ignore[outdated-version-block]
+    from typing import override
+else:  # pragma: no cover
+    from typing_extensions import override  # ruff: ignore[deprecated-import]
+
+if TYPE_CHECKING:
+    from redis.asyncio.connection import Connection
+
+    BasePool = BlockingConnectionPool[Connection]
+else:
+    BasePool = BlockingConnectionPool
+
 db_env: str = getenv("VREMENAR_DATABASE", "staging")
 database: int = {
     "staging": 0,
@@ -15,15 +35,144 @@ database: int = {
     "test": 2,
 }.get(db_env, 0)
 
-redis: Redis[str] = from_url(
-    f"redis://localhost/{database}",
-    decode_responses=True,
-)
+# connection
+REDIS_URL: str = getenv("VREMENAR_REDIS_URL", "redis://localhost")
+REDIS_SOCKET: str = getenv("VREMENAR_REDIS_SOCKET", "")
+# connection pool, per worker
+REDIS_MAX_CONNECTIONS: int = int(getenv("VREMENAR_REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT: float = float(getenv("VREMENAR_REDIS_POOL_TIMEOUT", "5"))
+# sockets
+REDIS_CONNECT_TIMEOUT: float = float(getenv("VREMENAR_REDIS_CONNECT_TIMEOUT", "2"))
+REDIS_SOCKET_TIMEOUT: float = float(getenv("VREMENAR_REDIS_SOCKET_TIMEOUT", "5"))
+REDIS_HEALTH_CHECK_INTERVAL: int = int(getenv("VREMENAR_REDIS_HEALTH_CHECK", "30"))
+# retries on transient errors
+REDIS_RETRIES: int = int(getenv("VREMENAR_REDIS_RETRIES", "3"))
+REDIS_RETRY_BACKOFF_BASE: float = float(getenv("VREMENAR_REDIS_BACKOFF_BASE", "0.01"))
+REDIS_RETRY_BACKOFF_CAP: float = float(getenv("VREMENAR_REDIS_BACKOFF_CAP", "0.5"))
+
+
+class PoolStats(TypedDict):
+    """Connection pool statistics."""
+
+    max_connections: int
+    in_use: int
+    idle: int
+    waits: int
+    wait_average: float
+    wait_max: float
+    exhausted: int
+
+
+class MeasuredConnectionPool(BasePool):
+    """Blocking connection pool that measures connection wait time."""
+
+    def __init__(self, **kwargs: Any) -> None:  # ruff: ignore[any-type]
+        """Initialise connection pool."""
+        super().__init__(**kwargs)
+        self.waits: int = 0
+        self.wait_total: float = 0
+        self.wait_max: float = 0
+        self.exhausted: int = 0
+
+    @override
+    async def get_connection(
+        self,
+        command_name: object = None,
+        *keys: object,
+        **options: object,
+    ) -> Connection:
+        """Get a connection from the pool and record the wait time."""
+        start = perf_counter()
+        try:
+            return await super().get_connection()  # type: ignore[call-arg]  # ty: ignore[missing-argument]
+        except RedisConnectionError as e:
+            # waiting for a free connection timed out, not a failed connection
+            if isinstance(e.__cause__, TimeoutError):
+                self.exhausted += 1
+            raise
+        finally:
+            wait = perf_counter() - start
+            self.waits += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def stats(self) -> PoolStats:
+        """Get connection pool statistics."""
+        return PoolStats(
+            max_connections=self.max_connections,
+            in_use=len(self._in_use_connections),  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+            idle=len(self._available_connections),  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+            waits=self.waits,
+            wait_average=round(self.wait_total / self.waits * 1000, 3)
+            if self.waits
+            else 0,
+            wait_max=round(self.wait_max * 1000, 3),
+            exhausted=self.exhausted,
+        )
+
+
+def database_url(url: str) -> str:
+    """Get Redis connection URL for the configured database.
+
+    The database replaces any database already set in the URL.
+    """
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key != "db"]
+    if parts.scheme == "unix":
+        query.append(("db", str(database)))
+        return f"unix://{parts.netloc}{parts.path}?{urlencode(query)}"
+    return urlunsplit(parts._replace(path=f"/{database}", query=urlencode(query)))
+
+
+def redis_url() -> str:
+    """Get Redis primary connection URL."""
+    if REDIS_SOCKET:
+        return database_url(f"unix://{REDIS_SOCKET}")
+    return database_url(REDIS_URL)
+
+
+def create_pool(url: str) -> MeasuredConnectionPool:
+    """Create a configured Redis connection pool."""
+    pool: MeasuredConnectionPool = MeasuredConnectionPool.from_url(
+        url,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        retry=Retry(
+            ExponentialBackoff(
+                base=REDIS_RETRY_BACKOFF_BASE,
+                cap=REDIS_RETRY_BACKOFF_CAP,
+            ),
+            REDIS_RETRIES,
+        ),
+        retry_on_error=[RedisConnectionError, RedisTimeoutError],
+        decode_responses=True,
+    )
+    return pool
+
+
+pool: MeasuredConnectionPool = create_pool(redis_url())
+redis: Redis[str] = Redis(connection_pool=pool)  # type: ignore[assignment]  # ty: ignore[invalid-assignment]
+
+
+def fields_dict(fields: tuple[str, ...], values: list[str | None]) -> dict[str, str]:
+    """Convert field values to a dictionary, skipping missing fields."""
+    return {
+        field: value
+        for field, value in zip(fields, values, strict=True)
+        if value is not None
+    }
 
 
 def database_info() -> None:
     """Log the database info."""
     logger.debug("Using %s database with ID %d", db_env, database)
+    logger.debug(
+        "Redis connection pool with %d connections per worker",
+        REDIS_MAX_CONNECTIONS,
+    )
 
 
 __all__ = ["Redis", "redis"]
@@ -0,0 +1,208 @@
+"""Redis read replicas."""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Task, create_task, gather, sleep
+from contextlib import suppress
+from functools import wraps
+from math import inf
+from os import getenv
+from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypedDict, TypeVar
+from urllib.parse import urlsplit
+
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from vremenar.deadline import bounded
+from vremenar.utils import logger
+
+from .redis import create_pool, database_url, redis
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine, Mapping
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+REDIS_REPLICAS: list[str] = [
+    url
+    for url in getenv("VREMENAR_REDIS_REPLICAS", "").replace(" ", "").split(",")
+    if url
+]
+REDIS_REPLICA_MAX_LAG: int = int(getenv("VREMENAR_REDIS_REPLICA_MAX_LAG", "65536"))
+REDIS_REPLICA_CHECK_INTERVAL: float = float(
+    getenv("VREMENAR_REDIS_REPLICA_CHECK_INTERVAL", "5"),
+)
+
+
+class ReplicaStats(TypedDict):
+    """Read replica statistics."""
+
+    name: str
+    available: bool
+    lag: float | None
+    reads: int
+    failures: int
+
+
+def replication_lag(info: Mapping[str, Any], offset: int) -> float:
+    """Get replication lag in bytes behind the primary replication offset."""
+    if info.get("role") == "master":
+        return 0
+    if info.get("master_link_status") != "up" or "slave_repl_offset" not in info:
+        return inf
+    return max(0, offset - int(info["slave_repl_offset"]))
+
+
+class Replica:
+    """Read replica with replication status refreshed in the background."""
+
+    def __init__(self, client: Redis[str], name: str) -> None:
+        """Initialise replica."""
+        self.client = client
+        self.name = name
+        self.lag: float | None = None
+        self.reads: int = 0
+        self.failures: int = 0
+
+    @classmethod
+    def from_url(cls, url: str) -> Replica:
+        """Create replica from its URL."""
+        parts = urlsplit(url)
+        name = parts.path if parts.scheme == "unix" else parts.netloc.rsplit("@")[-1]
+        client: Redis[str] = Redis(connection_pool=create_pool(database_url(url)))  # type: ignore[assignment]  # ty: ignore[invalid-assignment]
+        return cls(client, name)
+
+    @property
+    def available(self) -> bool:
+        """Replica availability for reads."""
+        return self.lag is not None and self.lag <= REDIS_REPLICA_MAX_LAG
+
+    async def refresh(self, offset: int) -> None:
+        """Refresh replication status against the primary replication offset."""
+        try:
+            info: Mapping[str, Any] = await self.client.info("replication")
+        except RedisError:
+            self.lag = None
+            return
+
+        self.lag = replication_lag(info, offset)
+        if not self.available:
+            logger.warning("Redis replica %s is lagging (%s B)", self.name, self.lag)
+
+    def failed(self) -> None:
+        """Mark replica as unavailable until the next status check."""
+        self.failures += 1
+        self.lag = None
+
+    def stats(self) -> ReplicaStats:
+        """Get replica statistics."""
+        return ReplicaStats(
+            name=self.name,
+            available=self.available,
+            lag=self.lag if self.lag is not None and self.lag < inf else None,
+            reads=self.reads,
+            failures=self.failures,
+        )
+
+
+class ReplicaRouter:
+    """Route reads to replicas in turn, falling back to the primary."""
+
+    def __init__(self, primary: Redis[str], replicas: list[Replica]) -> None:
+        """Initialise router."""
+        self.primary = primary
+        self.replicas = replicas
+        self._next: int = 0
+        self._task: Task[None] | None = None
+
+    def candidates(self) -> list[Replica]:
+        """Get available replicas in round-robin order."""
+        if not self.replicas:
+            return []
+
+        start = self._next
+        self._next = (start + 1) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.available]
+
+    async def refresh(self) -> None:
+        """Refresh replication status of all replicas."""
+        try:
+            info: Mapping[str, Any] = await self.primary.info("replication")
+        except RedisError:
+            logger.warning("Redis primary replication status unavailable")
+            for replica in self.replicas:
+                replica.lag = None
+            return
+
+        offset = int(info.get("master_repl_offset", 0))
+        await gather(*(replica.refresh(offset) for replica in self.replicas))
+
+    async def run(self) -> None:
+        """Keep refreshing replication status."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:  # ruff: ignore[blind-except]
+                logger.exception("Redis replication status refresh failed")
+                for replica in self.replicas:
+                    replica.lag = None
+            await sleep(REDIS_REPLICA_CHECK_INTERVAL)
+
+    def start(self) -> None:
+        """Start refreshing replication status if replicas are configured."""
+        if self.replicas and self._task is None:
+            self._task = create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop refreshing replication status."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(CancelledError):
+            await self._task
+        self._task = None
+
+    async def read(self, operation: Callable[[Redis[str]], Awaitable[R]]) -> R:
+        """Run a read operation on a replica or on the primary."""
+        for replica in self.candidates():
+            try:
+                result = await operation(replica.client)
+            except (RedisConnectionError, RedisTimeoutError):
+                replica.failed()
+                logger.warning(
+                    "Redis replica %s failed, reading from the next one",
+                    replica.name,
+                    exc_info=True,
+                )
+            else:
+                replica.reads += 1
+                return result
+
+        return await operation(self.primary)
+
+    def stats(self) -> list[ReplicaStats]:
+        """Get replicas statistics."""
+        return [replica.stats() for replica in self.replicas]
+
+
+router = ReplicaRouter(redis, [Replica.from_url(url) for url in REDIS_REPLICAS])
+
+
+def replica_read(  # ruff: ignore[non-pep695-generic-function]
+    function: Callable[Concatenate[Redis[str], P], Awaitable[R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """Run the decorated read function with a replica client if available."""
+
+    @wraps(function)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        async with bounded():
+            return await router.read(
+                lambda client: function(client, *args, **kwargs),
+            )
+
+    return wrapper
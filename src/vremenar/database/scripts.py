@@ -0,0 +1,114 @@
+"""Redis Lua scripts for multi-step lookups in a single round trip.
+
+Scripts only read data so they can also run on read replicas. They access
+keys derived from other keys that are not declared in `KEYS`, so they are not
+compatible with Redis Cluster and are disabled by default.
+"""
+
+from __future__ import annotations
+
+from os import getenv
+from typing import TYPE_CHECKING, Any
+
+from .redis import fields_dict, redis
+from .replicas import replica_read
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+REDIS_SCRIPTS: bool = getenv("VREMENAR_REDIS_SCRIPTS", "0") == "1"
+
+# KEYS[1]: set of hash keys, ARGV: fields
+HMGET_MEMBERS = """
+local result = {}
+for i, key in ipairs(redis.call('SMEMBERS', KEYS[1])) do
+    result[i] = redis.call('HMGET', key, unpack(ARGV))
+end
+return result
+"""
+
+# KEYS[1]: sorted set of hash keys, ARGV[1]: minimum score, ARGV[2...]: fields
+HMGET_RANGE = """
+local fields = {unpack(ARGV, 2)}
+local result = {}
+for i, key in ipairs(redis.call('ZRANGEBYSCORE', KEYS[1], ARGV[1], '+inf')) do
+    result[i] = redis.call('HMGET', key, unpack(fields))
+end
+return result
+"""
+
+# ARGV[1]: country, ARGV[2]: language, ARGV[3...]: areas
+ALERTS_FOR_AREAS = """
+local country, language = ARGV[1], ARGV[2]
+local ids = {}
+for i = 3, #ARGV do
+    local key = 'alerts_area:' .. country .. ':' .. ARGV[i] .. ':alerts'
+    for _, id in ipairs(redis.call('SMEMBERS', key)) do
+        ids[id] = true
+    end
+end
+local result = {}
+for id in pairs(ids) do
+    local prefix = 'alert:' .. country .. ':' .. id
+    result[#result + 1] = {
+        redis.call('HGETALL', prefix .. ':info'),
+        redis.call('HGETALL', prefix .. ':localised_' .. language),
+        redis.call('SMEMBERS', prefix .. ':areas'),
+    }
+end
+return result
+"""
+
+hmget_members_script = redis.register_script(HMGET_MEMBERS)
+hmget_range_script = redis.register_script(HMGET_RANGE)
+alerts_for_areas_script = redis.register_script(ALERTS_FOR_AREAS)
+
+
+def pairs_dict(values: list[str]) -> dict[str, str]:
+    """Convert a flat list of field and value pairs to a dictionary."""
+    return dict(zip(values[::2], values[1::2], strict=True))
+
+
+@replica_read
+async def hmget_members(
+    redis: Redis[str],
+    key: str,
+    fields: tuple[str, ...],
+) -> list[dict[str, str]]:
+    """Get fields of all hashes in a set."""
+    response = await hmget_members_script(keys=[key], args=fields, client=redis)
+    return [fields_dict(fields, values) for values in response]
+
+
+@replica_read
+async def hmget_range(
+    redis: Redis[str],
+    key: str,
+    minimum: str,
+    fields: tuple[str, ...],
+) -> list[dict[str, str]]:
+    """Get fields of hashes in a sorted set from a minimum score on."""
+    response = await hmget_range_script(
+        keys=[key],
+        args=[minimum, *fields],
+        client=redis,
+    )
+    return [fields_dict(fields, values) for values in response]
+
+
+@replica_read
+async def alerts_for_areas(
+    redis: Redis[str],
+    country: str,
+    language: str,
+    areas: set[str],
+) -> list[tuple[dict[str, Any], dict[str, Any], set[str]]]:
+    """Get info, localised info and areas of all alerts for areas."""
+    response = await alerts_for_areas_script(
+        args=[country, language, *areas],
+        client=redis,
+    )
+    return [
+        (pairs_dict(info), pairs_dict(localised), set(alert_areas))
+        for info, localised, alert_areas in response
+    ]
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypedDict
-
-import asyncstdlib as a
+from math import floor, log, pi, radians, tan
+from typing import TYPE_CHECKING, TypedDict, cast
 
+from vremenar.cache import cached
 from vremenar.models.common import Coordinate
 from vremenar.models.stations import StationInfoExtended
 
-from .redis import redis
+from .invalidation import invalidation
+from .near_cache import near_cache
+from .replicas import replica_read
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from redis.asyncio import Redis
+
     from vremenar.definitions import CountryID
 
+STATIONS_TTL = 3600  # seconds
+GRID_CELL = 0.5  # degrees
+CLUSTER_CELL = 64  # pixels
+CLUSTER_ZOOM_MAX = 14
+MERCATOR_LATITUDE_MAX = 85.05112878
+TILE_SIZE = 256  # pixels
+
 STATION_BASE_KEYS: set[str] = {
     "id",
     "name",
@@ -39,23 +52,26 @@ class StationDict(TypedDict, total=False):
     alerts_area: str
 
 
-async def load_stations(country: CountryID) -> dict[str, StationDict]:
+@replica_read
+async def load_stations(
+    redis: Redis[str],
+    country: CountryID,
+) -> dict[str, StationDict]:
     """Load stations from redis."""
     stations: dict[str, StationDict] = {}
-    async with redis.client() as connection:
-        station_ids: set[str] = await redis.smembers(f"station:{country}")
-        async with connection.pipeline(transaction=False) as pipeline:
-            for station_id in station_ids:
-                pipeline.hgetall(f"station:{country}:{station_id}")
-            response = await pipeline.execute()
+    station_ids: set[str] = await redis.smembers(f"station:{country}")
+    response = await near_cache.hgetall(
+        redis,
+        [f"station:{country}:{station_id}" for station_id in station_ids],
+    )
 
     for station in response:
-        stations[station["id"]] = station
+        stations[station["id"]] = cast("StationDict", station)
 
     return stations
 
 
-@a.lru_cache
+@cached("stations", ttl=STATIONS_TTL)
 async def get_stations(country: CountryID) -> dict[str, StationInfoExtended]:
     """Get a dictionary of supported stations for a country."""
     stations_raw: dict[str, StationDict] = await load_stations(country)
@@ -81,27 +97,30 @@ async def get_stations(country: CountryID) -> dict[str, StationInfoExtended]:
     return dict(sorted(stations.items(), key=lambda item: item[1].name))
 
 
+invalidation.register_cache("stations", get_stations)
+
+
+@replica_read
 async def search_stations(
+    redis: Redis[str],
     country: CountryID,
     latitude: float,
     longitude: float,
 ) -> list[StationInfoExtended]:
     """Search for stations by coordinate."""
-    async with redis.client() as connection:
-        station_ids: list[tuple[str, float]] = await redis.geosearch(
-            f"location:{country}",
-            latitude=latitude,
-            longitude=longitude,
-            radius=50,
-            unit="km",
-            withdist=True,
-            sort="ASC",
-        )
-
-        async with connection.pipeline(transaction=False) as pipeline:
-            for station_id, _ in station_ids:
-                pipeline.hgetall(f"station:{country}:{station_id}")
-            response = await pipeline.execute()
+    station_ids: list[tuple[str, float]] = await redis.geosearch(
+        f"location:{country}",
+        latitude=latitude,
+        longitude=longitude,
+        radius=50,
+        unit="km",
+        withdist=True,
+        sort="ASC",
+    )
+    response = await near_cache.hgetall(
+        redis,
+        [f"station:{country}:{station_id}" for station_id, _ in station_ids],
+    )
 
     stations: list[StationInfoExtended] = []
     for station in response:
@@ -125,3 +144,136 @@ async def search_stations(
         )
 
     return stations
+
+
+class StationGrid:
+    """Grid index of station coordinates of a station snapshot."""
+
+    __slots__ = ("cells", "snapshot")
+
+    def __init__(self, snapshot: dict[str, StationInfoExtended]) -> None:
+        """Initialise grid index."""
+        self.snapshot = snapshot
+        self.cells: dict[tuple[int, int], list[StationInfoExtended]] = {}
+        for station in snapshot.values():
+            cell = self.cell(station.coordinate.latitude, station.coordinate.longitude)
+            self.cells.setdefault(cell, []).append(station)
+
+    @staticmethod
+    def cell(latitude: float, longitude: float) -> tuple[int, int]:
+        """Get grid cell of a coordinate."""
+        return floor(latitude / GRID_CELL), floor(longitude / GRID_CELL)
+
+    def query(
+        self,
+        latitude_min: float,
+        longitude_min: float,
+        latitude_max: float,
+        longitude_max: float,
+    ) -> list[StationInfoExtended]:
+        """Get stations in grid cells overlapping a bounding box.
+
+        Stations near the edges may lie outside of the bounding box.
+        """
+        row_min, column_min = self.cell(latitude_min, longitude_min)
+        row_max, column_max = self.cell(latitude_max, longitude_max)
+        if (row_max - row_min + 1) * (column_max - column_min + 1) > len(self.cells):
+            cells = [
+                cell
+                for cell in self.cells
+                if row_min <= cell[0] <= row_max and column_min <= cell[1] <= column_max
+            ]
+        else:
+            cells = [
+                (row, column)
+                for row in range(row_min, row_max + 1)
+                for column in range(column_min, column_max + 1)
+            ]
+
+        return [station for cell in cells for station in self.cells.get(cell, [])]
+
+
+grids: dict[CountryID, StationGrid] = {}
+
+
+async def get_station_grid(country: CountryID) -> StationGrid:
+    """Get grid index of the current station snapshot for a country."""
+    snapshot = await get_stations(country)
+    grid = grids.get(country)
+    if grid is None or grid.snapshot is not snapshot:
+        grid = grids[country] = StationGrid(snapshot)
+    return grid
+
+
+def pixel(latitude: float, longitude: float, zoom: int) -> tuple[float, float]:
+    """Get Web Mercator pixel coordinates of a coordinate at a zoom level."""
+    scale = TILE_SIZE * 2**zoom
+    latitude = max(-MERCATOR_LATITUDE_MAX, min(MERCATOR_LATITUDE_MAX, latitude))
+    x = (longitude + 180) / 360 * scale
+    y = (1 - log(tan(pi / 4 + radians(latitude) / 2)) / pi) / 2 * scale
+    return x, y
+
+
+class StationClusters:
+    """Screen-space grid cells of stations per zoom level.
+
+    Stations are grouped into cells of `CLUSTER_CELL` pixels. Of the stations
+    shown on a map, the one shown at the lowest zoom level represents each
+    cell, so cells are not left empty when some stations have no data.
+    """
+
+    __slots__ = ("cells", "priority", "snapshot")
+
+    def __init__(self, snapshot: dict[str, StationInfoExtended]) -> None:
+        """Initialise clusters."""
+        self.snapshot = snapshot
+        stations = sorted(
+            snapshot.values(),
+            key=lambda s: (
+                s.zoom_level if s.zoom_level is not None else 0,
+                s.id,
+            ),
+        )
+        self.priority: dict[str, int] = {
+            station.id: rank for rank, station in enumerate(stations)
+        }
+        self.cells: list[dict[str, tuple[int, int]]] = []
+        for zoom in range(CLUSTER_ZOOM_MAX + 1):
+            cells: dict[str, tuple[int, int]] = {}
+            for station in stations:
+                x, y = pixel(
+                    station.coordinate.latitude,
+                    station.coordinate.longitude,
+                    zoom,
+                )
+                cells[station.id] = (int(x // CLUSTER_CELL), int(y // CLUSTER_CELL))
+            self.cells.append(cells)
+
+    def representatives(self, zoom: float, station_ids: Iterable[str]) -> set[str]:
+        """Get representative station IDs of the shown stations at a zoom level.
+
+        Stations are not clustered above the maximum clustered zoom level.
+        Unknown stations are skipped.
+        """
+        known = [s for s in station_ids if s in self.priority]
+        level = max(0, floor(zoom))
+        if level > CLUSTER_ZOOM_MAX:
+            return set(known)
+
+        cells = self.cells[level]
+        representatives: dict[tuple[int, int], str] = {}
+        for station_id in sorted(known, key=self.priority.__getitem__):
+            representatives.setdefault(cells[station_id], station_id)
+        return set(representatives.values())
+
+
+station_clusters: dict[CountryID, StationClusters] = {}
+
+
+async def get_station_clusters(country: CountryID) -> StationClusters:
+    """Get clusters of the current station snapshot for a country."""
+    snapshot = await get_stations(country)
+    clusters = station_clusters.get(country)
+    if clusters is None or clusters.snapshot is not snapshot:
+        clusters = station_clusters[country] = StationClusters(snapshot)
+    return clusters
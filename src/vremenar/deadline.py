@@ -0,0 +1,112 @@
+"""Request deadlines.
+
+Every request gets a deadline that depends on its route. The deadline is kept
+in a context variable, so it applies to all Redis reads and HTTP calls made
+while handling the request, including the ones in background cache loads
+started by it. Calls still running at the deadline are cancelled and the
+request fails with 503, unless a cache has an older value to serve.
+"""
+
+from __future__ import annotations
+
+from asyncio import timeout
+from contextlib import asynccontextmanager
+from contextvars import Context, ContextVar, copy_context
+from os import getenv
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from vremenar.exceptions import DeadlineExceededException
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+REQUEST_DEADLINE: float = float(getenv("VREMENAR_REQUEST_DEADLINE", "10"))
+
+
+def parse_route_deadlines(value: str) -> dict[str, float]:
+    """Parse comma-separated `path=seconds` route deadlines."""
+    deadlines: dict[str, float] = {}
+    for item in value.split(","):
+        path, _, seconds = item.strip().partition("=")
+        if path and seconds:
+            deadlines[path] = float(seconds)
+    return deadlines
+
+
+# route path prefixes with deadlines in seconds, the longest prefix matches
+ROUTE_DEADLINES: dict[str, float] = {
+    "/health": 2,
+    "/maps/list": 5,
+    **parse_route_deadlines(getenv("VREMENAR_ROUTE_DEADLINES", "")),
+}
+
+request_deadline: ContextVar[float | None] = ContextVar(
+    "request_deadline",
+    default=None,
+)
+
+
+def route_deadline(path: str) -> float:
+    """Get deadline in seconds for a route path."""
+    prefixes = [prefix for prefix in ROUTE_DEADLINES if path.startswith(prefix)]
+    if not prefixes:
+        return REQUEST_DEADLINE
+    return ROUTE_DEADLINES[max(prefixes, key=len)]
+
+
+def remaining() -> float | None:
+    """Get remaining time of the current deadline in seconds."""
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - monotonic()
+
+
+def background_context() -> Context:
+    """Get a copy of the current context with a new deadline for background work."""
+    context = copy_context()
+    context.run(request_deadline.set, monotonic() + REQUEST_DEADLINE)
+    return context
+
+
+@asynccontextmanager
+async def bounded() -> AsyncIterator[None]:
+    """Cancel the enclosed calls when the current deadline is exceeded."""
+    time_left = remaining()
+    if time_left is None:
+        yield
+        return
+    if time_left <= 0:
+        raise DeadlineExceededException
+
+    scope = timeout(time_left)
+    try:
+        async with scope:
+            yield
+    except TimeoutError:
+        if scope.expired():
+            raise DeadlineExceededException from None
+        raise
+
+
+class DeadlineMiddleware:
+    """Set the deadline of HTTP requests."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialise middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle request with a deadline."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_deadline.set(monotonic() + route_deadline(scope["path"]))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_deadline.reset(token)
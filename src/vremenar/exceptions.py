@@ -38,6 +38,17 @@ class UnrecognisedMapIDException(HTTPException):
         )
 
 
+class UnsupportedLocationException(HTTPException):
+    """Unsupported location exception."""
+
+    def __init__(self) -> None:
+        """Init exception."""
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No weather stations near the location",
+        )
+
+
 class UnknownAlertAreaException(HTTPException):
     """Unknown alert area exception."""
 
@@ -80,3 +91,15 @@ class InvalidSearchQueryException(HTTPException):
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail=detail,
         )
+
+
+class DeadlineExceededException(HTTPException):
+    """Request deadline exceeded exception."""
+
+    def __init__(self) -> None:
+        """Init exception."""
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Request deadline exceeded",
+            headers={"Retry-After": "1"},
+        )
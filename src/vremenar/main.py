@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
 from fastapi import FastAPI
 
 from . import __version__
 from .api import (
     alerts,
     copyright,  # ruff: ignore[builtin-import-shadowing]
+    health,
     maps,
     stations,
     version,
 )
-from .database import database_info
+from .compression import CompressionMiddleware
+from .database import database_info, invalidation, near_cache
+from .database.replicas import router as replicas
+from .deadline import DeadlineMiddleware
+from .shedding import ConcurrencyMiddleware
+from .sources.meteoalarm.stream import alerts_stream
+from .warmup import warmup
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 tags_metadata = [
     {
@@ -33,20 +46,46 @@ tags_metadata = [
         "name": "copyright",
         "description": "Data attribution and copyright.",
     },
+    {
+        "name": "health",
+        "description": "Worker health and readiness for load balancers.",
+    },
 ]
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Warm up caches before the worker starts accepting traffic."""
+    database_info()
+    replicas.start()
+    near_cache.start()
+    invalidation.start()
+    alerts_stream.start()
+    try:
+        await warmup()
+        yield
+    finally:
+        await alerts_stream.stop()
+        await invalidation.stop()
+        await near_cache.stop()
+        await replicas.stop()
+
+
 app: FastAPI = FastAPI(
     title="Vremenar API",
     description="Weather API powering Vremenar application",
     version=__version__,
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(ConcurrencyMiddleware)
+app.add_middleware(DeadlineMiddleware)
 app.include_router(version)
 app.include_router(stations)
 app.include_router(maps)
 app.include_router(alerts)
 app.include_router(copyright)
-
-database_info()
+app.include_router(health)
 
 __all__ = ["app"]
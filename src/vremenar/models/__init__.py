@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from pydantic import ConfigDict, JsonValue
 
+M = TypeVar("M", bound=BaseModel)
+
 
 def get_examples(config: ConfigDict) -> list[JsonValue]:
     """Get examples from model config."""
@@ -27,3 +31,13 @@ def extend_examples(
 ) -> JsonValue:
     """Get and extend examples from model config."""
     return [cast("dict[str, Any]", e) | example for e in get_examples(config)]
+
+
+def project(model: BaseModel, target: type[M]) -> M:  # ruff: ignore[non-pep695-generic-function]
+    """Project a model to a model with a subset of its fields.
+
+    Field values are validated as they are instead of dumping the model first,
+    so nested models are reused without being serialized and validated again.
+    """
+    values = model.__dict__
+    return target.model_validate({name: values[name] for name in target.model_fields})
@@ -8,7 +8,7 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict
 
-from . import extend_examples, get_examples
+from . import extend_examples, get_examples, project
 
 
 class AlertType(StrEnum):
@@ -96,8 +96,7 @@ class AlertAreaWithPolygon(AlertArea):
 
     def base(self) -> AlertArea:
         """Return an instance of AlertArea."""
-        data = self.model_dump(exclude={"polyons"})
-        return AlertArea.model_validate(data)
+        return project(self, AlertArea)
 
     model_config = ConfigDict(
         title="Alert area with polygons",
@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict
 
 from vremenar.models.common import Coordinate
 
-from . import extend_examples, get_examples
+from . import extend_examples, get_examples, project
 
 
 class StationBase(BaseModel):
@@ -37,8 +37,7 @@ class StationInfo(StationBase):
 
     def base(self) -> StationBase:
         """Return an instance of StationBase."""
-        data = self.model_dump(include={"id"})
-        return StationBase.model_validate(data)
+        return project(self, StationBase)
 
     model_config = ConfigDict(
         title="Weather station information",
@@ -64,8 +63,7 @@ class StationInfoExtended(StationInfo):
 
     def info(self) -> StationInfo:
         """Return an instance of StationInfo."""
-        data = self.model_dump(exclude={"metadata"})
-        return StationInfo.model_validate(data)
+        return project(self, StationInfo)
 
     model_config = ConfigDict(title="Weather station extended information")
 
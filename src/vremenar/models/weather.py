@@ -3,6 +3,7 @@
 from pydantic import BaseModel, ConfigDict
 
 from vremenar.definitions import ObservationType
+from vremenar.models.common import Coordinate
 from vremenar.models.stations import StationBase, StationInfo
 
 
@@ -83,6 +84,15 @@ class WeatherInfoExtended(WeatherInfo):
     )
 
 
+class StationForecast(BaseModel):
+    """Station forecast model."""
+
+    station: StationInfo
+    conditions: list[WeatherCondition]
+
+    model_config = ConfigDict(title="Station forecast")
+
+
 class WeatherDetails(BaseModel):
     """Weather details model."""
 
@@ -91,3 +101,13 @@ class WeatherDetails(BaseModel):
     statistics: WeatherStatistics
 
     model_config = ConfigDict(title="Weather details")
+
+
+class PointForecast(BaseModel):
+    """Point forecast model."""
+
+    coordinate: Coordinate
+    stations: list[StationBase]
+    conditions: list[WeatherCondition]
+
+    model_config = ConfigDict(title="Point forecast")
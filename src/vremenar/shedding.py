@@ -0,0 +1,179 @@
+"""Concurrency limits and load shedding.
+
+Routes are grouped by their cost and every group has its own limit of
+concurrently handled requests, so cheap routes stay fast while heavy map
+rendering is saturated. Requests over the limit wait in a queue. A request
+is rejected with 503 when it waits longer than the queue target, or
+immediately when recent requests of the group have been waiting that long.
+"""
+
+from __future__ import annotations
+
+from asyncio import Semaphore, timeout
+from os import getenv
+from time import perf_counter
+from typing import TYPE_CHECKING, TypedDict
+
+from starlette.responses import JSONResponse
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+QUEUE_TARGET: float = float(getenv("VREMENAR_QUEUE_TARGET", "0.1"))
+QUEUE_DELAY_SMOOTHING = 0.1
+RETRY_AFTER = 1  # seconds
+
+
+def parse_limits(value: str) -> dict[str, int]:
+    """Parse comma-separated `group=limit` concurrency limits."""
+    limits: dict[str, int] = {}
+    for item in value.split(","):
+        group, _, limit = item.strip().partition("=")
+        if group and limit:
+            limits[group] = int(limit)
+    return limits
+
+
+CONCURRENCY_LIMITS: dict[str, int] = {
+    "light": 256,
+    "default": 64,
+    "maps": 16,
+    **parse_limits(getenv("VREMENAR_CONCURRENCY_LIMITS", "")),
+}
+
+# route path prefixes and their groups, the longest prefix matches,
+# routes without a group are not limited
+ROUTE_GROUPS: dict[str, str | None] = {
+    "/health": None,
+    "/alerts/stream": None,
+    "/version": "light",
+    "/copyright": "light",
+    "/maps/types": "light",
+    "/maps/legend": "light",
+    "/maps/list": "maps",
+    "/stations/map": "maps",
+    "/stations/point": "maps",
+}
+
+
+class LimiterStats(TypedDict):
+    """Concurrency limiter statistics."""
+
+    group: str
+    limit: int
+    active: int
+    waiting: int
+    queued: int
+    shed: int
+    delay: float
+
+
+class ConcurrencyLimiter:
+    """Concurrency limit of a route group with queue-time based shedding."""
+
+    def __init__(self, group: str, limit: int, target: float = QUEUE_TARGET) -> None:
+        """Initialise limiter."""
+        self.group = group
+        self.limit = limit
+        self.target = target
+        self.active: int = 0
+        self.waiting: int = 0
+        self.queued: int = 0
+        self.shed: int = 0
+        self.delay: float = 0
+        self._semaphore = Semaphore(limit)
+
+    def _measure(self, wait: float) -> None:
+        """Update the smoothed queue delay."""
+        self.delay += QUEUE_DELAY_SMOOTHING * (wait - self.delay)
+
+    async def acquire(self) -> bool:
+        """Acquire a slot, returning `False` if the request should be shed."""
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self._measure(0)
+            self.active += 1
+            return True
+
+        # the queue is not draining fast enough, reject early
+        if self.delay >= self.target:
+            self.shed += 1
+            return False
+
+        self.queued += 1
+        self.waiting += 1
+        start = perf_counter()
+        try:
+            async with timeout(self.target):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            self._measure(self.target)
+            self.shed += 1
+            return False
+        finally:
+            self.waiting -= 1
+
+        self._measure(perf_counter() - start)
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        """Release a slot."""
+        self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> LimiterStats:
+        """Get limiter statistics."""
+        return LimiterStats(
+            group=self.group,
+            limit=self.limit,
+            active=self.active,
+            waiting=self.waiting,
+            queued=self.queued,
+            shed=self.shed,
+            delay=round(self.delay * 1000, 3),
+        )
+
+
+limiters: dict[str, ConcurrencyLimiter] = {
+    group: ConcurrencyLimiter(group, limit)
+    for group, limit in CONCURRENCY_LIMITS.items()
+}
+
+
+def route_group(path: str) -> str | None:
+    """Get concurrency group of a route path."""
+    prefixes = [prefix for prefix in ROUTE_GROUPS if path.startswith(prefix)]
+    if not prefixes:
+        return "default"
+    return ROUTE_GROUPS[max(prefixes, key=len)]
+
+
+class ConcurrencyMiddleware:
+    """Limit concurrent HTTP requests per route group."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialise middleware."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle request within the limit of its group."""
+        group = route_group(scope["path"]) if scope["type"] == "http" else None
+        limiter = limiters.get(group) if group is not None else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            response = JSONResponse(
+                {"detail": "Server is overloaded"},
+                status_code=503,
+                headers={"Retry-After": str(RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
@@ -12,6 +12,9 @@ from .wrapper import (
     list_alerts,
     list_alerts_for_critera,
     list_stations,
+    point_forecast,
+    render_alerts_for_critera,
+    station_forecast,
     station_weather_details,
 )
 
@@ -27,5 +30,8 @@ __all__ = [
     "list_alerts",
     "list_alerts_for_critera",
     "list_stations",
+    "point_forecast",
+    "render_alerts_for_critera",
+    "station_forecast",
     "station_weather_details",
 ]
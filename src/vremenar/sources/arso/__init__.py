@@ -11,6 +11,7 @@ from .stations import (
     current_station_condition,
     find_station,
     list_stations,
+    station_forecast,
     station_weather_details,
 )
 
@@ -28,5 +29,6 @@ __all__ = [
     "get_supported_map_types",
     "get_weather_map",
     "list_stations",
+    "station_forecast",
     "station_weather_details",
 ]
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import operator
+from functools import cache
+from typing import TYPE_CHECKING
 
-from vremenar.definitions import ObservationType
+from vremenar.definitions import CountryID, ObservationType
 from vremenar.exceptions import UnrecognisedMapIDException, UnsupportedMapTypeException
 from vremenar.models.maps import (
     MapLayer,
@@ -20,15 +22,18 @@ from vremenar.utils import logger
 from .utils import (
     get_map_data,
     get_map_ids_for_type,
-    get_weather_ids_for_timestamp,
-    get_weather_records,
+    get_weather_records_for_timestamp,
     parse_record,
 )
 
+if TYPE_CHECKING:
+    from vremenar.viewport import Viewport
 
-def get_supported_map_types() -> list[SupportedMapType]:
-    """Get ARSO supported map types."""
-    return [
+
+@cache
+def supported_map_types() -> tuple[SupportedMapType, ...]:
+    """Build ARSO supported map types once."""
+    return (
         SupportedMapType(
             map_type=MapType.WeatherCondition,
             rendering=MapRenderingType.Icons,
@@ -62,7 +67,13 @@ def get_supported_map_types() -> list[SupportedMapType]:
             rendering=MapRenderingType.Image,
             has_legend=True,
         ),
-    ]
+    )
+
+
+def get_supported_map_types() -> list[SupportedMapType]:
+    """Get ARSO supported map types."""
+    # cached models are shared, callers get their own copies
+    return [map_type.model_copy() for map_type in supported_map_types()]
 
 
 async def get_map_layers(map_type: MapType) -> tuple[list[MapLayer], list[float]]:
@@ -93,8 +104,9 @@ async def get_map_layers(map_type: MapType) -> tuple[list[MapLayer], list[float]
     return layers, bbox
 
 
-def get_map_legend(map_type: MapType) -> MapLegend:
-    """Get ARSO map legend."""
+@cache
+def map_legend(map_type: MapType) -> MapLegend:
+    """Build ARSO map legend once."""
     if map_type == MapType.PrecipitationGlobal:
         raise UnsupportedMapTypeException
 
@@ -198,26 +210,36 @@ def get_map_legend(map_type: MapType) -> MapLegend:
     raise UnsupportedMapTypeException
 
 
+def get_map_legend(map_type: MapType) -> MapLegend:
+    """Get ARSO map legend."""
+    return map_legend(map_type).model_copy(deep=True)
+
+
 def get_all_map_legends() -> list[MapLegend]:
     """Get all ARSO map legends."""
-    supported = get_supported_map_types()
+    supported = supported_map_types()
     return [get_map_legend(t.map_type) for t in supported if t.has_legend]
 
 
-async def get_weather_map(map_id: str) -> list[WeatherInfoExtended]:
-    """Get weather map from ID."""
+async def get_weather_map(
+    map_id: str,
+    viewport: Viewport | None = None,
+) -> list[WeatherInfoExtended]:
+    """Get weather map from ID, optionally only for stations in a viewport."""
     timestamp = map_id
 
     logger.debug("ARSO weather timestamp: %s", timestamp)
 
-    ids: set[str] = await get_weather_ids_for_timestamp(timestamp)
-    if not ids:
+    records = await get_weather_records_for_timestamp(timestamp)
+    if not records:
         raise UnrecognisedMapIDException
 
-    records = await get_weather_records(ids)
+    station_ids = await viewport.station_ids(CountryID.Slovenia) if viewport else None
 
     conditions_list = []
     for record in records:
+        if station_ids is not None and record["station_id"] not in station_ids:
+            continue
         station, condition = await parse_record(
             record,
             ObservationType.Recent if map_id == "current" else ObservationType.Forecast,
@@ -228,4 +250,6 @@ async def get_weather_map(map_id: str) -> list[WeatherInfoExtended]:
             WeatherInfoExtended(station=station, condition=condition),  # ty: ignore[invalid-argument-type]
         )
 
-    return conditions_list
+    if viewport is None:
+        return conditions_list
+    return await viewport.clustered(CountryID.Slovenia, conditions_list)
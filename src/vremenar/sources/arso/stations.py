@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from vremenar.database.stations import get_stations, search_stations
 from vremenar.definitions import CountryID, ObservationType
 from vremenar.exceptions import InvalidSearchQueryException, UnknownStationException
 from vremenar.models.weather import (
+    StationForecast,
     WeatherCondition,
     WeatherDetails,
     WeatherInfoExtended,
     WeatherStatistics,
 )
+from vremenar.utils import task_group, to_timestamp
 
 from .utils import (
+    RECORD_FIELDS,
     generate_statistics,
-    get_weather_ids_for_station,
+    get_forecast_records_for_station,
     get_weather_records,
+    get_weather_records_for_station,
     parse_record,
 )
 
@@ -31,7 +36,7 @@ if TYPE_CHECKING:
 
 async def list_stations() -> list[StationInfoExtended]:
     """List ARSO weather stations."""
-    stations = await get_stations(CountryID.Slovenia)  # ty: ignore[too-many-positional-arguments]
+    stations = await get_stations(CountryID.Slovenia)
     return list(stations.values())
 
 
@@ -52,12 +57,15 @@ async def find_station(query: StationSearchModel) -> list[StationInfo]:
 
 async def current_station_condition(station_id: str) -> WeatherInfoExtended:
     """Get current station weather condition."""
-    stations = await get_stations(CountryID.Slovenia)  # ty: ignore[too-many-positional-arguments]
+    stations = await get_stations(CountryID.Slovenia)
     station: StationInfoExtended | None = stations.get(station_id, None)
     if not station:
         raise UnknownStationException
 
-    records = await get_weather_records({f"arso:weather:current:{station_id}"})
+    records = await get_weather_records(
+        {f"arso:weather:current:{station_id}"},
+        RECORD_FIELDS,
+    )
 
     for record in records:
         if not record:  # pragma: no cover
@@ -74,15 +82,22 @@ async def current_station_condition(station_id: str) -> WeatherInfoExtended:
 
 async def station_weather_details(station_id: str) -> WeatherDetails:
     """Get detailed weather information for a station."""
-    stations = await get_stations(CountryID.Slovenia)  # ty: ignore[too-many-positional-arguments]
+    stations = await get_stations(CountryID.Slovenia)
     station: StationInfoExtended | None = stations.get(station_id, None)
     if not station:
         raise UnknownStationException
 
-    records = await get_weather_records({f"arso:weather:current:{station_id}"})
+    # the station history is scanned only for known stations
+    async with task_group() as group:
+        records_task = group.create_task(
+            get_weather_records({f"arso:weather:current:{station_id}"}, RECORD_FIELDS),
+        )
+        records_48h_task = group.create_task(
+            get_weather_records_for_station(station_id),
+        )
 
     condition: WeatherCondition | None = None
-    for record in records:
+    for record in records_task.result():
         if not record:  # pragma: no cover
             continue
 
@@ -93,8 +108,25 @@ async def station_weather_details(station_id: str) -> WeatherDetails:
     if not condition:  # pragma: no cover
         raise UnknownStationException
 
-    record_ids = await get_weather_ids_for_station(station_id)
-    records_48h = await get_weather_records(record_ids)
-    statistics: WeatherStatistics = generate_statistics(records_48h)
+    statistics: WeatherStatistics = generate_statistics(records_48h_task.result())
 
     return WeatherDetails(station=station, condition=condition, statistics=statistics)
+
+
+async def station_forecast(station_id: str) -> StationForecast:
+    """Get ARSO forecast timeline for a station."""
+    stations = await get_stations(CountryID.Slovenia)
+    station: StationInfoExtended | None = stations.get(station_id, None)
+    if not station:
+        raise UnknownStationException
+
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    records = await get_forecast_records_for_station(station_id, to_timestamp(now))
+
+    conditions: list[WeatherCondition] = []
+    for record in records:
+        _, condition = await parse_record(record, ObservationType.Forecast)
+        if condition:
+            conditions.append(condition)
+
+    return StationForecast(station=station.info(), conditions=conditions)
@@ -6,24 +6,42 @@ from datetime import UTC, datetime, timedelta
 from statistics import mean
 from typing import TYPE_CHECKING, Any
 
-from vremenar.database.redis import redis
+from vremenar.database.near_cache import near_cache
+from vremenar.database.packed import PACKED_RECORDS, ColumnType, get_packed_records
+from vremenar.database.replicas import replica_read
+from vremenar.database.scripts import REDIS_SCRIPTS, hmget_members, hmget_range
 from vremenar.database.stations import get_stations
 from vremenar.definitions import CountryID, ObservationType
 from vremenar.models.weather import WeatherCondition, WeatherStatistics
-from vremenar.utils import chunker
 
 if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
     from vremenar.models.maps import MapType
     from vremenar.models.stations import StationBase, StationInfoExtended
 
 
-async def get_weather_ids_for_timestamp(timestamp: str) -> set[str]:
+# fields used by `parse_record` and `generate_statistics`
+# and their packed column types
+RECORD_SCHEMA: dict[str, ColumnType] = {
+    "station_id": ColumnType.Text,
+    "timestamp": ColumnType.Text,
+    "icon": ColumnType.Text,
+    "temperature": ColumnType.Number,
+    "temperature_low": ColumnType.Number,
+}
+RECORD_FIELDS: tuple[str, ...] = tuple(RECORD_SCHEMA)
+
+
+@replica_read
+async def get_weather_ids_for_timestamp(redis: Redis[str], timestamp: str) -> set[str]:
     """Get ARSO weather IDs for timestamp from redis."""
     ids: set[str] = await redis.smembers(f"arso:weather:{timestamp}")
     return ids
 
 
-async def get_weather_ids_for_station(station_id: str) -> set[str]:
+@replica_read
+async def get_weather_ids_for_station(redis: Redis[str], station_id: str) -> set[str]:
     """Get ARSO weather IDs for station from redis."""
     ids: set[str] = {
         weather_id
@@ -35,22 +53,81 @@ async def get_weather_ids_for_station(station_id: str) -> set[str]:
     return ids
 
 
-async def get_weather_records(ids: set[str]) -> list[dict[str, Any]]:
-    """Get ARSO weather records from redis."""
-    result: list[dict[str, Any]] = []
-
-    async with redis.client() as connection:
-        for batch in chunker(list(ids), 100):
-            async with connection.pipeline(transaction=False) as pipeline:
-                for record_id in batch:
-                    pipeline.hgetall(record_id)
-                response = await pipeline.execute()
-            result.extend(response)
+@replica_read
+async def get_forecast_ids_for_station(
+    redis: Redis[str],
+    station_id: str,
+    start: str,
+) -> set[str]:
+    """Get ARSO forecast IDs for station from a timestamp on from redis."""
+    ids: list[str] = await redis.zrangebyscore(
+        f"arso:weather:station:{station_id}",
+        start,
+        "+inf",
+    )
+    return set(ids)
+
+
+@replica_read
+async def get_weather_records(
+    redis: Redis[str],
+    ids: set[str],
+    fields: tuple[str, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """Get ARSO weather records or only their fields from redis."""
+    return await near_cache.hgetall(redis, list(ids), fields)
+
+
+async def get_weather_records_for_timestamp(
+    timestamp: str,
+    *,
+    scripts: bool = REDIS_SCRIPTS,
+    packed: bool = PACKED_RECORDS,
+) -> list[dict[str, Any]]:
+    """Get ARSO weather records for timestamp from redis."""
+    if packed:
+        records = await get_packed_records(f"arso:weather_packed:{timestamp}")
+        if records is not None:
+            return records
+
+    if scripts:
+        return await hmget_members(f"arso:weather:{timestamp}", RECORD_FIELDS)
+
+    ids = await get_weather_ids_for_timestamp(timestamp)
+    return await get_weather_records(ids, RECORD_FIELDS)
+
+
+async def get_weather_records_for_station(station_id: str) -> list[dict[str, Any]]:
+    """Get ARSO weather records of the last 48 hours for station from redis."""
+    ids = await get_weather_ids_for_station(station_id)
+    return await get_weather_records(ids, RECORD_FIELDS)
+
+
+async def get_forecast_records_for_station(
+    station_id: str,
+    start: str,
+    *,
+    scripts: bool = REDIS_SCRIPTS,
+) -> list[dict[str, Any]]:
+    """Get ARSO forecast records for station from a timestamp on from redis."""
+    if scripts:
+        records = await hmget_range(
+            f"arso:weather:station:{station_id}",
+            start,
+            RECORD_FIELDS,
+        )
+    else:
+        ids = await get_forecast_ids_for_station(station_id, start)
+        records = await get_weather_records(ids, RECORD_FIELDS)
 
-    return result
+    return sorted(
+        (record for record in records if record),
+        key=lambda record: int(record["timestamp"]),
+    )
 
 
-async def get_map_ids_for_type(map_type: MapType) -> list[str]:
+@replica_read
+async def get_map_ids_for_type(redis: Redis[str], map_type: MapType) -> list[str]:
     """Get ARSO map IDs for type from redis."""
     ids: list[str] = [
         map_id
@@ -62,7 +139,8 @@ async def get_map_ids_for_type(map_type: MapType) -> list[str]:
     return ids
 
 
-async def get_map_data(ids: list[str]) -> list[dict[str, Any]]:
+@replica_read
+async def get_map_data(redis: Redis[str], ids: list[str]) -> list[dict[str, Any]]:
     """Get ARSO map data from redis."""
     result: list[dict[str, Any]] = []
 
@@ -84,7 +162,7 @@ async def parse_record(
 ) -> tuple[StationBase | None, WeatherCondition | None]:
     """Parse ARSO weather record."""
     station_id = record["station_id"]
-    stations = await get_stations(CountryID.Slovenia)  # ty: ignore[too-many-positional-arguments]
+    stations = await get_stations(CountryID.Slovenia)
 
     if station_id not in stations:  # pragma: no cover
         return None, None
@@ -7,7 +7,13 @@ from .maps import (
     get_supported_map_types,
     get_weather_map,
 )
-from .stations import current_station_condition, find_station, list_stations
+from .point import point_forecast
+from .stations import (
+    current_station_condition,
+    find_station,
+    list_stations,
+    station_forecast,
+)
 
 DWD_NAME = "Deutscher Wetterdienst"
 DWD_URL = "https://dwd.de"
@@ -23,4 +29,6 @@ __all__ = [
     "get_supported_map_types",
     "get_weather_map",
     "list_stations",
+    "point_forecast",
+    "station_forecast",
 ]
@@ -0,0 +1,365 @@
+"""DWD columnar weather condition frames.
+
+A frame holds the MOSMIX conditions of all active stations for a single
+timestamp in typed arrays. All frames share the station order of a station
+snapshot, so a station has the same position in every frame.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import partial
+from heapq import nsmallest
+from math import isnan, nan
+from operator import itemgetter
+from os import getenv
+from typing import TYPE_CHECKING, Any
+
+from vremenar.cache import cached
+from vremenar.database.invalidation import invalidation
+from vremenar.database.stations import get_stations
+from vremenar.definitions import CountryID, ObservationType
+from vremenar.exceptions import UnrecognisedMapIDException
+from vremenar.models.weather import WeatherCondition, WeatherInfoExtended
+from vremenar.units import kelvin_to_celsius
+from vremenar.utils import distance, logger, parse_timestamp
+
+from .utils import get_icon, get_mosmix_records
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from vremenar.models.common import Coordinate
+    from vremenar.models.stations import StationInfoExtended
+
+FRAMES_SIZE: int = int(getenv("VREMENAR_DWD_FRAMES", "48"))
+FRAMES_TTL = 300  # seconds
+
+KM_PER_DEGREE = 111.2
+LAPSE_RATE = 0.0065  # degrees Celsius per metre
+
+# condition codes, other conditions are stored as -1
+CONDITIONS: tuple[str, ...] = (
+    "dry",
+    "fog",
+    "rain",
+    "sleet",
+    "snow",
+    "hail",
+    "thunderstorm",
+)
+CONDITION_CODES: dict[str, int] = {name: code for code, name in enumerate(CONDITIONS)}
+
+
+def parse_value(value: str | float | None) -> float:
+    """Parse a MOSMIX record value, empty or missing values are NaN."""
+    return float(value) if value else nan
+
+
+class StationIndex:
+    """Active stations of a station snapshot in a stable order."""
+
+    __slots__ = (
+        "altitude",
+        "latitude",
+        "longitude",
+        "positions",
+        "snapshot",
+        "sorted_latitude",
+        "sorted_longitude",
+        "sorted_positions",
+        "stations",
+    )
+
+    def __init__(self, snapshot: dict[str, StationInfoExtended]) -> None:
+        """Initialise station index."""
+        self.snapshot = snapshot
+        self.stations: tuple[StationInfoExtended, ...] = tuple(
+            station
+            for station in snapshot.values()
+            if station.metadata and station.metadata["status"] == "1"
+        )
+        self.positions: dict[str, int] = {
+            station.id: position for position, station in enumerate(self.stations)
+        }
+        self.latitude = array("d", (s.coordinate.latitude for s in self.stations))
+        self.longitude = array("d", (s.coordinate.longitude for s in self.stations))
+        self.altitude = array(
+            "d",
+            (
+                nan if s.coordinate.altitude is None else s.coordinate.altitude
+                for s in self.stations
+            ),
+        )
+        # coordinates ordered by latitude for neighbour searches
+        order = sorted(range(len(self.stations)), key=self.latitude.__getitem__)
+        self.sorted_positions = array("l", order)
+        self.sorted_latitude = array("d", (self.latitude[p] for p in order))
+        self.sorted_longitude = array("d", (self.longitude[p] for p in order))
+
+    def __len__(self) -> int:
+        """Get number of stations."""
+        return len(self.stations)
+
+    def neighbours(
+        self,
+        coordinate: Coordinate,
+        count: int,
+        radius: float,
+    ) -> list[tuple[int, float]]:
+        """Get positions and inverse-distance weights of the nearest stations.
+
+        Only stations within the latitude band of the radius are measured.
+        """
+        latitude = coordinate.latitude
+        band = radius / KM_PER_DEGREE
+        start = bisect_left(self.sorted_latitude, latitude - band)
+        end = bisect_right(self.sorted_latitude, latitude + band)
+        distances = zip(
+            self.sorted_positions[start:end],
+            map(
+                partial(distance, latitude, coordinate.longitude),
+                self.sorted_latitude[start:end],
+                self.sorted_longitude[start:end],
+            ),
+            strict=True,
+        )
+        nearest = nsmallest(
+            count,
+            ((position, d) for position, d in distances if d <= radius),
+            key=itemgetter(1),
+        )
+        # stations closer than 10 m are treated as exact matches
+        return [(position, 1 / max(d, 0.01) ** 2) for position, d in nearest]
+
+
+class ConditionFrame:
+    """Weather conditions of all stations at a timestamp.
+
+    Temperatures are in degrees Celsius, cloud cover in percent and
+    precipitation in mm per hour. Stations without a record have a NaN
+    temperature.
+    """
+
+    __slots__ = (
+        "cloud_cover",
+        "condition",
+        "index",
+        "precipitation",
+        "temperature",
+        "time",
+        "timestamp",
+    )
+
+    def __init__(self, index: StationIndex, timestamp: str) -> None:
+        """Initialise an empty frame."""
+        self.index = index
+        self.timestamp = timestamp
+        self.time = parse_timestamp(timestamp)
+        self.temperature = array("d", [nan]) * len(index)
+        self.cloud_cover = array("d", [nan]) * len(index)
+        self.precipitation = array("d", [nan]) * len(index)
+        self.condition = array("b", [-1]) * len(index)
+
+    @classmethod
+    def from_records(
+        cls,
+        index: StationIndex,
+        timestamp: str,
+        records: list[dict[str, Any]],
+    ) -> ConditionFrame:
+        """Create a frame from MOSMIX records."""
+        frame = cls(index, timestamp)
+        for record in records:
+            position = index.positions.get(record["station_id"])
+            if position is None or "temperature" not in record:
+                continue
+            frame.temperature[position] = kelvin_to_celsius(
+                float(record["temperature"]),
+            )
+            frame.cloud_cover[position] = parse_value(record.get("cloud_cover"))
+            frame.precipitation[position] = parse_value(
+                record.get("precipitation_60", record.get("precipitation")),
+            )
+            frame.condition[position] = CONDITION_CODES.get(
+                record.get("condition", ""),
+                -1,
+            )
+        return frame
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the frame columns in bytes."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self.temperature,
+                self.cloud_cover,
+                self.precipitation,
+                self.condition,
+            )
+        )
+
+    def weather(self, position: int) -> dict[str, Any]:
+        """Get weather data of a station for icon selection."""
+        code = self.condition[position]
+        cloud_cover = self.cloud_cover[position]
+        precipitation = self.precipitation[position]
+        return {
+            "condition": CONDITIONS[code] if code >= 0 else None,
+            "cloud_cover": 0 if isnan(cloud_cover) else cloud_cover,
+            "precipitation": 0 if isnan(precipitation) else precipitation,
+        }
+
+    def condition_at(
+        self,
+        position: int,
+        observation: ObservationType,
+    ) -> WeatherCondition | None:
+        """Get weather condition of a station by its position."""
+        temperature = self.temperature[position]
+        if isnan(temperature):
+            return None
+
+        return WeatherCondition(
+            observation=observation,
+            timestamp=self.timestamp,
+            icon=get_icon(
+                self.weather(position),
+                self.index.stations[position].coordinate,
+                self.time,
+            ),
+            temperature=temperature,
+        )
+
+    def get(
+        self,
+        station_id: str,
+        observation: ObservationType,
+    ) -> WeatherCondition | None:
+        """Get weather condition of a station."""
+        position = self.index.positions.get(station_id)
+        if position is None:
+            return None
+        return self.condition_at(position, observation)
+
+    def interpolate(
+        self,
+        neighbours: list[tuple[int, float]],
+        coordinate: Coordinate,
+        observation: ObservationType,
+    ) -> WeatherCondition | None:
+        """Interpolate weather condition from weighted neighbour stations.
+
+        Temperatures are corrected for the altitude difference if known.
+        The condition type is taken from the closest station with data.
+        """
+        weights = [(p, w) for p, w in neighbours if not isnan(self.temperature[p])]
+        if not weights:
+            return None
+
+        total = sum(weight for _, weight in weights)
+        temperature = cloud_cover = precipitation = 0.0
+        for position, weight in weights:
+            station_temperature = self.temperature[position]
+            station_altitude = self.index.altitude[position]
+            if coordinate.altitude is not None and not isnan(station_altitude):
+                station_temperature -= LAPSE_RATE * (
+                    coordinate.altitude - station_altitude
+                )
+            weather = self.weather(position)
+            temperature += weight * station_temperature
+            cloud_cover += weight * weather["cloud_cover"]
+            precipitation += weight * weather["precipitation"]
+
+        closest = max(weights, key=itemgetter(1))[0]
+        weather = {
+            "condition": self.weather(closest)["condition"],
+            "cloud_cover": cloud_cover / total,
+            "precipitation": precipitation / total,
+        }
+        return WeatherCondition(
+            observation=observation,
+            timestamp=self.timestamp,
+            icon=get_icon(weather, coordinate, self.time),
+            temperature=round(temperature / total, 2),
+        )
+
+    def weather_map(
+        self,
+        observation: ObservationType,
+        station_ids: set[str] | None = None,
+    ) -> list[WeatherInfoExtended]:
+        """Get weather conditions of all or only the selected stations."""
+        positions: Iterable[int] = range(len(self.index))
+        if station_ids is not None:
+            positions = sorted(
+                self.index.positions[station_id]
+                for station_id in station_ids
+                if station_id in self.index.positions
+            )
+
+        conditions_list: list[WeatherInfoExtended] = []
+        for position in positions:
+            station = self.index.stations[position]
+            condition = self.condition_at(position, observation)
+            if condition is None:
+                continue
+            conditions_list.append(
+                WeatherInfoExtended(station=station, condition=condition),
+            )
+        return conditions_list
+
+
+class ConditionFrames:
+    """Condition frames of recently used timestamps."""
+
+    def __init__(self, size: int = FRAMES_SIZE, ttl: float = FRAMES_TTL) -> None:
+        """Initialise frames."""
+        self.index: StationIndex | None = None
+        self.cache = cached(
+            "dwd_frames",
+            ttl=ttl,
+            size=size,
+            sizeof=lambda frame: frame.nbytes,
+        )(self._load)
+
+    async def station_index(self) -> StationIndex:
+        """Get index of the current station snapshot."""
+        snapshot = await get_stations(CountryID.Germany)
+        if self.index is None or self.index.snapshot is not snapshot:
+            self.index = StationIndex(snapshot)
+        return self.index
+
+    async def _load(self, timestamp: str) -> ConditionFrame:
+        """Load frame for timestamp."""
+        records = await get_mosmix_records(timestamp)
+        if not records:
+            raise UnrecognisedMapIDException
+
+        frame = ConditionFrame.from_records(
+            await self.station_index(),
+            timestamp,
+            records,
+        )
+        logger.debug(
+            "Loaded DWD frame %s with %s stations (%s bytes)",
+            timestamp,
+            len(records),
+            frame.nbytes,
+        )
+        return frame
+
+    async def get(self, timestamp: str) -> ConditionFrame:
+        """Get frame for timestamp, aligned to the current station snapshot."""
+        index = await self.station_index()
+        frame = await self.cache(timestamp)
+        if frame.index is not index:
+            self.cache.invalidate(timestamp)
+            frame = await self.cache(timestamp)
+        return frame
+
+
+frames = ConditionFrames()
+invalidation.register_cache("mosmix", frames.cache)
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from functools import cache
+from typing import TYPE_CHECKING
 
 from httpx2 import AsyncClient
 
+from vremenar.deadline import bounded
 from vremenar.definitions import CountryID, ObservationType
 from vremenar.exceptions import UnrecognisedMapIDException, UnsupportedMapTypeException
 from vremenar.models.maps import (
@@ -19,7 +22,11 @@ from vremenar.models.maps import (
 from vremenar.models.weather import WeatherInfoExtended
 from vremenar.utils import logger, to_timestamp
 
-from .utils import get_mosmix_ids_for_timestamp, get_weather_records, parse_record
+from .frames import FRAMES_SIZE, frames
+from .utils import get_mosmix_records, parse_record
+
+if TYPE_CHECKING:
+    from vremenar.viewport import Viewport
 
 MAPS_BASEURL = (
     "https://maps.dwd.de/geoserver/dwd/ows"
@@ -31,9 +38,10 @@ MESSAGE_MAP_URL = "DWD Map URL: %s"
 MESSAGE_NOT_AVAILABLE_YET = "Map not available yet"
 
 
-def get_supported_map_types() -> list[SupportedMapType]:
-    """Get DWD supported map types."""
-    return [
+@cache
+def supported_map_types() -> tuple[SupportedMapType, ...]:
+    """Build DWD supported map types once."""
+    return (
         SupportedMapType(
             map_type=MapType.WeatherCondition,
             rendering=MapRenderingType.Icons,
@@ -63,7 +71,13 @@ def get_supported_map_types() -> list[SupportedMapType]:
             rendering=MapRenderingType.Tiles,
             has_legend=True,
         ),
-    ]
+    )
+
+
+def get_supported_map_types() -> list[SupportedMapType]:
+    """Get DWD supported map types."""
+    # cached models are shared, callers get their own copies
+    return [map_type.model_copy() for map_type in supported_map_types()]
 
 
 def get_map_condition() -> tuple[list[MapLayer], list[float]]:
@@ -151,7 +165,7 @@ async def get_map_precipitation() -> tuple[list[MapLayer], list[float]]:
 
     logger.debug(MESSAGE_MAP_URL, test_url)
 
-    async with AsyncClient() as client:
+    async with AsyncClient() as client, bounded():
         response = await client.get(test_url, timeout=MAPS_TIMEOUT)
 
     if "InvalidDimensionValue" in response.text:  # pragma: no cover
@@ -225,7 +239,7 @@ async def get_map_temperature() -> tuple[list[MapLayer], list[float]]:
 
     logger.debug(MESSAGE_MAP_URL, test_url)
 
-    async with AsyncClient() as client:
+    async with AsyncClient() as client, bounded():
         response = await client.get(test_url, timeout=MAPS_TIMEOUT)
 
     if "InvalidDimensionValue" in response.text:  # pragma: no cover
@@ -275,7 +289,7 @@ async def get_map_uv(map_type: MapType) -> tuple[list[MapLayer], list[float]]:
 
     logger.debug(MESSAGE_MAP_URL, test_url)
 
-    async with AsyncClient() as client:
+    async with AsyncClient() as client, bounded():
         response = await client.get(test_url, timeout=MAPS_TIMEOUT)
 
     if "InvalidDimensionValue" in response.text:  # pragma: no cover
@@ -323,8 +337,9 @@ async def get_map_layers(map_type: MapType) -> tuple[list[MapLayer], list[float]
     raise UnsupportedMapTypeException
 
 
-def get_map_legend(map_type: MapType) -> MapLegend:
-    """Get DWD map legend."""
+@cache
+def map_legend(map_type: MapType) -> MapLegend:
+    """Build DWD map legend once."""
     if map_type == MapType.PrecipitationGlobal:
         raise UnsupportedMapTypeException
 
@@ -411,14 +426,22 @@ def get_map_legend(map_type: MapType) -> MapLegend:
     raise UnsupportedMapTypeException
 
 
+def get_map_legend(map_type: MapType) -> MapLegend:
+    """Get DWD map legend."""
+    return map_legend(map_type).model_copy(deep=True)
+
+
 def get_all_map_legends() -> list[MapLegend]:
     """Get all DWD map legends."""
-    supported = get_supported_map_types()
+    supported = supported_map_types()
     return [get_map_legend(t.map_type) for t in supported if t.has_legend]
 
 
-async def get_weather_map(map_id: str) -> list[WeatherInfoExtended]:
-    """Get weather map from ID."""
+async def get_weather_map(
+    map_id: str,
+    viewport: Viewport | None = None,
+) -> list[WeatherInfoExtended]:
+    """Get weather map from ID, optionally only for stations in a viewport."""
     timestamp = map_id
     if map_id == "current":
         now = datetime.now(tz=UTC)
@@ -427,22 +450,33 @@ async def get_weather_map(map_id: str) -> list[WeatherInfoExtended]:
 
     logger.debug("DWD MOSMIX timestamp: %s", timestamp)
 
-    ids: set[str] = await get_mosmix_ids_for_timestamp(timestamp)
-    if not ids:
-        raise UnrecognisedMapIDException
+    observation = (
+        ObservationType.Recent if map_id == "current" else ObservationType.Forecast
+    )
+    station_ids = await viewport.station_ids(CountryID.Germany) if viewport else None
+
+    if FRAMES_SIZE:
+        frame = await frames.get(timestamp)
+        conditions = frame.weather_map(observation, station_ids)
+        if viewport is None:
+            return conditions
+        return await viewport.clustered(CountryID.Germany, conditions)
 
-    records = await get_weather_records(ids)
+    records = await get_mosmix_records(timestamp)
+    if not records:
+        raise UnrecognisedMapIDException
 
     conditions_list = []
     for record in records:
-        station, condition = await parse_record(
-            record,
-            ObservationType.Recent if map_id == "current" else ObservationType.Forecast,
-        )
+        if station_ids is not None and record["station_id"] not in station_ids:
+            continue
+        station, condition = await parse_record(record, observation)
         if not station or not condition:  # pragma: no cover
             continue
         conditions_list.append(
             WeatherInfoExtended(station=station, condition=condition),  # ty: ignore[invalid-argument-type]
         )
 
-    return conditions_list
+    if viewport is None:
+        return conditions_list
+    return await viewport.clustered(CountryID.Germany, conditions_list)
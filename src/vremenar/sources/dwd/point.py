@@ -0,0 +1,73 @@
+"""DWD point forecasts."""
+
+from __future__ import annotations
+
+from vremenar.definitions import ObservationType
+from vremenar.exceptions import UnrecognisedMapIDException, UnsupportedLocationException
+from vremenar.models.common import Coordinate
+from vremenar.models.stations import StationBase
+from vremenar.models.weather import PointForecast, WeatherCondition
+
+from .frames import frames
+from .maps import get_map_condition
+
+POINT_NEIGHBOURS = 4
+POINT_RADIUS = 50  # km
+
+
+def _timeline(map_ids: list[str] | None) -> list[tuple[str, ObservationType]]:
+    """Get timestamps and observation types for map IDs of condition layers."""
+    layers, _ = get_map_condition()
+    timeline = {
+        "current" if layer.observation == ObservationType.Recent else layer.timestamp: (
+            layer.timestamp,
+            layer.observation,
+        )
+        for layer in layers
+    }
+    if not map_ids:
+        return list(timeline.values())
+
+    if any(map_id not in timeline for map_id in map_ids):
+        raise UnrecognisedMapIDException
+    return [timeline[map_id] for map_id in dict.fromkeys(map_ids)]
+
+
+async def point_forecast(
+    latitude: float,
+    longitude: float,
+    altitude: float | None = None,
+    map_ids: list[str] | None = None,
+) -> PointForecast:
+    """Get forecast interpolated from the nearest stations.
+
+    Neighbour weights are only computed once for all requested times.
+    Times without data are skipped.
+    """
+    coordinate = Coordinate(latitude=latitude, longitude=longitude, altitude=altitude)
+    index = await frames.station_index()
+    neighbours = index.neighbours(coordinate, POINT_NEIGHBOURS, POINT_RADIUS)
+    if not neighbours:
+        raise UnsupportedLocationException
+
+    conditions: list[WeatherCondition] = []
+    for timestamp, observation in _timeline(map_ids):
+        try:
+            frame = await frames.get(timestamp)
+        except UnrecognisedMapIDException:
+            continue
+        if frame.index is not index:  # pragma: no cover
+            index = frame.index
+            neighbours = index.neighbours(coordinate, POINT_NEIGHBOURS, POINT_RADIUS)
+        condition = frame.interpolate(neighbours, coordinate, observation)
+        if condition is not None:
+            conditions.append(condition)
+
+    if not conditions:
+        raise UnrecognisedMapIDException
+
+    return PointForecast(
+        coordinate=coordinate,
+        stations=[StationBase(id=index.stations[p].id) for p, _ in neighbours],
+        conditions=conditions,
+    )
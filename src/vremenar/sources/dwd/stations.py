@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from vremenar.database.stations import get_stations, search_stations
 from vremenar.definitions import CountryID, ObservationType
 from vremenar.exceptions import InvalidSearchQueryException, UnknownStationException
-from vremenar.models.weather import WeatherInfoExtended
-
-from .utils import get_weather_records, parse_record
+from vremenar.models.weather import (
+    StationForecast,
+    WeatherCondition,
+    WeatherInfoExtended,
+)
+from vremenar.utils import to_timestamp
+
+from .utils import (
+    RECORD_FIELDS,
+    get_mosmix_records_for_station,
+    get_weather_records,
+    parse_record,
+)
 
 if TYPE_CHECKING:
     from vremenar.models.stations import (
@@ -21,7 +32,7 @@ if TYPE_CHECKING:
 
 async def list_stations() -> list[StationInfoExtended]:
     """List DWD weather stations."""
-    stations = await get_stations(CountryID.Germany)  # ty: ignore[too-many-positional-arguments]
+    stations = await get_stations(CountryID.Germany)
     return list(stations.values())
 
 
@@ -64,12 +75,15 @@ async def find_station(
 
 async def current_station_condition(station_id: str) -> WeatherInfoExtended:
     """Get current station weather condition."""
-    stations = await get_stations(CountryID.Germany)  # ty: ignore[too-many-positional-arguments]
+    stations = await get_stations(CountryID.Germany)
     station: StationInfoExtended | None = stations.get(station_id, None)
     if not station or station.forecast_only:
         raise UnknownStationException
 
-    records = await get_weather_records({f"dwd:current:{station_id}"})
+    records = await get_weather_records(
+        {f"dwd:current:{station_id}"},
+        RECORD_FIELDS,
+    )
 
     for record in records:
         if not record:  # pragma: no cover
@@ -82,3 +96,22 @@ async def current_station_condition(station_id: str) -> WeatherInfoExtended:
         return WeatherInfoExtended(station=station, condition=condition)
 
     raise UnknownStationException  # pragma: no cover
+
+
+async def station_forecast(station_id: str) -> StationForecast:
+    """Get MOSMIX forecast timeline for a station."""
+    stations = await get_stations(CountryID.Germany)
+    station: StationInfoExtended | None = stations.get(station_id, None)
+    if not station:
+        raise UnknownStationException
+
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    records = await get_mosmix_records_for_station(station_id, to_timestamp(now))
+
+    conditions: list[WeatherCondition] = []
+    for record in records:
+        _, condition = await parse_record(record, ObservationType.Forecast)
+        if condition:
+            conditions.append(condition)
+
+    return StationForecast(station=station.info(), conditions=conditions)
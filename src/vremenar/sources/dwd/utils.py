@@ -4,38 +4,110 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from vremenar.database.redis import redis
+from vremenar.database.near_cache import near_cache
+from vremenar.database.packed import PACKED_RECORDS, ColumnType, get_packed_records
+from vremenar.database.replicas import replica_read
+from vremenar.database.scripts import REDIS_SCRIPTS, hmget_members, hmget_range
 from vremenar.database.stations import get_stations
 from vremenar.definitions import CountryID, ObservationType
 from vremenar.models.weather import WeatherCondition
 from vremenar.units import kelvin_to_celsius
-from vremenar.utils import chunker, day_or_night, parse_timestamp
+from vremenar.utils import day_or_night, parse_timestamp
 
 if TYPE_CHECKING:
     from datetime import datetime
 
-    from vremenar.models.stations import StationBase, StationInfo, StationInfoExtended
+    from redis.asyncio import Redis
 
+    from vremenar.models.common import Coordinate
+    from vremenar.models.stations import StationBase, StationInfoExtended
 
-async def get_mosmix_ids_for_timestamp(timestamp: str) -> set[str]:
+
+# fields used by `parse_record` and their packed column types
+RECORD_SCHEMA: dict[str, ColumnType] = {
+    "station_id": ColumnType.Text,
+    "timestamp": ColumnType.Text,
+    "temperature": ColumnType.Number,
+    "condition": ColumnType.Text,
+    "cloud_cover": ColumnType.Number,
+    "precipitation": ColumnType.Number,
+    "precipitation_60": ColumnType.Number,
+}
+RECORD_FIELDS: tuple[str, ...] = tuple(RECORD_SCHEMA)
+
+
+@replica_read
+async def get_mosmix_ids_for_timestamp(redis: Redis[str], timestamp: str) -> set[str]:
     """Get MOSMIX IDs for timestamp from redis."""
     ids: set[str] = await redis.smembers(f"mosmix:{timestamp}")
     return ids
 
 
-async def get_weather_records(ids: set[str]) -> list[dict[str, Any]]:
-    """Get weather records from redis."""
-    result: list[dict[str, Any]] = []
-
-    async with redis.client() as connection:
-        for batch in chunker(list(ids), 100):
-            async with connection.pipeline(transaction=False) as pipeline:
-                for record_id in batch:
-                    pipeline.hgetall(record_id)
-                response = await pipeline.execute()
-            result.extend(response)
+@replica_read
+async def get_mosmix_ids_for_station(
+    redis: Redis[str],
+    station_id: str,
+    start: str,
+) -> set[str]:
+    """Get MOSMIX IDs for station from a timestamp on from redis."""
+    ids: list[str] = await redis.zrangebyscore(
+        f"mosmix:station:{station_id}",
+        start,
+        "+inf",
+    )
+    return set(ids)
+
+
+@replica_read
+async def get_weather_records(
+    redis: Redis[str],
+    ids: set[str],
+    fields: tuple[str, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """Get weather records or only their fields from redis."""
+    return await near_cache.hgetall(redis, list(ids), fields)
+
+
+async def get_mosmix_records(
+    timestamp: str,
+    *,
+    scripts: bool = REDIS_SCRIPTS,
+    packed: bool = PACKED_RECORDS,
+) -> list[dict[str, Any]]:
+    """Get MOSMIX records for timestamp from redis."""
+    if packed:
+        records = await get_packed_records(f"mosmix_packed:{timestamp}")
+        if records is not None:
+            return records
+
+    if scripts:
+        return await hmget_members(f"mosmix:{timestamp}", RECORD_FIELDS)
+
+    ids = await get_mosmix_ids_for_timestamp(timestamp)
+    return await get_weather_records(ids, RECORD_FIELDS)
+
+
+async def get_mosmix_records_for_station(
+    station_id: str,
+    start: str,
+    *,
+    scripts: bool = REDIS_SCRIPTS,
+) -> list[dict[str, Any]]:
+    """Get MOSMIX records for station from a timestamp on from redis."""
+    if scripts:
+        records = await hmget_range(
+            f"mosmix:station:{station_id}",
+            start,
+            RECORD_FIELDS,
+        )
+    else:
+        ids = await get_mosmix_ids_for_station(station_id, start)
+        records = await get_weather_records(ids, RECORD_FIELDS)
 
-    return result
+    return sorted(
+        (record for record in records if record),
+        key=lambda record: int(record["timestamp"]),
+    )
 
 
 def get_icon_base(weather: dict[str, Any]) -> str:
@@ -89,7 +161,7 @@ def get_icon_condition(weather: dict[str, Any]) -> str | None:
     return f"{intensity}{precipitation_type}"
 
 
-def get_icon(weather: dict[str, Any], station: StationInfo, time: datetime) -> str:
+def get_icon(weather: dict[str, Any], coordinate: Coordinate, time: datetime) -> str:
     """Get icon from weather data."""
     # SOURCE:
     # conditions: dry, fog, rain, sleet, snow, hail, thunderstorm, null
@@ -115,7 +187,7 @@ def get_icon(weather: dict[str, Any], station: StationInfo, time: datetime) -> s
     #   mostly cloudy - 4/8 to 7/8
     #   overcast - 7/8 to 1
 
-    time_of_day = day_or_night(station.coordinate, time)
+    time_of_day = day_or_night(coordinate, time)
     base_icon = get_icon_base(weather)
     condition = get_icon_condition(weather)
     if condition:
@@ -129,7 +201,7 @@ async def parse_record(
 ) -> tuple[StationBase | None, WeatherCondition | None]:
     """Parse DWD record."""
     station_id = record["station_id"]
-    stations = await get_stations(CountryID.Germany)  # ty: ignore[too-many-positional-arguments]
+    stations = await get_stations(CountryID.Germany)
 
     if station_id not in stations:  # pragma: no cover
         return None, None
@@ -144,7 +216,11 @@ async def parse_record(
     condition = WeatherCondition(
         observation=observation,
         timestamp=record["timestamp"],
-        icon=get_icon(record, station, parse_timestamp(record["timestamp"])),
+        icon=get_icon(
+            record,
+            station.coordinate,
+            parse_timestamp(record["timestamp"]),
+        ),
         temperature=kelvin_to_celsius(float(record["temperature"])),
     )
 
@@ -1,9 +1,11 @@
 """MeteoAlarm weather alert source."""
 
 from .alerts import list_alert_areas, list_alerts, list_alerts_for_critera
+from .views import render_alerts_for_critera
 
 __all__ = [
     "list_alert_areas",
     "list_alerts",
     "list_alerts_for_critera",
+    "render_alerts_for_critera",
 ]
@@ -4,8 +4,13 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from json import loads
+from typing import TYPE_CHECKING, Any
 
-from vremenar.database.redis import redis
+from vremenar.cache import cached
+from vremenar.database.invalidation import invalidation
+from vremenar.database.near_cache import near_cache
+from vremenar.database.replicas import replica_read
+from vremenar.database.scripts import REDIS_SCRIPTS, alerts_for_areas
 from vremenar.database.stations import get_stations
 from vremenar.definitions import CountryID, LanguageID
 from vremenar.exceptions import (
@@ -15,43 +20,56 @@ from vremenar.exceptions import (
     UnknownStationException,
 )
 from vremenar.models.alerts import AlertAreaWithPolygon, AlertInfo
-from vremenar.utils import chunker, logger, parse_timestamp
+from vremenar.utils import chunker, logger, parse_timestamp, task_group
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
 
-async def list_alerts_areas(country: CountryID) -> dict[str, AlertAreaWithPolygon]:
+    from redis.asyncio import Redis
+
+ALERTS_AREAS_TTL = 3600  # seconds
+
+
+@cached("alerts_areas", ttl=ALERTS_AREAS_TTL)
+@replica_read
+async def list_alerts_areas(
+    redis: Redis[str],
+    country: CountryID,
+) -> dict[str, AlertAreaWithPolygon]:
     """Get alerts areas for a specific country."""
     areas: dict[str, AlertAreaWithPolygon] = {}
 
-    async with redis.client() as connection:
-        codes = await connection.smembers(f"alerts_area:{country}")
-        async with connection.pipeline(transaction=False) as pipeline:
-            for code in codes:
-                pipeline.hgetall(f"alerts_area:{country}:{code}:info")
-            response = await pipeline.execute()
+    codes: set[str] = await redis.smembers(f"alerts_area:{country}")
+    response = await near_cache.hgetall(
+        redis,
+        [f"alerts_area:{country}:{code}:info" for code in codes],
+    )
 
-        for area in response:
-            areas[area["code"]] = AlertAreaWithPolygon(
-                id=area["code"],
-                name=area["name"],
-                polygons=loads(area["polygons"]),
-            )
+    for area in response:
+        areas[area["code"]] = AlertAreaWithPolygon(
+            id=area["code"],
+            name=area["name"],
+            polygons=loads(area["polygons"]),
+        )
 
     logger.debug("Read %s alerts areas from the database", len(areas))
 
     return dict(sorted(areas.items(), key=lambda item: item[1].id))
 
 
-async def list_alerts(
+invalidation.register_cache("alerts", list_alerts_areas)
+
+
+@replica_read
+async def load_alerts(
+    redis: Redis[str],
     country: CountryID,
     language: LanguageID,
     alert_ids: set[str] | None = None,
-    areas: set[str] | None = None,
-) -> list[AlertInfo]:
-    """Get alerts for a specific country."""
-    alerts: list[AlertInfo] = []
-
+) -> list[Sequence[Any]]:
+    """Load info, localised info and areas of alerts for a specific country."""
     async with redis.client() as connection:
-        if alert_ids is None:  # pragma: no cover
+        if alert_ids is None:
             alert_ids = await connection.smembers(f"alert:{country}")
         async with connection.pipeline(transaction=False) as pipeline:
             for alert_id in alert_ids:
@@ -60,21 +78,50 @@ async def list_alerts(
                 pipeline.smembers(f"alert:{country}:{alert_id}:areas")
             response = await pipeline.execute()
 
-        areas_dict = await list_alerts_areas(country)
-        for info, localised, alert_areas in chunker(response, 3):
-            alert_areas_filtered = alert_areas
-            if areas is not None:
-                alert_areas_filtered = {area for area in alert_areas if area in areas}
-            alert = AlertInfo.init(info, localised, alert_areas_filtered, areas_dict)
-            if parse_timestamp(alert.ending) > datetime.now(tz=UTC):
-                alerts.append(alert)
+    return list(chunker(response, 3))
+
+
+async def list_alerts(
+    country: CountryID,
+    language: LanguageID,
+    alert_ids: set[str] | None = None,
+    areas: set[str] | None = None,
+) -> list[AlertInfo]:
+    """Get alerts for a specific country."""
+    async with task_group() as group:
+        areas_dict = group.create_task(list_alerts_areas(country))
+        records = group.create_task(load_alerts(country, language, alert_ids))
+
+    return _parse_alerts(records.result(), areas_dict.result(), areas)
+
+
+def _parse_alerts(
+    records: Iterable[Sequence[Any]],
+    areas_dict: dict[str, AlertAreaWithPolygon],
+    areas: set[str] | None = None,
+) -> list[AlertInfo]:
+    """Parse active alerts from their info, localised info and areas."""
+    alerts: list[AlertInfo] = []
+
+    for info, localised, alert_areas in records:
+        alert_areas_filtered = alert_areas
+        if areas is not None:
+            alert_areas_filtered = {area for area in alert_areas if area in areas}
+        alert = AlertInfo.init(info, localised, alert_areas_filtered, areas_dict)
+        if parse_timestamp(alert.ending) > datetime.now(tz=UTC):
+            alerts.append(alert)
 
     logger.debug("Read %s alerts from the database", len(alerts))
 
     return alerts
 
 
-async def list_alert_ids_for_areas(country: CountryID, areas: set[str]) -> set[str]:
+@replica_read
+async def list_alert_ids_for_areas(
+    redis: Redis[str],
+    country: CountryID,
+    areas: set[str],
+) -> set[str]:
     """Get alert IDs for requested areas."""
     async with redis.pipeline() as pipeline:
         for area in areas:
@@ -83,6 +130,27 @@ async def list_alert_ids_for_areas(country: CountryID, areas: set[str]) -> set[s
     return set.union(*response)
 
 
+async def list_alerts_for_areas(
+    country: CountryID,
+    language: LanguageID,
+    areas: set[str],
+    *,
+    scripts: bool = REDIS_SCRIPTS,
+) -> list[AlertInfo]:
+    """Get alerts for requested areas."""
+    if scripts:
+        async with task_group() as group:
+            areas_dict = group.create_task(list_alerts_areas(country))
+            records = group.create_task(alerts_for_areas(country, language, areas))
+        return _parse_alerts(records.result(), areas_dict.result(), areas)
+
+    # get unique alert IDs
+    alert_ids: set[str] = await list_alert_ids_for_areas(country, areas)
+
+    # get alert info
+    return await list_alerts(country, language, alert_ids, areas)
+
+
 async def _parse_areas(country: CountryID, areas: list[str] | None = None) -> set[str]:
     """Parse areas from query."""
     areas_to_query: set[str] = set()
@@ -102,7 +170,7 @@ async def _parse_stations(
     """Parse stations from query."""
     areas_to_query: set[str] = set()
     if stations:
-        stations_list = await get_stations(country)  # ty: ignore[too-many-positional-arguments]
+        stations_list = await get_stations(country)
         for s in stations:
             if s not in stations_list:
                 raise UnknownStationException
@@ -113,30 +181,34 @@ async def _parse_stations(
     return areas_to_query
 
 
-async def list_alerts_for_critera(
+async def list_areas_for_critera(
     country: CountryID,
-    language: LanguageID = LanguageID.English,
     stations: list[str] | None = None,
     areas: list[str] | None = None,
-) -> list[AlertInfo]:
-    """Get list of alerts for criteria."""
+) -> set[str]:
+    """Get alert areas for criteria."""
     if not stations and not areas:
         err = "At least one station or area required"
         raise InvalidSearchQueryException(err)
 
-    areas_to_query: set[str] = await _parse_areas(
-        country,
-        areas,
-    ) | await _parse_stations(country, stations)
+    async with task_group() as group:
+        areas_task = group.create_task(_parse_areas(country, areas))
+        stations_task = group.create_task(_parse_stations(country, stations))
+    return areas_task.result() | stations_task.result()
 
-    # get unique alert IDs
-    alert_ids: set[str] = await list_alert_ids_for_areas(country, areas_to_query)
 
-    # get alert info
-    alerts: list[AlertInfo] = await list_alerts(
+async def list_alerts_for_critera(
+    country: CountryID,
+    language: LanguageID = LanguageID.English,
+    stations: list[str] | None = None,
+    areas: list[str] | None = None,
+) -> list[AlertInfo]:
+    """Get list of alerts for criteria."""
+    areas_to_query = await list_areas_for_critera(country, stations, areas)
+
+    alerts: list[AlertInfo] = await list_alerts_for_areas(
         country,
         language,
-        alert_ids,
         areas_to_query,
     )
 
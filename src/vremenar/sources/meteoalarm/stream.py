@@ -0,0 +1,313 @@
+"""MeteoAlarm alert change events.
+
+Each worker keeps a single Redis subscription to keyspace notifications of
+the alert sets, so the ingester only needs `notify-keyspace-events` to
+contain `Ks`. Without notifications changes are still noticed by the
+periodic refresh. On a change the alert views are reloaded, compared with
+the previously active alerts and the differences are queued for the
+subscribers of the affected areas.
+"""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Queue, QueueFull, Task, create_task, sleep, wait_for
+from contextlib import suppress
+from datetime import UTC, datetime
+from json import dumps
+from os import getenv
+from time import monotonic
+from typing import TYPE_CHECKING, TypedDict
+
+from redis.exceptions import RedisError
+
+from vremenar.database.invalidation import invalidation
+from vremenar.database.redis import database, redis
+from vremenar.definitions import CountryID, LanguageID
+from vremenar.utils import logger
+
+from .views import AlertView, AlertViews, get_alert_views
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from redis.asyncio import Redis
+
+ALERTS_STREAM: bool = getenv("VREMENAR_ALERTS_STREAM", "1") == "1"
+ALERTS_STREAM_INTERVAL = 60  # seconds
+ALERTS_STREAM_DEBOUNCE = 1  # seconds
+ALERTS_STREAM_HEARTBEAT = 15  # seconds
+ALERTS_STREAM_QUEUE = 64  # events
+ALERTS_STREAM_RECONNECT_DELAY = 5  # seconds
+
+PING = b": ping\n\n"
+
+
+class AlertsStreamStats(TypedDict):
+    """Alerts stream statistics."""
+
+    connected: bool
+    subscribers: int
+    events: int
+    dropped: int
+    errors: int
+
+
+def event(kind: str, data: bytes) -> bytes:
+    """Format a server-sent event."""
+    return b"event: " + kind.encode() + b"\ndata: " + data + b"\n\n"
+
+
+class AlertsSubscriber:
+    """Queue of alert events for a single client."""
+
+    __slots__ = ("areas", "closed", "country", "language", "queue")
+
+    def __init__(
+        self,
+        country: CountryID,
+        language: LanguageID,
+        areas: set[str],
+    ) -> None:
+        """Initialise subscriber."""
+        self.country = country
+        self.language = language
+        self.areas = areas
+        self.closed: bool = False
+        self.queue: Queue[bytes] = Queue(ALERTS_STREAM_QUEUE)
+
+    def send(self, data: bytes) -> bool:
+        """Queue data, closing the subscriber if it does not keep up."""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(data)
+        except QueueFull:
+            # the client reconnects and receives a new snapshot
+            self.closed = True
+            return False
+        return True
+
+
+class AlertsStream:
+    """Fan-out of alert changes to subscribed clients."""
+
+    def __init__(self, client: Redis[str]) -> None:
+        """Initialise alerts stream."""
+        self.client = client
+        self.connected: bool = False
+        self.events: int = 0
+        self.dropped: int = 0
+        self.errors: int = 0
+        self.channels: dict[str, CountryID] = {
+            f"__keyspace@{database}__:alert:{country}": country for country in CountryID
+        }
+        self._subscribers: dict[
+            tuple[CountryID, LanguageID, str],
+            set[AlertsSubscriber],
+        ] = {}
+        self._views: dict[tuple[CountryID, LanguageID], AlertViews] = {}
+        self._active: dict[tuple[CountryID, LanguageID], dict[str, AlertView]] = {}
+        self._task: Task[None] | None = None
+
+    @staticmethod
+    def active(views: AlertViews) -> dict[str, AlertView]:
+        """Get active alerts by ID."""
+        now = datetime.now(tz=UTC)
+        return {alert.id: alert for alert in views.alerts if alert.ending > now}
+
+    def subscribers(
+        self,
+        country: CountryID,
+        language: LanguageID,
+        areas: tuple[str, ...],
+    ) -> set[AlertsSubscriber]:
+        """Get subscribers of any of the areas."""
+        result: set[AlertsSubscriber] = set()
+        for area in areas:
+            result.update(self._subscribers.get((country, language, area), ()))
+        return result
+
+    async def subscribe(
+        self,
+        country: CountryID,
+        language: LanguageID,
+        areas: set[str],
+    ) -> AlertsSubscriber:
+        """Subscribe to alerts of areas, starting with the active alerts."""
+        key = (country, language)
+        if key not in self._views:
+            views = await get_alert_views(country, language)
+            self._views[key] = views
+            self._active[key] = self.active(views)
+
+        subscriber = AlertsSubscriber(country, language, areas)
+        for area in areas:
+            self._subscribers.setdefault((*key, area), set()).add(subscriber)
+
+        views = self._views[key]
+        snapshot = [
+            event("added", alert.render(views.areas, areas))
+            for alert in self._active[key].values()
+            if not areas.isdisjoint(alert.areas)
+        ]
+        if snapshot:
+            subscriber.send(b"".join(snapshot))
+        return subscriber
+
+    def unsubscribe(self, subscriber: AlertsSubscriber) -> None:
+        """Remove subscriber."""
+        for area in subscriber.areas:
+            key = (subscriber.country, subscriber.language, area)
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[key]
+
+    async def events_for(self, subscriber: AlertsSubscriber) -> AsyncIterator[bytes]:
+        """Stream queued events of a subscriber with periodic heartbeats."""
+        try:
+            while not subscriber.closed or not subscriber.queue.empty():
+                try:
+                    yield await wait_for(
+                        subscriber.queue.get(),
+                        ALERTS_STREAM_HEARTBEAT,
+                    )
+                except TimeoutError:
+                    yield PING
+        finally:
+            self.unsubscribe(subscriber)
+
+    def publish(
+        self,
+        country: CountryID,
+        language: LanguageID,
+        views: AlertViews,
+    ) -> None:
+        """Queue differences between the active and the previous alerts."""
+        key = (country, language)
+        previous_views = self._views.get(key, views)
+        previous = self._active.get(key, {})
+        current = self.active(views)
+        self._views[key] = views
+        self._active[key] = current
+
+        for alert_id in previous.keys() | current.keys():
+            old = previous.get(alert_id)
+            new = current.get(alert_id)
+            if (
+                old is not None
+                and new is not None
+                and (old.head, old.tail, old.areas) == (new.head, new.tail, new.areas)
+            ):
+                continue
+
+            areas = (old.areas if old else ()) + (new.areas if new else ())
+            for subscriber in self.subscribers(country, language, areas):
+                before = after = None
+                if old is not None and not subscriber.areas.isdisjoint(old.areas):
+                    before = old.render(previous_views.areas, subscriber.areas)
+                if new is not None and not subscriber.areas.isdisjoint(new.areas):
+                    after = new.render(views.areas, subscriber.areas)
+                if after == before:
+                    continue
+
+                if after is None:
+                    data = event("expired", dumps({"id": alert_id}).encode())
+                else:
+                    data = event("updated" if before else "added", after)
+
+                if subscriber.send(data):
+                    self.events += 1
+                else:
+                    self.dropped += 1
+
+    async def refresh(self, countries: set[CountryID]) -> None:
+        """Reload alert views with subscribers and publish their changes."""
+        for country, language in list(self._views):
+            if country not in countries:
+                continue
+            get_alert_views.invalidate(country, language)
+            self.publish(country, language, await get_alert_views(country, language))
+
+    async def invalidate(self, country: str | None) -> None:
+        """Publish changes of invalidated alerts."""
+        await self.refresh(set(CountryID) if country is None else {CountryID(country)})
+
+    async def listen(self) -> None:
+        """Process keyspace notifications until the connection fails."""
+        pubsub = self.client.pubsub()
+        try:
+            await pubsub.subscribe(*self.channels)
+            self.connected = True
+            # changes may have been missed while disconnected
+            await self.refresh(set(CountryID))
+            refreshed = monotonic()
+
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=ALERTS_STREAM_INTERVAL,
+                )
+                countries: set[CountryID] = set()
+                if message is not None:
+                    # the ingester changes many keys, wait for it to finish
+                    await sleep(ALERTS_STREAM_DEBOUNCE)
+                    while message is not None:
+                        if message["channel"] in self.channels:
+                            countries.add(self.channels[message["channel"]])
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                        )
+                # alerts also expire without any changes
+                if monotonic() - refreshed >= ALERTS_STREAM_INTERVAL:
+                    countries = set(CountryID)
+                    refreshed = monotonic()
+                await self.refresh(countries)
+        finally:
+            self.connected = False
+            await pubsub.aclose()  # type: ignore[attr-defined]
+
+    async def run(self) -> None:
+        """Keep listening for alert changes, reconnecting on errors."""
+        while True:
+            try:
+                await self.listen()
+            except (RedisError, OSError):
+                logger.warning("Alerts stream connection lost", exc_info=True)
+            except Exception:  # ruff: ignore[blind-except]
+                self.errors += 1
+                logger.exception("Alerts stream listener failed")
+            await sleep(ALERTS_STREAM_RECONNECT_DELAY)
+
+    def start(self) -> None:
+        """Start listening for alert changes if enabled."""
+        if ALERTS_STREAM and self._task is None:
+            self._task = create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop listening for alert changes."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(CancelledError):
+            await self._task
+        self._task = None
+
+    def stats(self) -> AlertsStreamStats:
+        """Get alerts stream statistics."""
+        return AlertsStreamStats(
+            connected=self.connected,
+            subscribers=len(
+                {s for subscribers in self._subscribers.values() for s in subscribers},
+            ),
+            events=self.events,
+            dropped=self.dropped,
+            errors=self.errors,
+        )
+
+
+alerts_stream = AlertsStream(redis)
+invalidation.register("alerts", alerts_stream.invalidate)
@@ -0,0 +1,163 @@
+"""Materialized MeteoAlarm alert views.
+
+All alerts of a country are materialized once per alert generation for each
+language. Every alert is serialized once without its areas and every area
+once on its own, so alerts for any set of areas are rendered by joining the
+serialized values, without constructing models.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from itertools import starmap
+from os import getenv
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter
+
+from vremenar.cache import cached
+from vremenar.database.invalidation import invalidation
+from vremenar.models.alerts import AlertArea, AlertInfo
+from vremenar.utils import logger, parse_timestamp, task_group
+
+from .alerts import (
+    list_alerts_areas,
+    list_alerts_for_critera,
+    list_areas_for_critera,
+    load_alerts,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from vremenar.definitions import CountryID, LanguageID
+    from vremenar.models.alerts import AlertAreaWithPolygon
+
+ALERTS_VIEWS: bool = getenv("VREMENAR_ALERTS_VIEWS", "1") == "1"
+ALERTS_VIEWS_TTL = 60  # seconds
+
+AREAS_FIELD = b'"areas":[]'
+
+alert_adapter: TypeAdapter[AlertInfo] = TypeAdapter(AlertInfo)
+alerts_adapter: TypeAdapter[list[AlertInfo]] = TypeAdapter(list[AlertInfo])
+area_adapter: TypeAdapter[AlertArea] = TypeAdapter(AlertArea)
+
+
+class AlertView:
+    """Serialized alert with a placeholder for its areas."""
+
+    __slots__ = ("areas", "ending", "head", "id", "onset", "tail")
+
+    def __init__(
+        self,
+        info: dict[str, Any],
+        localised: dict[str, Any],
+        alert_areas: set[str],
+    ) -> None:
+        """Initialise view of an alert."""
+        alert = AlertInfo.init(info, localised, set())
+        content = alert_adapter.dump_json(alert, exclude_unset=True, exclude_none=True)
+        head, _, tail = content.partition(AREAS_FIELD)
+        self.head: bytes = head + b'"areas":['
+        self.tail: bytes = b"]" + tail
+        self.id: str = alert.id
+        self.onset: str = alert.onset
+        self.ending: datetime = parse_timestamp(alert.ending)
+        self.areas: tuple[str, ...] = tuple(sorted(alert_areas))
+
+    def render(self, areas: dict[str, bytes], selected: set[str]) -> bytes:
+        """Render alert with only the selected areas."""
+        return (
+            self.head
+            + b",".join(areas[area] for area in self.areas if area in selected)
+            + self.tail
+        )
+
+
+class AlertViews:
+    """Alerts of a country in a language, sorted by time and indexed by area."""
+
+    __slots__ = ("alerts", "area_alerts", "areas")
+
+    def __init__(
+        self,
+        records: Iterable[Sequence[Any]],
+        areas_dict: dict[str, AlertAreaWithPolygon],
+    ) -> None:
+        """Initialise views from alert records."""
+        alerts = list(starmap(AlertView, records))
+        alerts.sort(key=lambda alert: (alert.onset, alert.id))
+        self.alerts: tuple[AlertView, ...] = tuple(alerts)
+
+        self.areas: dict[str, bytes] = {
+            code: area_adapter.dump_json(area.base())
+            for code, area in areas_dict.items()
+        }
+
+        area_alerts: dict[str, list[int]] = {}
+        for position, alert in enumerate(self.alerts):
+            for area in alert.areas:
+                area_alerts.setdefault(area, []).append(position)
+        self.area_alerts: dict[str, tuple[int, ...]] = {
+            area: tuple(positions) for area, positions in area_alerts.items()
+        }
+
+    def render(self, areas: set[str]) -> bytes:
+        """Render active alerts of areas as a JSON list."""
+        positions: set[int] = set()
+        for area in areas:
+            positions.update(self.area_alerts.get(area, ()))
+
+        now = datetime.now(tz=UTC)
+        return (
+            b"["
+            + b",".join(
+                self.alerts[position].render(self.areas, areas)
+                for position in sorted(positions)
+                if self.alerts[position].ending > now
+            )
+            + b"]"
+        )
+
+
+@cached("alerts_views", ttl=ALERTS_VIEWS_TTL)
+async def get_alert_views(country: CountryID, language: LanguageID) -> AlertViews:
+    """Get materialized views of all alerts for a country and language."""
+    async with task_group() as group:
+        areas_dict = group.create_task(list_alerts_areas(country))
+        records = group.create_task(load_alerts(country, language))
+
+    views = AlertViews(records.result(), areas_dict.result())
+    logger.debug(
+        "Materialized %s alerts for %s areas (%s, %s)",
+        len(views.alerts),
+        len(views.area_alerts),
+        country,
+        language,
+    )
+    return views
+
+
+invalidation.register_cache("alerts", get_alert_views)
+
+
+async def render_alerts_for_critera(
+    country: CountryID,
+    language: LanguageID,
+    stations: list[str] | None = None,
+    areas: list[str] | None = None,
+    *,
+    views: bool = ALERTS_VIEWS,
+) -> bytes:
+    """Render list of alerts for criteria as JSON."""
+    if not views:
+        alerts = await list_alerts_for_critera(country, language, stations, areas)
+        return alerts_adapter.dump_json(alerts, exclude_unset=True, exclude_none=True)
+
+    async with task_group() as group:
+        areas_task = group.create_task(
+            list_areas_for_critera(country, stations, areas),
+        )
+        views_task = group.create_task(get_alert_views(country, language))
+
+    return views_task.result().render(areas_task.result())
@@ -4,20 +4,32 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from vremenar.cache import swr_cached
+from vremenar.database.invalidation import invalidation
 from vremenar.definitions import CountryID, LanguageID
 from vremenar.exceptions import UnsupportedCountryException
+from vremenar.models.maps import MapType
 
 from . import arso, dwd, meteoalarm
 
 if TYPE_CHECKING:
     from vremenar.models.alerts import AlertAreaWithPolygon, AlertInfo
-    from vremenar.models.maps import MapLayer, MapLegend, MapType, SupportedMapType
+    from vremenar.models.maps import MapLayer, MapLegend, SupportedMapType
     from vremenar.models.stations import (
         StationInfo,
         StationInfoExtended,
         StationSearchModel,
     )
-    from vremenar.models.weather import WeatherDetails, WeatherInfoExtended
+    from vremenar.models.weather import (
+        PointForecast,
+        StationForecast,
+        WeatherDetails,
+        WeatherInfoExtended,
+    )
+    from vremenar.viewport import Viewport
+
+MAP_LAYERS_SOFT_TTL = 60  # seconds
+MAP_LAYERS_HARD_TTL = 300  # seconds
 
 
 def get_all_supported_map_types(country: CountryID) -> list[SupportedMapType]:
@@ -32,6 +44,7 @@ def get_all_supported_map_types(country: CountryID) -> list[SupportedMapType]:
     raise UnsupportedCountryException  # pragma: no cover
 
 
+@swr_cached("map_layers", soft_ttl=MAP_LAYERS_SOFT_TTL, hard_ttl=MAP_LAYERS_HARD_TTL)
 async def get_map_layers(
     country: CountryID,
     map_type: MapType,
@@ -47,6 +60,17 @@ async def get_map_layers(
     raise UnsupportedCountryException  # pragma: no cover
 
 
+def invalidate_map_layers(map_type: str | None) -> None:
+    """Invalidate ARSO map layers of a type or all of them."""
+    if map_type is None:
+        get_map_layers.invalidate_prefix(CountryID.Slovenia)
+    else:
+        get_map_layers.invalidate(CountryID.Slovenia, MapType(map_type))
+
+
+invalidation.register("arso:map", invalidate_map_layers)
+
+
 def get_all_map_legends(country: CountryID) -> list[MapLegend]:
     """Get all map legends for the chosen country."""
     if country == CountryID.Slovenia:
@@ -71,12 +95,16 @@ def get_map_legend(country: CountryID, map_type: MapType) -> MapLegend:
     raise UnsupportedCountryException  # pragma: no cover
 
 
-async def get_weather_map(country: CountryID, map_id: str) -> list[WeatherInfoExtended]:
+async def get_weather_map(
+    country: CountryID,
+    map_id: str,
+    viewport: Viewport | None = None,
+) -> list[WeatherInfoExtended]:
     """Get weather condition map for the chosen country."""
     if country == CountryID.Slovenia:
-        return await arso.get_weather_map(map_id)
+        return await arso.get_weather_map(map_id, viewport)
     if country == CountryID.Germany:
-        return await dwd.get_weather_map(map_id)
+        return await dwd.get_weather_map(map_id, viewport)
 
     raise UnsupportedCountryException  # pragma: no cover
 
@@ -131,6 +159,33 @@ async def station_weather_details(
     raise UnsupportedCountryException  # pragma: no cover
 
 
+async def station_forecast(
+    country: CountryID,
+    station_id: str,
+) -> StationForecast:
+    """Get station forecast timeline."""
+    if country == CountryID.Slovenia:
+        return await arso.station_forecast(station_id)
+    if country == CountryID.Germany:
+        return await dwd.station_forecast(station_id)
+
+    raise UnsupportedCountryException  # pragma: no cover
+
+
+async def point_forecast(
+    country: CountryID,
+    latitude: float,
+    longitude: float,
+    altitude: float | None = None,
+    map_ids: list[str] | None = None,
+) -> PointForecast:
+    """Get forecast interpolated for a location."""
+    if country == CountryID.Germany:
+        return await dwd.point_forecast(latitude, longitude, altitude, map_ids)
+
+    raise UnsupportedCountryException
+
+
 async def list_alerts(country: CountryID, language: LanguageID) -> list[AlertInfo]:
     """Get list of alerts for a country."""
     return await meteoalarm.list_alerts(country, language)
@@ -146,6 +201,21 @@ async def list_alerts_for_critera(
     return await meteoalarm.list_alerts_for_critera(country, language, stations, areas)
 
 
+async def render_alerts_for_critera(
+    country: CountryID,
+    language: LanguageID = LanguageID.English,
+    stations: list[str] | None = None,
+    areas: list[str] | None = None,
+) -> bytes:
+    """Render list of alerts for criteria as JSON."""
+    return await meteoalarm.render_alerts_for_critera(
+        country,
+        language,
+        stations,
+        areas,
+    )
+
+
 async def list_alert_areas(country: CountryID) -> list[AlertAreaWithPolygon]:
     """Get list of alert areas for a country."""
     return await meteoalarm.list_alert_areas(country)
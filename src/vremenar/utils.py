@@ -2,27 +2,59 @@
 
 from __future__ import annotations
 
+from asyncio import TaskGroup
+from contextlib import asynccontextmanager, suppress
 from datetime import UTC, date, datetime
 from functools import lru_cache
+from importlib import import_module
 from logging import Logger, getLogger
+from math import asin, cos, radians, sin, sqrt
 from typing import TYPE_CHECKING, Any
 
 from astral import Observer, sun
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterator, Iterable
+    from types import ModuleType
 
     from .models.common import Coordinate
 
 logger: Logger = getLogger("uvicorn.error")
 
+# enough for all stations and all forecast days
+SUN_TABLE_SIZE = 2**16
+
+EARTH_RADIUS = 6371.0  # km
+
 
 def chunker(container: list[Any], size: int) -> Iterable[list[Any]]:
     """Loop over a container in chunks."""
     return (container[pos : pos + size] for pos in range(0, len(container), size))
 
 
-@lru_cache
+def optional_module(*names: str) -> ModuleType | None:
+    """Import the first available module of an optional dependency."""
+    for name in names:
+        with suppress(ImportError):
+            return import_module(name)
+    return None
+
+
+@asynccontextmanager
+async def task_group() -> AsyncIterator[TaskGroup]:
+    """Run tasks concurrently and raise the first failure unwrapped.
+
+    Remaining tasks are cancelled on failure and HTTP exceptions raised by
+    tasks are handled as if raised directly.
+    """
+    try:
+        async with TaskGroup() as group:
+            yield group
+    except ExceptionGroup as e:
+        raise e.exceptions[0] from None
+
+
+@lru_cache(maxsize=SUN_TABLE_SIZE)
 def sunrise_sunset(
     latitude: float,
     longitude: float,
@@ -46,6 +78,22 @@ def day_or_night(coordinate: Coordinate, time: datetime) -> str:
         return "day" if sunrise <= time <= sunset else "night"
 
 
+def distance(
+    latitude1: float,
+    longitude1: float,
+    latitude2: float,
+    longitude2: float,
+) -> float:
+    """Get great-circle distance between two places in km."""
+    latitude1, longitude1 = radians(latitude1), radians(longitude1)
+    latitude2, longitude2 = radians(latitude2), radians(longitude2)
+    a = (
+        sin((latitude2 - latitude1) / 2) ** 2
+        + cos(latitude1) * cos(latitude2) * sin((longitude2 - longitude1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * asin(sqrt(a))
+
+
 def parse_timestamp(timestamp: str) -> datetime:
     """Parse time from timestamp string."""
     return datetime.fromtimestamp(float(timestamp[:-3]), tz=UTC)
@@ -0,0 +1,132 @@
+"""Map viewport filtering."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from vremenar.database.stations import (
+    get_station_clusters,
+    get_station_grid,
+    get_stations,
+)
+from vremenar.exceptions import InvalidSearchQueryException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from vremenar.definitions import CountryID
+    from vremenar.models.stations import StationInfo
+    from vremenar.models.weather import WeatherInfoExtended
+
+
+class BoundingBox(NamedTuple):
+    """Bounding box of a map viewport."""
+
+    latitude_min: float
+    longitude_min: float
+    latitude_max: float
+    longitude_max: float
+
+    @classmethod
+    def parse(cls, value: str) -> BoundingBox:
+        """Parse bounding box from `lat_min,lon_min,lat_max,lon_max`."""
+        try:
+            bbox = cls(*(float(part) for part in value.split(",")))
+        except (TypeError, ValueError):
+            bbox = None
+        if (
+            bbox is None
+            or bbox.latitude_min > bbox.latitude_max
+            or bbox.longitude_min > bbox.longitude_max
+        ):
+            err = "Bounding box should be lat_min,lon_min,lat_max,lon_max"
+            raise InvalidSearchQueryException(err)
+        return bbox
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """Check if coordinate is inside of the bounding box."""
+        return (
+            self.latitude_min <= latitude <= self.latitude_max
+            and self.longitude_min <= longitude <= self.longitude_max
+        )
+
+
+class Viewport:
+    """Map viewport with an optional bounding box and zoom level.
+
+    Stations are shown from their zoom level on. When clustered, one
+    representative station of the stations with data is shown per screen
+    area instead.
+    """
+
+    __slots__ = ("bbox", "cluster", "zoom")
+
+    def __init__(
+        self,
+        bbox: BoundingBox | None = None,
+        zoom: float | None = None,
+        cluster: bool = False,
+    ) -> None:
+        """Initialise viewport."""
+        if cluster and zoom is None:
+            err = "Zoom level is required for clustering"
+            raise InvalidSearchQueryException(err)
+        self.bbox = bbox
+        self.zoom = zoom
+        self.cluster = cluster
+
+    @classmethod
+    def from_query(
+        cls,
+        bbox: str | None,
+        zoom: float | None,
+        cluster: bool = False,
+    ) -> Viewport | None:
+        """Create viewport from query parameters if any are set."""
+        if bbox is None and zoom is None and not cluster:
+            return None
+        return cls(
+            BoundingBox.parse(bbox) if bbox is not None else None,
+            zoom,
+            cluster,
+        )
+
+    def includes(self, station: StationInfo) -> bool:
+        """Check if station is shown in the viewport."""
+        if (
+            not self.cluster
+            and self.zoom is not None
+            and station.zoom_level is not None
+            and station.zoom_level > self.zoom
+        ):
+            return False
+        return self.bbox is None or self.bbox.contains(
+            station.coordinate.latitude,
+            station.coordinate.longitude,
+        )
+
+    async def station_ids(self, country: CountryID) -> set[str]:
+        """Get IDs of stations shown in the viewport."""
+        stations: Iterable[StationInfo]
+        if self.bbox is not None:
+            grid = await get_station_grid(country)
+            stations = grid.query(*self.bbox)
+        else:
+            stations = (await get_stations(country)).values()
+        return {station.id for station in stations if self.includes(station)}
+
+    async def clustered(
+        self,
+        country: CountryID,
+        conditions: list[WeatherInfoExtended],
+    ) -> list[WeatherInfoExtended]:
+        """Get conditions of representative stations if clustered."""
+        if not self.cluster or self.zoom is None:
+            return conditions
+
+        clusters = await get_station_clusters(country)
+        representatives = clusters.representatives(
+            self.zoom,
+            (condition.station.id for condition in conditions),
+        )
+        return [c for c in conditions if c.station.id in representatives]
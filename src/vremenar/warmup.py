@@ -0,0 +1,158 @@
+"""Application warmup."""
+
+from __future__ import annotations
+
+from asyncio import Task, create_task
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from inspect import isawaitable
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from vremenar.api.alerts import areas_list_payload
+from vremenar.api.copyright import copyright_payload
+from vremenar.api.maps import map_legends_payloads, supported_map_types_payloads
+from vremenar.api.stations import stations_list_payload
+from vremenar.database.stations import (
+    get_station_clusters,
+    get_station_grid,
+    get_stations,
+)
+from vremenar.definitions import CountryID
+from vremenar.sources.meteoalarm.alerts import list_alerts_areas
+from vremenar.utils import logger, sunrise_sunset
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+WARMUP_COUNTRIES: list[CountryID] = [CountryID.Slovenia, CountryID.Germany]
+
+
+class WarmupState(StrEnum):
+    """Warmup state enum."""
+
+    Pending = "pending"
+    Running = "running"
+    Done = "done"
+    Failed = "failed"
+
+
+class WarmupStatus:
+    """Warmup status tracker."""
+
+    def __init__(self) -> None:
+        """Initialise status tracker."""
+        self.state: WarmupState = WarmupState.Pending
+        self.timings: dict[str, float] = {}
+        self.task: Task[None] | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Check if the warmup has completed."""
+        return self.state is WarmupState.Done
+
+
+status = WarmupStatus()
+
+
+async def warmup_stations(country: CountryID) -> None:
+    """Preload station snapshot for a country."""
+    await get_stations(country)
+
+
+async def warmup_station_indexes(country: CountryID) -> None:
+    """Precompute station grid index and clusters for a country."""
+    await get_station_grid(country)
+    await get_station_clusters(country)
+
+
+async def warmup_alerts_areas(country: CountryID) -> None:
+    """Preload alerts areas for a country."""
+    await list_alerts_areas(country)
+
+
+def warmup_static(_: CountryID) -> None:
+    """Preload serialized supported map types, map legends and copyright."""
+    supported_map_types_payloads()
+    map_legends_payloads()
+    copyright_payload()
+
+
+async def warmup_payloads(country: CountryID) -> None:
+    """Preload compressed station list and alert areas payloads for a country."""
+    for extended in (False, True):
+        await stations_list_payload(country, extended)
+    await areas_list_payload(country)
+
+
+async def warmup_sun(country: CountryID) -> None:
+    """Preload sunrise and sunset table for today and tomorrow."""
+    today = datetime.now(tz=UTC).date()
+    dates = [today, today + timedelta(days=1)]
+
+    stations = await get_stations(country)
+    for station in stations.values():
+        for date in dates:
+            try:
+                sunrise_sunset(
+                    station.coordinate.latitude,
+                    station.coordinate.longitude,
+                    date,
+                )
+            except ValueError:  # pragma: no cover
+                continue
+
+
+WARMUP_STEPS: dict[str, Callable[[CountryID], Awaitable[None] | None]] = {
+    "stations": warmup_stations,
+    "station_indexes": warmup_station_indexes,
+    "alerts_areas": warmup_alerts_areas,
+    "static": warmup_static,
+    "payloads": warmup_payloads,
+    "sun": warmup_sun,
+}
+
+
+async def run_step(
+    name: str,
+    step: Callable[[CountryID], Awaitable[None] | None],
+    country: CountryID,
+) -> None:
+    """Run a single warmup step and record its timing."""
+    start = perf_counter()
+    result = step(country)
+    if isawaitable(result):
+        await result
+    duration = (perf_counter() - start) * 1000
+    status.timings[f"{name}:{country}"] = round(duration, 2)
+    logger.debug("Warmup of %s:%s took %.2f ms", name, country, duration)
+
+
+async def warmup() -> None:
+    """Preload caches before accepting traffic."""
+    status.state = WarmupState.Running
+    status.timings = {}
+    start = perf_counter()
+
+    try:
+        for country in WARMUP_COUNTRIES:
+            for name, step in WARMUP_STEPS.items():
+                await run_step(name, step, country)
+    except Exception:  # ruff: ignore[blind-except]
+        status.state = WarmupState.Failed
+        logger.exception("Warmup failed")
+        return
+
+    status.state = WarmupState.Done
+    logger.info("Warmup completed in %.2f ms", (perf_counter() - start) * 1000)
+
+
+def retry_warmup() -> None:
+    """Retry a failed warmup in the background."""
+    if status.state is not WarmupState.Failed:
+        return
+
+    if status.task is not None and not status.task.done():  # pragma: no cover
+        return
+
+    status.task = create_task(warmup())
@@ -6,9 +6,15 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from vremenar.database.stations import get_stations
+from vremenar.sources.meteoalarm.alerts import list_alerts_areas
+from vremenar.sources.meteoalarm.views import get_alert_views
+
 if TYPE_CHECKING:
     from httpx2 import AsyncClient
 
+    from tests.conftest import RoundTrips
+
 
 @pytest.mark.asyncio
 async def test_alerts_areas(client: AsyncClient) -> None:
@@ -61,3 +67,36 @@ async def test_alerts_list(client: AsyncClient) -> None:
         "/alerts/list?country=de&area=DE048&area=DE413&station=10147&station=P0201",
     )
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_alerts_round_trips(client: AsyncClient, round_trips: RoundTrips) -> None:
+    """Test independent lookups of alerts are made concurrently."""
+    url = "/alerts/list?country=de&station=10147&area=DE048"
+    response = await client.get(url)
+    assert response.status_code == 200
+
+    # stations and alerts areas are loaded concurrently with the alert views
+    get_stations.clear()
+    list_alerts_areas.clear()
+    get_alert_views.clear()
+    round_trips.intervals.clear()
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert round_trips.sequential == 2
+
+    # warm requests are served from memory
+    round_trips.intervals.clear()
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert round_trips.sequential == 0
+
+
+@pytest.mark.asyncio
+async def test_alerts_stream(client: AsyncClient) -> None:
+    """Test alerts stream criteria are validated before streaming."""
+    response = await client.get("/alerts/stream?country=de")
+    assert response.status_code == 422
+
+    response = await client.get("/alerts/stream?country=de&area=FOO")
+    assert response.status_code == 404
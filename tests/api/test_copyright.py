@@ -13,3 +13,16 @@ def test_copyright() -> None:
     """Test copyright."""
     response = client.get("/copyright")
     assert response.status_code == 200
+
+
+def test_copyright_etag() -> None:
+    """Test copyright conditional requests."""
+    response = client.get("/copyright")
+    assert response.status_code == 200
+    assert response.json()["si"][0]["provider"] == "Slovenian Environment Agency"
+
+    response = client.get(
+        "/copyright",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert response.status_code == 304
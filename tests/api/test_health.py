@@ -0,0 +1,101 @@
+"""Health API tests."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from httpx2 import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_health_live(client: AsyncClient) -> None:
+    """Test liveness."""
+    response = await client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json()["alive"]
+
+
+@pytest.mark.asyncio
+async def test_health_ready(client: AsyncClient) -> None:
+    """Test readiness after warmup."""
+    from vremenar.warmup import warmup
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert not response.json()["ready"]
+
+    await warmup()
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"]
+    assert response.json()["warmup"] == "done"
+    assert "stations:de" in response.json()["timings"]
+    assert "payloads:de" in response.json()["timings"]
+    assert response.json()["redis"]["available"]
+
+    pool = response.json()["redis"]["pool"]
+    assert pool["max_connections"] == 50
+    assert pool["waits"] > 0
+    assert pool["exhausted"] == 0
+
+    caches = {cache["name"]: cache for cache in response.json()["caches"]}
+    assert caches["stations"]["entries"] == 2
+    assert caches["stations"]["generation"] >= 2
+    assert not caches["stations"]["stale"]
+    assert caches["alerts_areas"]["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_health_ready_stale(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that cached data older than the threshold fails readiness."""
+    from vremenar.warmup import warmup
+
+    await warmup()
+    # the module is shadowed by its router in `vremenar.api`
+    monkeypatch.setattr(sys.modules["vremenar.api.health"], "STALE_THRESHOLD", 0)
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert not response.json()["ready"]
+    assert any(cache["stale"] for cache in response.json()["caches"])
+
+
+@pytest.mark.asyncio
+async def test_health_ready_warmup_failed(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a failing warmup step does not escape and fails readiness."""
+    from vremenar import warmup as warmup_module
+    from vremenar.warmup import WarmupState, warmup
+
+    def failing_step(_: object) -> None:
+        message = "broken loader"
+        raise ValueError(message)
+
+    monkeypatch.setattr(warmup_module, "WARMUP_STEPS", {"failing": failing_step})
+    await warmup()
+    assert warmup_module.status.state is WarmupState.Failed
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["warmup"] == "failed"
+    # the retried warmup fails again instead of staying running
+    assert warmup_module.status.task is not None
+    await warmup_module.status.task
+    assert warmup_module.status.state is WarmupState.Failed
+
+    monkeypatch.undo()
+    await warmup()
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["warmup"] == "done"
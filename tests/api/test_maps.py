@@ -198,6 +198,10 @@ async def test_maps_legends(client: AsyncClient) -> None:
     response = await client.get("/maps/legend/precipitation?country=de")
     assert response.status_code == 200
 
+    response = await client.get("/maps/legend/precipitation?country=global")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Unsupported country"}
+
     response = await client.get("/maps/legend/precipitation_global?country=si")
     assert response.status_code == 404
 
@@ -219,3 +223,35 @@ async def test_maps_legends(client: AsyncClient) -> None:
 
     response = await client.get("/maps/legend/hail?country=si")
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_maps_legends_etag(client: AsyncClient) -> None:
+    """Test maps legends conditional requests."""
+    response = await client.get("/maps/legend/precipitation?country=si")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(
+        "/maps/legend/precipitation?country=si",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+    response = await client.get(
+        "/maps/legend/precipitation?country=de",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    response = await client.get("/maps/types?country=si")
+    assert response.status_code == 200
+
+    response = await client.get(
+        "/maps/types?country=si",
+        headers={"If-None-Match": f'"foo", W/{response.headers["etag"]}'},
+    )
+    assert response.status_code == 304
@@ -7,9 +7,13 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from vremenar.database.stations import get_stations
+
 if TYPE_CHECKING:
     from httpx2 import AsyncClient
 
+    from tests.conftest import RoundTrips
+
 
 @pytest.mark.asyncio
 async def test_stations_list(client: AsyncClient) -> None:
@@ -149,6 +153,20 @@ async def test_stations_condition_error(client: AsyncClient) -> None:
     assert response.json()["detail"] == "Unknown station"
 
 
+@pytest.mark.asyncio
+async def test_stations_weather_details(client: AsyncClient) -> None:
+    """Test station weather details."""
+    response = await client.get("/stations/details/METEO-0038?country=si")
+    assert response.status_code == 200
+    statistics = response.json()["statistics"]
+    assert statistics["temperature_min_24h"] == 10
+    assert statistics["temperature_max_24h"] == 16
+    assert statistics["temperature_average_48h"] == 13
+
+    response = await client.get("/stations/details/METEO-12345?country=si")
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_stations_map(client: AsyncClient) -> None:
     """Test stations map."""
@@ -190,3 +208,145 @@ async def test_stations_errors(client: AsyncClient) -> None:
     response = await client.get("/stations/map/abc?country=de")
     assert response.status_code == 404
     assert response.json()["detail"] == "Map ID is not recognised"
+
+
+@pytest.mark.asyncio
+async def test_stations_point(client: AsyncClient) -> None:
+    """Test point forecast."""
+    # Hamburg
+    response = await client.get(
+        "/stations/point?country=de&latitude=53.63&longitude=10.0",
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["stations"] == [{"id": "10147"}, {"id": "P0201"}]
+    assert result["conditions"][0]["observation"] == "recent"
+    assert result["conditions"][0]["temperature"] == 3.4
+
+    response = await client.get(
+        "/stations/point?country=de&latitude=53.63&longitude=10.0&altitude=1016"
+        "&map_id=current&map_id=current",
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert len(result["conditions"]) == 1
+    assert result["conditions"][0]["temperature"] == -3.1
+
+    # only map IDs of condition map layers are accepted
+    response = await client.get(
+        "/stations/point?country=de&latitude=53.63&longitude=10.0"
+        "&map_id=current&map_id=1",
+    )
+    assert response.status_code == 404
+
+    response = await client.get(
+        "/stations/point?country=de&latitude=53.63&longitude=10.0"
+        + "&map_id=current" * 41,
+    )
+    assert response.status_code == 422
+
+    # Munich
+    response = await client.get(
+        "/stations/point?country=de&latitude=48.14&longitude=11.58",
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "No weather stations near the location"}
+
+    response = await client.get(
+        "/stations/point?country=si&latitude=46.3684&longitude=14.1101",
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stations_forecast(client: AsyncClient) -> None:
+    """Test station forecast timeline."""
+    response = await client.get("/stations/forecast/10147?country=de")
+    assert response.status_code == 200
+    result = response.json()
+    assert result["station"]["id"] == "10147"
+    assert all(c["observation"] == "forecast" for c in result["conditions"])
+    timestamps = [int(c["timestamp"]) for c in result["conditions"]]
+    assert len(timestamps) == 2
+    assert timestamps == sorted(timestamps)
+
+    response = await client.get("/stations/forecast/METEO-0038?country=si")
+    assert response.status_code == 200
+    result = response.json()
+    assert len(result["conditions"]) == 1
+    assert result["conditions"][0]["temperature_low"] == 13
+
+    response = await client.get("/stations/forecast/P0201?country=de")
+    assert response.status_code == 200
+    assert response.json()["conditions"] == []
+
+    response = await client.get("/stations/forecast/NULL?country=de")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_stations_map_viewport(client: AsyncClient) -> None:
+    """Test weather conditions map viewport filtering."""
+    for country, station_id, bbox in (
+        ("si", "METEO-0038", "46,14,47,15"),
+        ("de", "10147", "53.5,9.9,53.7,10.1"),
+    ):
+        response = await client.get(f"/stations/map/current?country={country}")
+        assert response.status_code == 200
+        assert station_id in {w["station"]["id"] for w in response.json()}
+
+        response = await client.get(
+            f"/stations/map/current?country={country}&bbox={bbox}&zoom=11",
+        )
+        assert response.status_code == 200
+        assert [w["station"]["id"] for w in response.json()] == [station_id]
+
+        response = await client.get(
+            f"/stations/map/current?country={country}&bbox=0,0,1,1",
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
+        response = await client.get(f"/stations/map/current?country={country}&zoom=5")
+        assert response.status_code == 200
+        assert response.json() == []
+
+    response = await client.get("/stations/map/current?country=de&bbox=-90,-180,90,180")
+    assert response.status_code == 200
+    assert [w["station"]["id"] for w in response.json()] == ["10147"]
+
+    for bbox in ("1,2,3", "a,b,c,d", "54,10,53,11"):
+        response = await client.get(f"/stations/map/current?country=de&bbox={bbox}")
+        assert response.status_code == 422
+
+    response = await client.get("/stations/map/current?country=de&zoom=3&cluster=true")
+    assert response.status_code == 200
+    assert [w["station"]["id"] for w in response.json()] == ["10147"]
+
+    response = await client.get("/stations/map/current?country=de&cluster=true")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_stations_details_round_trips(
+    client: AsyncClient,
+    round_trips: RoundTrips,
+) -> None:
+    """Test station details are read concurrently."""
+    get_stations.clear()
+    response = await client.get("/stations/details/METEO-0038?country=si")
+    assert response.status_code == 200
+    # loading stations takes two round trips before the station history is read
+    assert round_trips.sequential == 4
+
+    round_trips.intervals.clear()
+    response = await client.get("/stations/details/METEO-0038?country=si")
+    assert response.status_code == 200
+    # scanning the station history is followed by reading it
+    assert round_trips.sequential == 2
+
+    round_trips.intervals.clear()
+    response = await client.get("/stations/details/METEO-12345?country=si")
+    assert response.status_code == 404
+    # unknown stations are rejected without scanning
+    assert not round_trips.intervals
@@ -2,14 +2,60 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from asyncio import sleep
+from functools import wraps
+from math import inf
+from operator import itemgetter
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 import pytest
 from httpx2 import ASGITransport, AsyncClient
 from pytest_asyncio import is_async_test
+from redis.asyncio.client import Pipeline, Redis
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+ROUND_TRIP_DELAY = 0.01  # seconds
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class RoundTrips:
+    """Redis round trips recorder."""
+
+    def __init__(self) -> None:
+        """Initialise recorder."""
+        self.intervals: list[tuple[float, float]] = []
+
+    @property
+    def sequential(self) -> int:
+        """Number of round trips that did not overlap with each other."""
+        count, end = 0, -inf
+        for start, stop in sorted(self.intervals, key=itemgetter(1)):
+            if start >= end:
+                count += 1
+                end = stop
+        return count
+
+    def measure(
+        self,
+        function: Callable[P, Awaitable[R]],
+    ) -> Callable[P, Awaitable[R]]:
+        """Record a delayed round trip for each call."""
+
+        @wraps(function)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            start = perf_counter()
+            await sleep(ROUND_TRIP_DELAY)
+            try:
+                return await function(*args, **kwargs)
+            finally:
+                self.intervals.append((start, perf_counter()))
+
+        return wrapper
 
 
 def pytest_collection_modifyitems(items: list[Any]) -> None:
@@ -28,3 +74,12 @@ async def client() -> AsyncGenerator[AsyncClient]:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as client:
         yield client
+
+
+@pytest.fixture
+def round_trips(monkeypatch: pytest.MonkeyPatch) -> RoundTrips:
+    """Record Redis round trips, each delayed to expose sequential ones."""
+    trips = RoundTrips()
+    monkeypatch.setattr(Redis, "execute_command", trips.measure(Redis.execute_command))
+    monkeypatch.setattr(Pipeline, "execute", trips.measure(Pipeline.execute))
+    return trips
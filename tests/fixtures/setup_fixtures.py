@@ -6,9 +6,12 @@ from __future__ import annotations
 from asyncio import run
 from datetime import UTC, datetime, timedelta
 
+from vremenar.database.packed import ColumnType, pack_records
 from vremenar.database.redis import redis
 from vremenar.definitions import CountryID, LanguageID
 from vremenar.models.maps import MapType
+from vremenar.sources.arso.utils import RECORD_SCHEMA as ARSO_RECORD_SCHEMA
+from vremenar.sources.dwd.utils import RECORD_SCHEMA as DWD_RECORD_SCHEMA
 from vremenar.utils import to_timestamp
 
 
@@ -42,9 +45,31 @@ async def store_arso_weather_record(
     async with redis.pipeline() as pipeline:
         pipeline.sadd(set_key, key)
         pipeline.hset(key, mapping=record)
+        if key_override == record["timestamp"]:
+            pipeline.zadd(
+                f"arso:weather:station:{record['station_id']}",
+                {key: int(record["timestamp"])},
+            )
         await pipeline.execute()
 
 
+async def store_packed_records(
+    key: str,
+    records: list[dict[str | bytes, str | int | float]],
+    schema: dict[str, ColumnType],
+) -> None:
+    """Store packed weather records to redis."""
+    await redis.set(key, pack_records(records, schema))
+
+
+async def store_arso_weather_48h_record(
+    record: dict[str | bytes, str | int | float],
+) -> None:
+    """Store an ARSO weather record of the last 48 hours to redis."""
+    key = f"arso:weather_48h:{record['timestamp']}:{record['station_id']}"
+    await redis.hset(key, mapping=record)
+
+
 async def store_arso_map_record(
     record: dict[str | bytes, str | int | float],
     map_type: str,
@@ -68,6 +93,10 @@ async def store_mosmix_record(record: dict[str | bytes, str | int | float]) -> N
     async with redis.pipeline() as pipeline:
         pipeline.sadd(set_key, key)
         pipeline.hset(key, mapping=record)
+        pipeline.zadd(
+            f"mosmix:station:{record['station_id']}",
+            {key: int(record["timestamp"])},
+        )
         await pipeline.execute()
 
 
@@ -203,6 +232,24 @@ async def arso_fixtures() -> None:
     await store_arso_weather_record(record_soon)
     await store_arso_weather_record(record_unknown)
 
+    for key, records in (
+        ("current", [record]),
+        (timestamp_soon, [record_soon]),
+        (timestamp, [record_unknown]),
+    ):
+        await store_packed_records(
+            f"arso:weather_packed:{key}",
+            records,
+            ARSO_RECORD_SCHEMA,
+        )
+
+    for hours in range(0, 48, 6):
+        record_48h = record | {
+            "timestamp": to_timestamp(now - timedelta(hours=hours)),
+            "temperature": 10 + hours % 12,
+        }
+        await store_arso_weather_48h_record(record_48h)
+
     map_record: dict[str | bytes, str | int | float] = {
         "timestamp": timestamp,
         "url": "foo",
@@ -309,6 +356,12 @@ async def mosmix_fixtures() -> None:
     await store_mosmix_record(record_soon)
     await store_mosmix_record(record_unknown)
 
+    for key, records in (
+        (timestamp, [record, record_unknown]),
+        (timestamp_soon, [record_soon]),
+    ):
+        await store_packed_records(f"mosmix_packed:{key}", records, DWD_RECORD_SCHEMA)
+
 
 async def alerts_fixtures() -> None:
     """Create and setup weather alerts fixtures."""
@@ -329,7 +382,7 @@ async def alerts_fixtures() -> None:
         "response_type": "prepare",
         "urgency": "immediate",
         "type": "wind",
-        "expires": "1762253200000",  # make expiry date far in the future
+        "expires": "4102444800000",  # make expiry date far in the future
         "certainty": "likely",
         "severity": "minor",
         "onset": "1662220920000",
@@ -352,7 +405,7 @@ async def alerts_fixtures() -> None:
         "response_type": "prepare",
         "urgency": "immediate",
         "type": "wind",
-        "expires": "1762253200000",  # make expiry date far in the future
+        "expires": "4102444800000",  # make expiry date far in the future
         "certainty": "likely",
         "severity": "minor",
         "onset": "1662220920000",
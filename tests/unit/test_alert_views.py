@@ -0,0 +1,76 @@
+"""Materialized alert views tests."""
+
+from __future__ import annotations
+
+from json import loads
+
+import pytest
+
+from vremenar.definitions import CountryID, LanguageID
+from vremenar.models.alerts import AlertAreaWithPolygon
+from vremenar.sources.meteoalarm.views import AlertViews, render_alerts_for_critera
+
+INFO = {
+    "response_type": "prepare",
+    "urgency": "immediate",
+    "type": "wind",
+    "expires": "4102444800000",
+    "certainty": "likely",
+    "severity": "minor",
+}
+LOCALISED = {"event": "wind gusts", "headline": "Official WARNING of WIND GUSTS"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("country", "stations", "areas"),
+    [
+        (CountryID.Germany, ["10147"], None),
+        (CountryID.Germany, ["10147", "P0201"], None),
+        (CountryID.Germany, None, ["DE048"]),
+        (CountryID.Germany, ["10147", "P0201"], ["DE048", "DE413"]),
+        (CountryID.Slovenia, ["METEO-0038"], None),
+    ],
+)
+async def test_alert_views_match_models(
+    country: CountryID,
+    stations: list[str] | None,
+    areas: list[str] | None,
+) -> None:
+    """Test materialized views render the same alerts as the models."""
+    for language in LanguageID:
+        content = await render_alerts_for_critera(country, language, stations, areas)
+        fallback = await render_alerts_for_critera(
+            country,
+            language,
+            stations,
+            areas,
+            views=False,
+        )
+        assert content == fallback
+
+
+def test_alert_views_render() -> None:
+    """Test alerts are merged by time and rendered with the selected areas."""
+    areas = {
+        code: AlertAreaWithPolygon(id=code, name=code, polygons=[])
+        for code in ("A", "B", "C")
+    }
+    records = [
+        ({**INFO, "id": "2", "onset": "1600000"}, LOCALISED, {"A", "B"}),
+        ({**INFO, "id": "1", "onset": "1500000"}, LOCALISED, {"B", "C"}),
+        ({**INFO, "id": "3", "onset": "500000", "expires": "600000"}, LOCALISED, {"A"}),
+    ]
+    views = AlertViews(records, areas)
+
+    alerts = loads(views.render({"A", "C"}))
+    assert [alert["id"] for alert in alerts] == ["1", "2"]
+    assert [area["id"] for area in alerts[0]["areas"]] == ["C"]
+    assert [area["id"] for area in alerts[1]["areas"]] == ["A"]
+
+    alerts = loads(views.render({"B", "D"}))
+    assert [[area["id"] for area in alert["areas"]] for alert in alerts] == [
+        ["B"],
+        ["B"],
+    ]
+    assert views.render({"D"}) == b"[]"
@@ -0,0 +1,154 @@
+"""Alerts stream tests."""
+
+from __future__ import annotations
+
+from asyncio import CancelledError, Event, create_task, sleep, wait_for
+from contextlib import suppress
+from json import loads
+from typing import Any
+
+import pytest
+
+from vremenar.database.redis import redis
+from vremenar.definitions import CountryID, LanguageID
+from vremenar.models.alerts import AlertAreaWithPolygon
+from vremenar.sources.meteoalarm import stream as stream_module
+from vremenar.sources.meteoalarm.stream import AlertsStream, AlertsSubscriber
+from vremenar.sources.meteoalarm.views import AlertViews
+
+INFO = {
+    "response_type": "prepare",
+    "urgency": "immediate",
+    "type": "wind",
+    "expires": "4102444800000",
+    "certainty": "likely",
+    "severity": "minor",
+    "onset": "1662220920000",
+}
+LOCALISED = {"event": "wind gusts", "headline": "Official WARNING of WIND GUSTS"}
+AREAS = {
+    code: AlertAreaWithPolygon(id=code, name=code, polygons=[])
+    for code in ("A", "B", "C")
+}
+
+
+def parse(data: bytes) -> list[tuple[str, Any]]:
+    """Parse server-sent events."""
+    events: list[tuple[str, Any]] = []
+    for block in data.decode().split("\n\n"):
+        if not block:
+            continue
+        kind, payload = block.split("\n")
+        events.append((kind.removeprefix("event: "), loads(payload[6:])))
+    return events
+
+
+def drain(*subscribers: AlertsSubscriber) -> list[tuple[str, Any]]:
+    """Get queued events of subscribers."""
+    events: list[tuple[str, Any]] = []
+    for subscriber in subscribers:
+        while not subscriber.queue.empty():
+            events.extend(parse(subscriber.queue.get_nowait()))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_alerts_stream_snapshot() -> None:
+    """Test subscribers start with the active alerts of their areas."""
+    stream = AlertsStream(redis)
+    subscriber = await stream.subscribe(
+        CountryID.Germany,
+        LanguageID.English,
+        {"DE048"},
+    )
+    assert stream.stats()["subscribers"] == 1
+
+    # closed subscribers receive the queued events before the stream ends
+    subscriber.closed = True
+    events = [data async for data in stream.events_for(subscriber)]
+    assert stream.stats()["subscribers"] == 0
+
+    [(kind, alert)] = parse(events[0])
+    assert kind == "added"
+    assert alert["id"] == "2.49.0.0.276.0.DWD.PVW.TEST"
+    assert [area["id"] for area in alert["areas"]] == ["DE048"]
+
+
+@pytest.mark.asyncio
+async def test_alerts_stream_changes() -> None:
+    """Test alert changes are sent to subscribers of affected areas."""
+    stream = AlertsStream(redis)
+    country, language = CountryID.Slovenia, LanguageID.English
+    first = await stream.subscribe(country, language, {"A"})
+    second = await stream.subscribe(country, language, {"B", "C"})
+
+    stream.publish(
+        country,
+        language,
+        AlertViews(
+            [
+                ({**INFO, "id": "1"}, LOCALISED, {"A", "B"}),
+                ({**INFO, "id": "2"}, LOCALISED, {"C"}),
+            ],
+            AREAS,
+        ),
+    )
+    assert [(kind, alert["id"]) for kind, alert in drain(first)] == [("added", "1")]
+    assert sorted(
+        (kind, alert["id"], [area["id"] for area in alert["areas"]])
+        for kind, alert in drain(second)
+    ) == [("added", "1", ["B"]), ("added", "2", ["C"])]
+
+    stream.publish(
+        country,
+        language,
+        AlertViews(
+            [
+                ({**INFO, "id": "1"}, LOCALISED, {"B"}),
+                ({**INFO, "id": "2"}, {**LOCALISED, "headline": "Updated"}, {"C"}),
+            ],
+            AREAS,
+        ),
+    )
+    assert drain(first) == [("expired", {"id": "1"})]
+    assert sorted((kind, alert["id"]) for kind, alert in drain(second)) == [
+        ("updated", "2"),
+    ]
+
+    stream.publish(country, language, AlertViews([], AREAS))
+    assert sorted(drain(second), key=str) == [
+        ("expired", {"id": "1"}),
+        ("expired", {"id": "2"}),
+    ]
+    assert stream.stats()["events"] == 7
+    stream.unsubscribe(first)
+    stream.unsubscribe(second)
+
+
+@pytest.mark.asyncio
+async def test_alerts_stream_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the listener keeps running when refreshing fails."""
+    stream = AlertsStream(redis)
+    retried = Event()
+    calls = 0
+
+    async def refresh(_: set[CountryID]) -> None:
+        nonlocal calls
+        await sleep(0)
+        calls += 1
+        if calls > 1:
+            retried.set()
+        message = "invalid alert"
+        raise ValueError(message)
+
+    monkeypatch.setattr(stream, "refresh", refresh)
+    monkeypatch.setattr(stream_module, "ALERTS_STREAM_RECONNECT_DELAY", 0)
+
+    task = create_task(stream.run())
+    await wait_for(retried.wait(), 5)
+    task.cancel()
+    with suppress(CancelledError):
+        await task
+
+    assert stream.stats()["errors"] >= 1
+    assert not stream.stats()["connected"]
@@ -0,0 +1,193 @@
+"""In-process cache tests."""
+
+from __future__ import annotations
+
+from asyncio import Event, create_task, gather, sleep
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from vremenar import cache as cache_module
+from vremenar.cache import AsyncCache, SWRCache, cached, swr_cached
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> dict[str, AsyncCache[Any, Any]]:
+    """Register test caches locally instead of in the global registry."""
+    caches: dict[str, AsyncCache[Any, Any]] = {}
+    monkeypatch.setattr(cache_module, "caches", caches)
+    return caches
+
+
+@pytest.mark.asyncio
+async def test_cache_single_flight(registry: dict[str, AsyncCache[Any, Any]]) -> None:
+    """Test that concurrent calls share a single load."""
+    calls: list[str] = []
+
+    @cached("test_single_flight")
+    async def load(key: str) -> str:
+        calls.append(key)
+        await sleep(0)
+        return key.upper()
+
+    assert registry["test_single_flight"] is load
+
+    results = await gather(load("a"), load("a"), load("b"))
+    assert list(results) == ["A", "A", "B"]
+    assert calls == ["a", "b"]
+    assert load.stats()["entries"] == 2
+    assert load.stats()["generation"] == 2
+
+    load.invalidate("a")
+    assert load.stats()["entries"] == 1
+    assert await load("a") == "A"
+    assert calls == ["a", "b", "a"]
+
+    load.clear()
+    assert load.stats()["entries"] == 0
+    assert load.stats()["age"] is None
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_load() -> None:
+    """Test that loads running while invalidated are not stored."""
+    version = 1
+    started = Event()
+    release = Event()
+
+    async def load() -> int:
+        value = version
+        started.set()
+        await release.wait()
+        return value
+
+    # every call loads
+    cache = AsyncCache(load, "test_invalidated_load", ttl=0)
+    invalidations: tuple[Callable[[], None], ...] = (
+        cache.invalidate,
+        cache.invalidate_prefix,
+        cache.clear,
+    )
+    for invalidate in invalidations:
+        started.clear()
+        release.clear()
+        outdated = create_task(cache())
+        await started.wait()
+        version += 1
+        invalidate()
+        current = create_task(cache())
+        release.set()
+
+        assert await outdated == version - 1
+        assert await current == version
+        assert await cache() == version
+        assert cache.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_stale() -> None:
+    """Test that stale values are served when reloading fails."""
+    fail = False
+
+    async def load() -> int:
+        await sleep(0)
+        if fail:
+            raise RedisConnectionError
+        return 42
+
+    cache = AsyncCache(load, "test_stale", ttl=0)
+
+    assert await cache() == 42
+    assert not cache.stats()["stale"]
+    # expired entries are reloaded on access, so they do not age the cache
+    assert cache.stats()["age"] is None
+
+    fail = True
+    assert await cache() == 42
+    assert cache.stats()["stale"]
+    assert cache.stats()["age"] is not None
+    assert cache.stats()["stale_serves"] == 1
+
+    cache.clear()
+    with pytest.raises(RedisConnectionError):
+        await cache()
+
+
+@pytest.mark.asyncio
+async def test_cache_size() -> None:
+    """Test that least recently used entries are evicted."""
+
+    async def load(key: str) -> str:
+        await sleep(0)
+        return key.upper()
+
+    cache = AsyncCache(load, "test_size", size=2, sizeof=len)
+
+    assert await cache("a") == "A"
+    assert await cache("bb") == "BB"
+    assert await cache("a") == "A"
+    assert await cache("ccc") == "CCC"
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["memory"] == 4
+    assert cache.stats()["generation"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_stale_while_revalidate(
+    registry: dict[str, AsyncCache[Any, Any]],
+) -> None:
+    """Test that outdated values are served while refreshed in the background."""
+    calls: list[int] = []
+
+    @swr_cached("test_swr", soft_ttl=0, hard_ttl=60)
+    async def load() -> int:
+        calls.append(len(calls))
+        await sleep(0)
+        if len(calls) == 4:
+            raise ValueError
+        return len(calls)
+
+    assert registry["test_swr"] is load
+
+    assert await load() == 1
+    assert list(await gather(load(), load())) == [1, 1]
+    await sleep(0.01)
+    assert calls == [0, 1]
+    assert await load() == 2
+    await sleep(0.01)
+    assert await load() == 3
+
+    # failed refreshes keep the previous value
+    await sleep(0.01)
+    assert await load() == 3
+    await sleep(0.01)
+    assert calls == [0, 1, 2, 3, 4]
+
+    stats = load.stats()
+    assert stats["stale_serves"] == 5
+    assert stats["refreshes"] == 5
+    assert stats["refresh_average"] is not None
+    assert stats["refresh_max"] is not None
+
+
+@pytest.mark.asyncio
+async def test_cache_stale_while_revalidate_expired() -> None:
+    """Test that values older than the hard TTL are reloaded before returning."""
+    calls: list[int] = []
+
+    async def load() -> int:
+        calls.append(len(calls))
+        await sleep(0)
+        return len(calls)
+
+    cache = SWRCache(load, "test_swr_expired", soft_ttl=0, hard_ttl=0)
+    assert await cache() == 1
+    assert await cache() == 2
+    assert cache.stats()["stale_serves"] == 0
@@ -0,0 +1,111 @@
+"""Response compression tests."""
+
+from __future__ import annotations
+
+from gzip import decompress
+from json import loads
+from typing import TYPE_CHECKING
+
+import pytest
+
+from vremenar import compression
+from vremenar.api import responses
+from vremenar.api.responses import ContentHeaders, Payload
+from vremenar.compression import compress, encoders, negotiate_encoding
+
+if TYPE_CHECKING:
+    from httpx2 import AsyncClient
+
+
+def test_negotiate_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the preferred available encoding is negotiated."""
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("GZIP;q=0.5") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("gzip;q=invalid") is None
+    assert negotiate_encoding("*") == next(iter(encoders))
+    assert negotiate_encoding("*, gzip;q=0") == (
+        next(iter(encoders)) if len(encoders) > 1 else None
+    )
+
+    monkeypatch.setattr(
+        compression,
+        "encoders",
+        {"br": encoders["gzip"], "gzip": encoders["gzip"]},
+    )
+    assert negotiate_encoding("gzip, br") == "br"
+    assert negotiate_encoding("gzip, br;q=0.5") == "gzip"
+
+    monkeypatch.setattr(compression, "COMPRESSION", False)
+    assert negotiate_encoding("gzip") is None
+
+
+@pytest.mark.asyncio
+async def test_payload_variants() -> None:
+    """Test compressed payload variants are stored and negotiated."""
+    small = Payload(b"[]")
+    response = small.response(ContentHeaders(accept_encoding="gzip"))
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["ETag"] == small.etag
+
+    content = b"[" + b",".join([b'{"id":"station"}'] * 200) + b"]"
+    payload = await Payload(content).precompress()
+    assert payload.variants.keys() == {("application/json", e) for e in encoders}
+    assert decompress(payload.variants["application/json", "gzip"]) == content
+
+    response = payload.response(ContentHeaders(accept_encoding="gzip"))
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept, Accept-Encoding"
+    assert response.body is payload.variants["application/json", "gzip"]
+
+    etag = response.headers["ETag"]
+    assert etag != payload.etag
+    assert (
+        payload.response(
+            ContentHeaders(if_none_match=etag, accept_encoding="gzip"),
+        ).status_code
+        == 304
+    )
+    assert payload.response(ContentHeaders(if_none_match=etag)).status_code == 200
+    assert payload.response().body == content
+
+
+@pytest.mark.asyncio
+async def test_compression_request(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test cached and uncached responses are compressed."""
+    monkeypatch.setattr(compression, "COMPRESSION_MINIMUM_SIZE", 100)
+    monkeypatch.setattr(responses, "COMPRESSION_MINIMUM_SIZE", 100)
+    response = await client.get(
+        "/alerts/areas?country=de",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"].endswith('-gzip"')
+    assert loads(response.content)
+
+    response = await client.get(
+        "/stations/list?country=si&extended=true",
+        headers={"Accept-Encoding": "identity"},
+    )
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert len(compress(response.content, "gzip")) < len(response.content)
+
+    # compressed on the fly
+    response = await client.get(
+        "/alerts/full_list?country=de",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert loads(response.content)
+
+    response = await client.get("/version", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
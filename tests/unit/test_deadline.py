@@ -0,0 +1,124 @@
+"""Request deadlines tests."""
+
+from __future__ import annotations
+
+from asyncio import sleep
+from time import monotonic
+from typing import TYPE_CHECKING
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from vremenar import deadline
+from vremenar.cache import AsyncCache
+from vremenar.deadline import (
+    bounded,
+    parse_route_deadlines,
+    remaining,
+    request_deadline,
+    route_deadline,
+)
+from vremenar.exceptions import DeadlineExceededException
+
+if TYPE_CHECKING:
+    from httpx2 import AsyncClient
+
+    from tests.conftest import RoundTrips
+
+
+def test_route_deadlines(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test route deadlines are matched by the longest path prefix."""
+    assert parse_route_deadlines(" /maps=3, /maps/list=1.5,invalid") == {
+        "/maps": 3,
+        "/maps/list": 1.5,
+    }
+
+    monkeypatch.setattr(deadline, "ROUTE_DEADLINES", {"/maps": 3, "/maps/list": 1})
+    assert route_deadline("/maps/list/temperature") == 1
+    assert route_deadline("/maps/types") == 3
+    assert route_deadline("/version") == deadline.REQUEST_DEADLINE
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounded() -> None:
+    """Test calls are cancelled when the deadline is exceeded."""
+    assert remaining() is None
+    async with bounded():
+        await sleep(0)
+
+    token = request_deadline.set(monotonic() + 0.01)
+    try:
+        with pytest.raises(DeadlineExceededException):
+            async with bounded():
+                await sleep(1)
+
+        # no time left, fail before starting the call
+        with pytest.raises(DeadlineExceededException):
+            async with bounded():
+                pytest.fail("Call started after the deadline")
+    finally:
+        request_deadline.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_deadline_cache_stale() -> None:
+    """Test cached values are served when reloading exceeds the deadline."""
+    delay = 0.0
+
+    async def load() -> float:
+        async with bounded():
+            await sleep(delay)
+        return delay
+
+    cache = AsyncCache(load, "test_deadline", ttl=0)
+    assert await cache() == 0
+
+    delay = 0.1
+    token = request_deadline.set(monotonic() + 0.01)
+    try:
+        assert await cache() == 0
+    finally:
+        request_deadline.reset(token)
+    assert cache.stats()["stale"]
+    assert cache.stats()["stale_serves"] == 1
+
+    # the shared load is not bound to the deadline of the first caller
+    assert await cache() == delay
+    assert not cache.stats()["stale"]
+
+
+@pytest.mark.asyncio
+async def test_deadline_cache_abandoned(caplog: pytest.LogCaptureFixture) -> None:
+    """Test failed shared loads are logged after their callers gave up."""
+
+    async def load() -> int:
+        await sleep(0.05)
+        raise RedisConnectionError
+
+    cache = AsyncCache(load, "test_deadline_abandoned")
+    token = request_deadline.set(monotonic() + 0.01)
+    try:
+        with pytest.raises(DeadlineExceededException):
+            await cache()
+    finally:
+        request_deadline.reset(token)
+
+    await sleep(0.1)
+    assert "Loading test_deadline_abandoned cache failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_deadline_request(
+    client: AsyncClient,
+    round_trips: RoundTrips,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test requests exceeding the deadline fail fast."""
+    monkeypatch.setitem(deadline.ROUTE_DEADLINES, "/stations/find", 0.001)
+    response = await client.post(
+        "/stations/find?country=si",
+        json={"latitude": 46.3684, "longitude": 14.1101},
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert len(round_trips.intervals) <= 1
@@ -3,6 +3,7 @@
 import pytest
 
 from vremenar.exceptions import (
+    DeadlineExceededException,
     InvalidSearchQueryException,
     UnknownAlertAreaException,
     UnknownStationAlertAreaException,
@@ -33,6 +34,9 @@ def test_exceptions() -> None:
     with pytest.raises(UnknownStationException):
         raise UnknownStationException
 
+    with pytest.raises(DeadlineExceededException):
+        raise DeadlineExceededException
+
     err = "Test message"
     with pytest.raises(InvalidSearchQueryException):
         raise InvalidSearchQueryException(err)
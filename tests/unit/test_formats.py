@@ -0,0 +1,106 @@
+"""Binary response formats tests."""
+
+from __future__ import annotations
+
+from json import dumps, loads
+from typing import TYPE_CHECKING
+
+import pytest
+
+from vremenar.api import responses
+from vremenar.api.responses import (
+    JSON,
+    ContentHeaders,
+    Payload,
+    negotiate_format,
+    serialize,
+)
+from vremenar.models.common import Coordinate
+from vremenar.models.stations import StationInfo
+
+if TYPE_CHECKING:
+    from httpx2 import AsyncClient
+
+
+def tagged(data: object) -> bytes:
+    """Serialize data in a recognisable way."""
+    return b"tagged:" + dumps(data).encode()
+
+
+@pytest.fixture
+def binary_formats(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace binary serializers."""
+    monkeypatch.setattr(
+        responses,
+        "formats",
+        {"application/msgpack": tagged, "application/cbor": tagged},
+    )
+
+
+@pytest.mark.usefixtures("binary_formats")
+def test_negotiate_format() -> None:
+    """Test binary formats are used only when preferred over JSON."""
+    assert negotiate_format(None) == JSON
+    assert negotiate_format("*/*") == JSON
+    assert negotiate_format("application/json, application/msgpack") == JSON
+    assert negotiate_format("application/msgpack") == "application/msgpack"
+    assert negotiate_format("application/cbor, */*;q=0.1") == "application/cbor"
+    assert (
+        negotiate_format("application/cbor, application/msgpack")
+        == "application/msgpack"
+    )
+    assert negotiate_format("application/msgpack;q=0.5, application/json") == JSON
+    assert negotiate_format("application/yaml") == JSON
+
+
+def test_negotiate_format_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test JSON is used without binary serializers."""
+    monkeypatch.setattr(responses, "formats", {})
+    assert negotiate_format("application/msgpack") == JSON
+
+
+@pytest.mark.usefixtures("binary_formats")
+def test_payload_formats() -> None:
+    """Test payload formats are serialized once from the decoded JSON."""
+    station = StationInfo(
+        id="1",
+        name="Ljubljana",
+        coordinate=Coordinate(latitude=46.0, longitude=14.5),
+    )
+    payload = Payload.serialize([station], list[StationInfo])
+    assert payload.content == serialize([station], list[StationInfo])
+
+    response = payload.response(ContentHeaders(accept="application/msgpack"))
+    assert response.media_type == "application/msgpack"
+    assert response.body == tagged(loads(payload.content))
+    assert (
+        response.body
+        is payload.response(
+            ContentHeaders(accept="application/msgpack"),
+        ).body
+    )
+    assert response.headers["ETag"] == f'"{payload.digest}-msgpack"'
+
+    assert payload.response().media_type == JSON
+    assert payload.response().body is payload.content
+
+
+@pytest.mark.asyncio
+async def test_formats_request(client: AsyncClient) -> None:
+    """Test responses in binary formats."""
+    msgpack = pytest.importorskip("msgpack")
+    if "application/msgpack" not in responses.formats:
+        pytest.skip("msgpack serializer not loaded")
+
+    response = await client.get("/stations/map/current?country=si")
+    assert response.headers["Content-Type"] == JSON
+    expected = response.json()
+
+    response = await client.get(
+        "/stations/map/current?country=si",
+        headers={"Accept": "application/msgpack"},
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == expected
+    assert len(response.content) < len(dumps(expected))
@@ -0,0 +1,169 @@
+"""DWD condition frames tests."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from operator import itemgetter
+
+import pytest
+
+from vremenar.definitions import ObservationType
+from vremenar.exceptions import UnrecognisedMapIDException
+from vremenar.models.common import Coordinate
+from vremenar.models.stations import StationInfoExtended
+from vremenar.sources.dwd.frames import ConditionFrame, ConditionFrames, StationIndex
+from vremenar.sources.dwd.utils import get_mosmix_records, parse_record
+from vremenar.utils import distance, to_timestamp
+
+
+@pytest.mark.asyncio
+async def test_frames_parity() -> None:
+    """Test frames match parsed MOSMIX records."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    frames = ConditionFrames(size=1)
+    frame = await frames.get(timestamp)
+    records = await get_mosmix_records(timestamp)
+
+    expected = []
+    for record in records:
+        station, condition = await parse_record(record, ObservationType.Forecast)
+        if station and condition:
+            expected.append((station.id, condition))
+            assert frame.get(station.id, ObservationType.Forecast) == condition
+
+    weather_map = frame.weather_map(ObservationType.Forecast)
+    assert [(w.station.id, w.condition) for w in weather_map] == expected
+    assert frame.get("unknown", ObservationType.Forecast) is None
+
+    stats = frames.cache.stats()
+    assert stats["entries"] == 1
+    assert stats["memory"] == frame.nbytes == len(frame.index) * 25
+
+    with pytest.raises(UnrecognisedMapIDException):
+        await frames.get("1")
+
+
+@pytest.mark.asyncio
+async def test_frames_parity_empty_values() -> None:
+    """Test frames match parsed MOSMIX records with empty values."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    frames = ConditionFrames(size=1)
+    index = await frames.station_index()
+    records = [dict(record) for record in await get_mosmix_records(timestamp)]
+    for position, record in enumerate(records):
+        if position % 2:
+            record.pop("cloud_cover", None)
+            record.pop("precipitation_60", None)
+            record.pop("precipitation", None)
+        else:
+            record.update(cloud_cover="", precipitation_60="", precipitation="")
+    frame = ConditionFrame.from_records(index, timestamp, records)
+
+    compared = 0
+    for record in records:
+        station, condition = await parse_record(record, ObservationType.Forecast)
+        if station and condition:
+            assert frame.get(station.id, ObservationType.Forecast) == condition
+            if record.get("condition") != "fog":
+                assert condition.icon.startswith("clear_")
+            compared += 1
+    assert compared
+
+
+@pytest.mark.asyncio
+async def test_frames_station_snapshot() -> None:
+    """Test frames are reloaded when the station snapshot changes."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    frames = ConditionFrames(size=2)
+    frame = await frames.get(timestamp)
+    assert await frames.get(timestamp) is frame
+
+    frames.index = None
+    reloaded = await frames.get(timestamp)
+    assert reloaded is not frame
+    assert reloaded.index is await frames.station_index()
+
+    empty = ConditionFrame(reloaded.index, timestamp)
+    assert not empty.weather_map(ObservationType.Forecast)
+
+
+def test_frames_interpolate() -> None:
+    """Test inverse-distance weighted interpolation."""
+    snapshot = {
+        station_id: StationInfoExtended(
+            id=station_id,
+            name=station_id,
+            coordinate=Coordinate(latitude=50, longitude=longitude, altitude=100),
+            metadata={"status": "1"},
+        )
+        for station_id, longitude in (("a", 10.0), ("b", 10.2), ("c", 12.0))
+    }
+    index = StationIndex(snapshot)
+    frame = ConditionFrame(index, "1604779200000")
+    frame.temperature[0], frame.temperature[1] = 10, 20
+    frame.cloud_cover[0], frame.cloud_cover[1] = 0, 100
+    frame.condition[1] = 2
+
+    # halfway between a and b, c is outside of the radius
+    coordinate = Coordinate(latitude=50, longitude=10.1)
+    neighbours = index.neighbours(coordinate, 4, 50)
+    assert [position for position, _ in neighbours] in ([0, 1], [1, 0])
+
+    condition = frame.interpolate(neighbours, coordinate, ObservationType.Forecast)
+    assert condition is not None
+    assert condition.temperature == 15
+    assert condition.icon.startswith("prevCloudy")
+
+    # 500 m higher
+    coordinate = Coordinate(latitude=50, longitude=10.0, altitude=600)
+    neighbours = index.neighbours(coordinate, 1, 50)
+    condition = frame.interpolate(neighbours, coordinate, ObservationType.Forecast)
+    assert condition is not None
+    assert condition.temperature == 6.75
+    assert condition.icon.startswith("clear")
+
+    neighbours = index.neighbours(Coordinate(latitude=50, longitude=12.0), 4, 50)
+    assert neighbours == [(2, 10000)]
+    assert frame.interpolate(neighbours, coordinate, ObservationType.Forecast) is None
+
+
+def test_frames_neighbours() -> None:
+    """Test neighbour search matches measuring all stations."""
+    snapshot = {
+        f"{latitude}-{longitude}": StationInfoExtended(
+            id=f"{latitude}-{longitude}",
+            name="station",
+            coordinate=Coordinate(latitude=latitude / 10, longitude=longitude / 10),
+            metadata={"status": "1"},
+        )
+        for latitude in range(470, 550, 3)
+        for longitude in range(60, 150, 7)
+    }
+    index = StationIndex(snapshot)
+    coordinate = Coordinate(latitude=50.12, longitude=8.68)
+
+    expected = sorted(
+        (
+            (position, d)
+            for position, station in enumerate(index.stations)
+            if (
+                d := distance(
+                    coordinate.latitude,
+                    coordinate.longitude,
+                    station.coordinate.latitude,
+                    station.coordinate.longitude,
+                )
+            )
+            <= 50
+        ),
+        key=itemgetter(1),
+    )[:4]
+    neighbours = index.neighbours(coordinate, 4, 50)
+    assert [position for position, _ in neighbours] == [p for p, _ in expected]
+    assert neighbours == [(p, 1 / d**2) for p, d in expected]
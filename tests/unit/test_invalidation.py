@@ -0,0 +1,118 @@
+"""Cache invalidation bus tests."""
+
+from __future__ import annotations
+
+from asyncio import sleep
+
+import pytest
+
+from vremenar.cache import AsyncCache
+from vremenar.database.invalidation import (
+    INVALIDATION_GENERATIONS,
+    InvalidationBus,
+    invalidation,
+)
+from vremenar.database.redis import redis
+from vremenar.database.stations import get_stations
+from vremenar.definitions import CountryID
+from vremenar.models.maps import MapType
+from vremenar.sources.wrapper import get_map_layers, invalidate_map_layers
+
+
+async def load(country: str, language: str = "en") -> str:
+    """Load test value."""
+    await sleep(0)
+    return f"{country}:{language}"
+
+
+@pytest.mark.asyncio
+async def test_invalidation_events() -> None:
+    """Test events evict only the matching cache entries."""
+    bus = InvalidationBus(redis)
+    cache = AsyncCache(load, "test_invalidation")
+    bus.register_cache("alerts", cache)
+    await cache("si", "en")
+    await cache("si", "sl")
+    await cache("de", "en")
+
+    await bus.handle("alerts:si")
+    assert cache.stats()["entries"] == 1
+    await bus.handle("stations:si")
+    assert cache.stats()["entries"] == 1
+    await bus.handle("alerts")
+    assert cache.stats()["entries"] == 0
+
+    def fail(_: str | None) -> None:
+        raise KeyError
+
+    invalidated: list[str | None] = []
+    bus.register("stations", fail)
+    bus.register("stations", invalidated.append)
+    await bus.handle("stations:foo")
+    assert invalidated == ["foo"]
+    assert bus.stats()["events"] == 4
+    assert bus.stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_stations() -> None:
+    """Test station snapshots are invalidated per country."""
+    slovenia = await get_stations(CountryID.Slovenia)
+    germany = await get_stations(CountryID.Germany)
+
+    await invalidation.handle("stations:si")
+    assert await get_stations(CountryID.Slovenia) is not slovenia
+    assert await get_stations(CountryID.Germany) is germany
+
+
+@pytest.mark.asyncio
+async def test_invalidation_map_layers() -> None:
+    """Test ARSO map layers are invalidated per map type."""
+    condition = await get_map_layers(CountryID.Slovenia, MapType.WeatherCondition)
+    precipitation = await get_map_layers(CountryID.Slovenia, MapType.Precipitation)
+
+    await invalidation.handle("arso:map:condition")
+    assert (
+        await get_map_layers(CountryID.Slovenia, MapType.WeatherCondition)
+        is not condition
+    )
+    assert (
+        await get_map_layers(CountryID.Slovenia, MapType.Precipitation) is precipitation
+    )
+
+    invalidate_map_layers(None)
+    assert (
+        await get_map_layers(CountryID.Slovenia, MapType.Precipitation)
+        is not precipitation
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidation_resync() -> None:
+    """Test caches of kinds with missed events are evicted after reconnecting."""
+    bus = InvalidationBus(redis)
+    alerts = AsyncCache(load, "test_resync_alerts")
+    mosmix = AsyncCache(load, "test_resync_mosmix")
+    bus.register_cache("alerts", alerts)
+    bus.register_cache("mosmix", mosmix)
+    await alerts("si")
+    await mosmix("1")
+
+    await bus.resync()
+    assert bus.stats()["resyncs"] == 0
+
+    # received events are not missed
+    await bus.publish("alerts:si")
+    await bus.handle("alerts:si")
+    await alerts("si")
+    await bus.resync()
+    assert bus.stats()["resyncs"] == 0
+    assert alerts.stats()["entries"] == 1
+
+    await bus.publish("mosmix:1")
+    await bus.resync()
+    assert bus.stats()["resyncs"] == 1
+    assert alerts.stats()["entries"] == 1
+    assert mosmix.stats()["entries"] == 0
+
+    await redis.delete(INVALIDATION_GENERATIONS)
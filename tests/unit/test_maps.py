@@ -0,0 +1,29 @@
+"""Map sources tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from vremenar.definitions import CountryID
+from vremenar.models.maps import MapType
+from vremenar.sources import (
+    get_all_map_legends,
+    get_all_supported_map_types,
+    get_map_legend,
+)
+
+
+@pytest.mark.parametrize("country", [CountryID.Slovenia, CountryID.Germany])
+def test_cached_maps_copies(country: CountryID) -> None:
+    """Test callers can not modify cached map types and legends."""
+    supported = get_all_supported_map_types(country)
+    has_legend = supported[0].has_legend
+    supported[0].has_legend = not has_legend
+    supported.clear()
+    assert get_all_supported_map_types(country)[0].has_legend == has_legend
+
+    legend = get_map_legend(country, MapType.Precipitation)
+    legend.items[0].value = "changed"
+    legend.items.clear()
+    assert get_map_legend(country, MapType.Precipitation).items[0].value != "changed"
+    assert get_all_map_legends(country)[0].items
@@ -0,0 +1,93 @@
+"""Redis near cache tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from vremenar.database.near_cache import NearCache
+from vremenar.database.redis import redis
+
+
+def test_near_cache_lru() -> None:
+    """Test least recently used entries are evicted."""
+    cache = NearCache(redis, 2)
+    cache.put("station:si:1", {"id": "1"}, cache.sequence)
+    cache.put("station:si:2", {"id": "2"}, cache.sequence)
+    assert cache.get("station:si:1") == {"id": "1"}
+
+    cache.put("station:si:3", {"id": "3"}, cache.sequence)
+    assert cache.get("station:si:1") == {"id": "1"}
+    assert cache.get("station:si:2") is None
+    assert cache.get("station:si:3") == {"id": "3"}
+    assert cache.stats()["entries"] == 2
+
+
+def test_near_cache_invalidate() -> None:
+    """Test invalidation messages."""
+    cache = NearCache(redis, 10)
+    cache.put("station:si:1", {"id": "1"}, cache.sequence)
+    cache.put("station:si:2", {"id": "2"}, cache.sequence)
+
+    cache.invalidate(["station:si:1"])
+    assert cache.get("station:si:1") is None
+    assert cache.get("station:si:2") == {"id": "2"}
+
+    cache.invalidate(None)
+    assert cache.get("station:si:2") is None
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_near_cache_invalidate_while_reading() -> None:
+    """Test values read before an invalidation are not stored."""
+    cache = NearCache(redis, 10)
+    sequence = cache.sequence
+    cache.invalidate(["station:si:1"])
+    cache.put("station:si:1", {"id": "1"}, sequence)
+    assert cache.get("station:si:1") is None
+
+
+@pytest.mark.asyncio
+async def test_near_cache_hgetall() -> None:
+    """Test hashes are served from the cache only while connected."""
+    station_ids = [
+        min(await redis.smembers(f"station:{country}")) for country in ("si", "de")
+    ]
+    keys = [
+        f"station:si:{station_ids[0]}",
+        f"station:de:{station_ids[1]}",
+        "station:si:unknown",
+    ]
+
+    cache = NearCache(redis, 10)
+    result = await cache.hgetall(redis, keys)
+    assert [r.get("id") for r in result] == [*station_ids, None]
+    assert cache.stats()["entries"] == 0
+
+    cache.connected = True
+    assert await cache.hgetall(redis, keys) == result
+    assert await cache.hgetall(redis, keys) == result
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 4
+
+    cache.invalidate([keys[0]])
+    assert await cache.hgetall(redis, keys) == result
+    assert cache.stats()["misses"] == 6
+
+
+@pytest.mark.asyncio
+async def test_near_cache_hgetall_fields() -> None:
+    """Test only requested fields of uncached hashes are read."""
+    keys = sorted(await redis.keys("arso:weather_48h:*"))
+    keys.append("station:si:METEO-0038")
+    keys.append("arso:weather_48h:unknown")
+
+    cache = NearCache(redis, 10)
+    cache.connected = True
+    result = await cache.hgetall(redis, keys, ("timestamp", "temperature", "foo"))
+    assert all(set(r) == {"timestamp", "temperature"} for r in result[:-2])
+    assert result[-2]["id"] == "METEO-0038"
+    assert result[-1] == {}
+    assert cache.stats()["entries"] == 1
@@ -0,0 +1,88 @@
+"""Packed weather records tests."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from vremenar.database.packed import (
+    ColumnType,
+    get_packed_records,
+    pack_records,
+    unpack_records,
+)
+from vremenar.definitions import ObservationType
+from vremenar.sources.arso import utils as arso
+from vremenar.sources.dwd import utils as dwd
+from vremenar.utils import to_timestamp
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+SCHEMA = {
+    "station_id": ColumnType.Text,
+    "name": ColumnType.Text,
+    "temperature": ColumnType.Number,
+}
+
+
+async def parse(
+    records: list[dict[str, Any]],
+    parser: Callable[[dict[str, Any], ObservationType], Awaitable[Any]],
+) -> list[Any]:
+    """Parse records sorted by station and time."""
+    return [
+        await parser(record, ObservationType.Forecast)
+        for record in sorted(records, key=itemgetter("station_id", "timestamp"))
+    ]
+
+
+def test_packed_round_trip() -> None:
+    """Test records are unpacked unchanged, without missing values."""
+    records: list[dict[str, Any]] = [
+        {"station_id": "1", "name": "Ljubljana", "temperature": 12.5},
+        {"station_id": "2", "name": "Šmarje", "foo": "bar"},
+        {"station_id": "3", "temperature": -3},
+    ]
+
+    assert unpack_records(pack_records(records, SCHEMA)) == [
+        {"station_id": "1", "name": "Ljubljana", "temperature": 12.5},
+        {"station_id": "2", "name": "Šmarje"},
+        {"station_id": "3", "temperature": -3.0},
+    ]
+    assert unpack_records(pack_records([], SCHEMA)) == []
+
+
+def test_packed_invalid() -> None:
+    """Test invalid values are rejected."""
+    with pytest.raises(ValueError, match="Invalid packed records"):
+        unpack_records(b"VRP0" + pack_records([], SCHEMA)[4:])
+
+
+@pytest.mark.asyncio
+async def test_packed_records() -> None:
+    """Test packed records match the hash records."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    records = await dwd.get_mosmix_records(timestamp, packed=True)
+    fallback = await dwd.get_mosmix_records(timestamp, packed=False)
+    assert len(records) == 2
+    assert await parse(records, dwd.parse_record) == await parse(
+        fallback,
+        dwd.parse_record,
+    )
+
+    records = await arso.get_weather_records_for_timestamp("current", packed=True)
+    fallback = await arso.get_weather_records_for_timestamp("current", packed=False)
+    assert len(records) == 1
+    assert await parse(records, arso.parse_record) == await parse(
+        fallback,
+        arso.parse_record,
+    )
+
+    assert await get_packed_records("mosmix_packed:1") is None
+    assert not await dwd.get_mosmix_records("1", packed=True)
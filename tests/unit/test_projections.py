@@ -0,0 +1,56 @@
+"""Model projection tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from vremenar.api.responses import serialize
+from vremenar.database.stations import get_stations
+from vremenar.definitions import CountryID
+from vremenar.models.alerts import AlertArea
+from vremenar.models.stations import StationBase, StationInfo
+from vremenar.models.weather import WeatherInfo
+from vremenar.sources import get_weather_map
+from vremenar.sources.meteoalarm.alerts import list_alerts_areas
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("country", [CountryID.Slovenia, CountryID.Germany])
+async def test_projections_parity(country: CountryID) -> None:
+    """Test projections match models validated from dumps."""
+    stations = list((await get_stations(country)).values())
+    assert stations
+    for station in stations:
+        info = StationInfo.model_validate(station.model_dump(exclude={"metadata"}))
+        assert station.info() == info
+        assert station.info().model_fields_set == info.model_fields_set
+        assert serialize(station.info(), StationInfo) == serialize(info, StationInfo)
+
+        base = StationBase.model_validate(station.model_dump(include={"id"}))
+        assert station.base() == base
+        assert serialize(station.base(), StationBase) == serialize(base, StationBase)
+
+    for condition in await get_weather_map(country, "current"):
+        weather = WeatherInfo(
+            station=StationBase.model_validate(condition.station.model_dump()),
+            condition=condition.condition,
+        )
+        assert serialize(condition.base(), WeatherInfo) == serialize(
+            weather,
+            WeatherInfo,
+        )
+
+
+@pytest.mark.asyncio
+async def test_alert_area_projection() -> None:
+    """Test alert area projection drops polygons."""
+    areas = await list_alerts_areas(CountryID.Germany)
+    assert areas
+    for area in areas.values():
+        base = area.base()
+        assert type(base) is AlertArea
+        assert base == AlertArea(id=area.id, name=area.name)
+        assert serialize(base, AlertArea) == serialize(
+            AlertArea.model_validate(area.model_dump()),
+            AlertArea,
+        )
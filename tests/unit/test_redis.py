@@ -0,0 +1,56 @@
+"""Redis utilities tests."""
+
+from __future__ import annotations
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from vremenar.database.redis import MeasuredConnectionPool, database, database_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("redis://localhost", f"redis://localhost/{database}"),
+        ("redis://localhost/", f"redis://localhost/{database}"),
+        ("redis://localhost:6380/5", f"redis://localhost:6380/{database}"),
+        (
+            "rediss://:secret@example.com:6380?ssl_cert_reqs=none&db=5",
+            f"rediss://:secret@example.com:6380/{database}?ssl_cert_reqs=none",
+        ),
+        ("unix:///run/redis.sock", f"unix:///run/redis.sock?db={database}"),
+        (
+            "unix:///run/redis.sock?db=5&password=secret",
+            f"unix:///run/redis.sock?password=secret&db={database}",
+        ),
+    ],
+)
+def test_database_url(url: str, expected: str) -> None:
+    """Test that the configured database is set in connection URLs."""
+    assert database_url(url) == expected
+
+
+@pytest.mark.asyncio
+async def test_pool_exhausted() -> None:
+    """Test that only pool timeouts count as exhausted."""
+    pool = MeasuredConnectionPool.from_url(
+        database_url("redis://localhost"),
+        max_connections=1,
+        timeout=0.01,
+    )
+    connection = await pool.get_connection()
+    with pytest.raises(RedisConnectionError):
+        await pool.get_connection()
+    await pool.release(connection)
+    await pool.disconnect()
+    assert pool.exhausted == 1
+
+    unreachable = MeasuredConnectionPool(
+        host="localhost",
+        port=1,
+        socket_connect_timeout=0.1,
+    )
+    with pytest.raises(RedisConnectionError):
+        await unreachable.get_connection()
+    assert unreachable.exhausted == 0
+    assert unreachable.waits == 1
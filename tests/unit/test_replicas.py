@@ -0,0 +1,177 @@
+"""Redis read replicas tests."""
+
+from __future__ import annotations
+
+from asyncio import Event, sleep, wait_for
+from math import inf
+
+import pytest
+from redis.asyncio import Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import RedisError
+
+from vremenar.database import replicas as replicas_module
+from vremenar.database.redis import database, redis
+from vremenar.database.replicas import (
+    REDIS_REPLICA_MAX_LAG,
+    Replica,
+    ReplicaRouter,
+    replication_lag,
+)
+
+REPLICA_PORT = 6380
+
+
+def unreachable_replica() -> Replica:
+    """Replica that refuses connections."""
+    client: Redis[str] = Redis(
+        host="localhost",
+        port=1,
+        socket_connect_timeout=0.1,
+        retry=Retry(NoBackoff(), 0),
+        decode_responses=True,
+    )
+    return Replica(client, "unreachable")
+
+
+def test_replication_lag() -> None:
+    """Test replication lag parsing."""
+    assert replication_lag({"role": "master"}, 100) == 0
+    assert replication_lag({"role": "slave", "master_link_status": "down"}, 100) == inf
+    assert replication_lag({"role": "slave", "master_link_status": "up"}, 100) == inf
+    assert (
+        replication_lag(
+            {
+                "role": "slave",
+                "master_link_status": "up",
+                "slave_repl_offset": 70,
+            },
+            100,
+        )
+        == 30
+    )
+
+
+@pytest.mark.asyncio
+async def test_replica_read() -> None:
+    """Test reads are routed to replicas in turn."""
+    first = Replica(redis, "first")
+    second = Replica(redis, "second")
+    for replica in (first, second):
+        replica.lag = 0
+    router = ReplicaRouter(redis, [first, second])
+
+    for _ in range(4):
+        assert await router.read(lambda client: client.ping())
+
+    assert first.reads == 2
+    assert second.reads == 2
+    assert first.stats()["available"]
+    assert first.stats()["lag"] == 0
+
+
+@pytest.mark.asyncio
+async def test_replica_unreachable() -> None:
+    """Test reads fall back to the primary when a replica is unreachable."""
+    replica = unreachable_replica()
+    router = ReplicaRouter(redis, [replica])
+    await router.refresh()
+
+    assert await router.read(lambda client: client.ping())
+    assert not replica.available
+    assert replica.reads == 0
+    assert replica.stats()["lag"] is None
+
+
+@pytest.mark.asyncio
+async def test_replica_failure() -> None:
+    """Test reads fall back to the primary when a replica fails."""
+    replica = unreachable_replica()
+    replica.lag = 0
+    router = ReplicaRouter(redis, [replica])
+
+    assert await router.read(lambda client: client.ping())
+    assert replica.failures == 1
+    assert not replica.available
+
+
+@pytest.mark.asyncio
+async def test_replica_lagging() -> None:
+    """Test reads skip lagging replicas."""
+    replica = Replica(redis, "lagging")
+    replica.lag = inf
+    router = ReplicaRouter(redis, [replica])
+
+    assert await router.read(lambda client: client.ping())
+    assert replica.reads == 0
+
+
+@pytest.mark.asyncio
+async def test_replica_refresh_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test replicas are refreshed again after an unexpected error."""
+    replica = Replica(redis, "replica")
+    replica.lag = 0
+    router = ReplicaRouter(redis, [replica])
+    retried = Event()
+    calls = 0
+
+    async def refresh() -> None:
+        nonlocal calls
+        await sleep(0)
+        calls += 1
+        if calls > 1:
+            retried.set()
+        message = "invalid replication offset"
+        raise ValueError(message)
+
+    monkeypatch.setattr(router, "refresh", refresh)
+    monkeypatch.setattr(replicas_module, "REDIS_REPLICA_CHECK_INTERVAL", 0)
+
+    router.start()
+    await wait_for(retried.wait(), 5)
+    await router.stop()
+    assert not replica.available
+
+
+@pytest.mark.asyncio
+async def test_replica_server() -> None:
+    """Test reads from a real replica of the primary."""
+    client: Redis[str] = Redis(
+        host="localhost",
+        port=REPLICA_PORT,
+        db=database,
+        socket_connect_timeout=0.1,
+        retry=Retry(NoBackoff(), 0),
+        decode_responses=True,
+    )
+    try:
+        info = await client.info("replication")
+    except RedisError:
+        await client.aclose()  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+        pytest.skip("Redis replica is not running")
+
+    replica = Replica(client, f"localhost:{REPLICA_PORT}")
+    router = ReplicaRouter(redis, [replica])
+    try:
+        assert info["role"] == "slave"
+        await redis.set("test:replica", "value")
+        await redis.wait(1, 5000)
+
+        # replication status is refreshed in the background
+        assert not router.candidates()
+        router.start()
+        for _ in range(100):
+            if replica.available:
+                break
+            await sleep(0.01)
+        assert router.candidates() == [replica]
+        assert replica.lag is not None
+        assert replica.lag <= REDIS_REPLICA_MAX_LAG
+
+        assert await router.read(lambda client: client.get("test:replica")) == "value"
+        assert replica.reads == 1
+    finally:
+        await router.stop()
+        await redis.delete("test:replica")
+        await client.aclose()  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
@@ -0,0 +1,109 @@
+"""Redis Lua scripts tests."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from operator import itemgetter
+from typing import Any
+
+import pytest
+
+from vremenar.definitions import CountryID, LanguageID
+from vremenar.sources.arso import utils as arso
+from vremenar.sources.dwd import utils as dwd
+from vremenar.sources.meteoalarm.alerts import list_alerts_for_areas
+from vremenar.utils import to_timestamp
+
+
+def project(
+    records: list[dict[str, Any]],
+    fields: tuple[str, ...],
+) -> list[dict[str, Any]]:
+    """Project records to fields and sort them."""
+    return sorted(
+        ({k: v for k, v in record.items() if k in fields} for record in records),
+        key=itemgetter("station_id", "timestamp"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_scripts_mosmix_records() -> None:
+    """Test MOSMIX records script matches the fallback."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    records = await dwd.get_mosmix_records(timestamp, scripts=True)
+    fallback = await dwd.get_mosmix_records(timestamp, scripts=False)
+    assert records
+    assert project(records, dwd.RECORD_FIELDS) == project(fallback, dwd.RECORD_FIELDS)
+
+    assert not await dwd.get_mosmix_records("1", scripts=True)
+
+
+@pytest.mark.asyncio
+async def test_scripts_arso_records() -> None:
+    """Test ARSO records scripts match the fallback."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    records = await arso.get_weather_records_for_timestamp(timestamp, scripts=True)
+    fallback = await arso.get_weather_records_for_timestamp(timestamp, scripts=False)
+    assert records
+    assert project(records, arso.RECORD_FIELDS) == project(
+        fallback,
+        arso.RECORD_FIELDS,
+    )
+
+
+@pytest.mark.asyncio
+async def test_scripts_alerts() -> None:
+    """Test alerts script matches the fallback."""
+    areas = {"DE048", "DE413"}
+
+    alerts = await list_alerts_for_areas(
+        CountryID.Germany,
+        LanguageID.English,
+        areas,
+        scripts=True,
+    )
+    fallback = await list_alerts_for_areas(
+        CountryID.Germany,
+        LanguageID.English,
+        areas,
+        scripts=False,
+    )
+    assert alerts
+    assert sorted(alerts, key=lambda a: a.id) == sorted(fallback, key=lambda a: a.id)
+
+
+@pytest.mark.asyncio
+async def test_scripts_station_records() -> None:
+    """Test station forecast records script matches the fallback."""
+    now = datetime.now(tz=UTC).replace(minute=0, second=0, microsecond=0)
+    timestamp = to_timestamp(now)
+
+    records = await dwd.get_mosmix_records_for_station(
+        "10147",
+        timestamp,
+        scripts=True,
+    )
+    fallback = await dwd.get_mosmix_records_for_station(
+        "10147",
+        timestamp,
+        scripts=False,
+    )
+    assert len(records) == 2
+    assert records == fallback
+
+    records = await arso.get_forecast_records_for_station(
+        "METEO-0038",
+        timestamp,
+        scripts=True,
+    )
+    fallback = await arso.get_forecast_records_for_station(
+        "METEO-0038",
+        timestamp,
+        scripts=False,
+    )
+    assert len(records) == 1
+    assert records == fallback
@@ -0,0 +1,89 @@
+"""Concurrency limits and load shedding tests."""
+
+from __future__ import annotations
+
+from asyncio import create_task, sleep
+from typing import TYPE_CHECKING
+
+import pytest
+
+from vremenar import shedding
+from vremenar.shedding import ConcurrencyLimiter, parse_limits, route_group
+
+if TYPE_CHECKING:
+    from httpx2 import AsyncClient
+
+
+def test_route_groups() -> None:
+    """Test routes are grouped by the longest path prefix."""
+    assert parse_limits(" maps=8, default=32,invalid") == {"maps": 8, "default": 32}
+
+    assert route_group("/version") == "light"
+    assert route_group("/maps/legend/precipitation") == "light"
+    assert route_group("/maps/list/precipitation") == "maps"
+    assert route_group("/stations/map/202101010000") == "maps"
+    assert route_group("/stations/list") == "default"
+    assert route_group("/health/ready") is None
+    assert route_group("/alerts/stream") is None
+
+
+@pytest.mark.asyncio
+async def test_limiter_queue() -> None:
+    """Test queued requests are shed after the queue target."""
+    limiter = ConcurrencyLimiter("test", 1, target=0.01)
+    assert await limiter.acquire()
+
+    # released while queued
+    waiting = create_task(limiter.acquire())
+    await sleep(0)
+    assert limiter.stats()["waiting"] == 1
+    limiter.release()
+    assert await waiting
+    assert limiter.stats()["queued"] == 1
+
+    # not released in time
+    assert not await limiter.acquire()
+    limiter.release()
+
+    stats = limiter.stats()
+    assert stats["active"] == 0
+    assert stats["waiting"] == 0
+    assert stats["queued"] == 2
+    assert stats["shed"] == 1
+    assert stats["delay"] > 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_shed_early() -> None:
+    """Test requests are shed right away while the queue is not draining."""
+    limiter = ConcurrencyLimiter("test", 1, target=0.01)
+    limiter.delay = 1
+    assert await limiter.acquire()
+    assert not await limiter.acquire()
+    assert limiter.stats()["queued"] == 0
+    assert limiter.stats()["shed"] == 1
+
+    # free slots are always used
+    limiter.release()
+    assert await limiter.acquire()
+    limiter.release()
+
+
+@pytest.mark.asyncio
+async def test_shedding_request(
+    client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test saturated route groups shed requests while others are served."""
+    limiter = ConcurrencyLimiter("default", 1, target=0.01)
+    limiter.delay = 1
+    assert await limiter.acquire()
+    monkeypatch.setitem(shedding.limiters, "default", limiter)
+
+    response = await client.get("/stations/list?country=si")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json() == {"detail": "Server is overloaded"}
+
+    response = await client.get("/version")
+    assert response.status_code == 200
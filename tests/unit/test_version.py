@@ -0,0 +1,74 @@
+"""Version cache tests."""
+
+from __future__ import annotations
+
+from json import dumps, loads
+from os import utime
+from typing import TYPE_CHECKING
+
+import pytest
+from anyio import Path as AsyncPath
+
+from vremenar import __version__
+from vremenar.api.version import VersionCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.asyncio
+async def test_version_cache(tmp_path: Path) -> None:
+    """Test version cache reloading."""
+    path = tmp_path / "version.json"
+    cache = VersionCache(AsyncPath(path), interval=0)
+
+    data = loads(await cache.get())
+    assert data == {"stable": "", "beta": "", "server": __version__}
+
+    path.write_text(dumps({"stable": "1.0.0", "beta": "2.0.0"}))
+    utime(path, (1, 1))
+    data = loads(await cache.get())
+    assert data["stable"] == "1.0.0"
+    assert data["beta"] == "2.0.0"
+
+    # unchanged modification time keeps the cached content
+    path.write_text(dumps({"stable": "3.0.0"}))
+    utime(path, (1, 1))
+    assert loads(await cache.get())["stable"] == "1.0.0"
+
+    utime(path, (2, 2))
+    assert loads(await cache.get())["stable"] == "3.0.0"
+
+    path.unlink()
+    assert not loads(await cache.get())["stable"]
+
+
+@pytest.mark.asyncio
+async def test_version_cache_interval(tmp_path: Path) -> None:
+    """Test version cache check interval."""
+    path = tmp_path / "version.json"
+    cache = VersionCache(AsyncPath(path), interval=3600)
+
+    assert not loads(await cache.get())["stable"]
+
+    path.write_text(dumps({"stable": "1.0.0"}))
+    assert not loads(await cache.get())["stable"]
+
+
+@pytest.mark.asyncio
+async def test_version_cache_partial(tmp_path: Path) -> None:
+    """Test that a partially written version file is read again."""
+    path = tmp_path / "version.json"
+    cache = VersionCache(AsyncPath(path), interval=0)
+
+    path.write_text(dumps({"stable": "1.0.0"}))
+    utime(path, (1, 1))
+    assert loads(await cache.get())["stable"] == "1.0.0"
+
+    path.write_text('{"stable": "2.')
+    utime(path, (2, 2))
+    assert loads(await cache.get())["stable"] == "1.0.0"
+
+    path.write_text(dumps({"stable": "2.0.0"}))
+    utime(path, (2, 2))
+    assert loads(await cache.get())["stable"] == "2.0.0"
@@ -0,0 +1,73 @@
+"""Map viewport tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from vremenar.database.stations import StationClusters, StationGrid
+from vremenar.exceptions import InvalidSearchQueryException
+from vremenar.models.common import Coordinate
+from vremenar.models.stations import StationInfoExtended
+from vremenar.viewport import BoundingBox, Viewport
+
+
+def test_station_grid() -> None:
+    """Test grid index queries."""
+    snapshot = {
+        station_id: StationInfoExtended(
+            id=station_id,
+            name=station_id,
+            coordinate=Coordinate(latitude=latitude, longitude=longitude),
+            zoom_level=zoom_level,
+        )
+        for station_id, latitude, longitude, zoom_level in (
+            ("a", 46.1, 14.1, 7),
+            ("b", 46.4, 14.6, 9),
+            ("c", 48.1, 11.6, None),
+        )
+    }
+    grid = StationGrid(snapshot)
+    assert len(grid.cells) == 3
+
+    assert {s.id for s in grid.query(46, 14, 46.2, 14.2)} == {"a"}
+    assert {s.id for s in grid.query(46, 14, 46.9, 14.9)} == {"a", "b"}
+    assert {s.id for s in grid.query(-90, -180, 90, 180)} == {"a", "b", "c"}
+    assert not grid.query(0, 0, 1, 1)
+
+    viewport = Viewport(BoundingBox(46, 14, 47, 15), 8)
+    assert [s.id for s in snapshot.values() if viewport.includes(s)] == ["a"]
+    viewport = Viewport(zoom=8)
+    assert [s.id for s in snapshot.values() if viewport.includes(s)] == ["a", "c"]
+
+    assert Viewport.from_query(None, None) is None
+    assert BoundingBox.parse("46,14,47,15") == BoundingBox(46, 14, 47, 15)
+
+
+def test_station_clusters() -> None:
+    """Test representative stations per zoom level."""
+    snapshot = {
+        station_id: StationInfoExtended(
+            id=station_id,
+            name=station_id,
+            coordinate=Coordinate(latitude=latitude, longitude=longitude),
+            zoom_level=zoom_level,
+        )
+        for station_id, latitude, longitude, zoom_level in (
+            ("a", 53.63, 10.0, 7.5),
+            ("b", 53.6, 9.82, 8.5),
+            ("c", 48.1, 11.6, None),
+        )
+    }
+    clusters = StationClusters(snapshot)
+    assert clusters.representatives(0, snapshot) == {"c"}
+    assert clusters.representatives(5.5, snapshot) == {"a", "c"}
+    assert clusters.representatives(12, snapshot) == {"a", "b", "c"}
+    assert clusters.representatives(20, snapshot) == {"a", "b", "c"}
+
+    # cells are represented by the shown stations
+    assert clusters.representatives(0, {"a", "b"}) == {"a"}
+    assert clusters.representatives(5.5, {"b", "unknown"}) == {"b"}
+    assert not clusters.representatives(0, set())
+
+    with pytest.raises(InvalidSearchQueryException):
+        Viewport(cluster=True)